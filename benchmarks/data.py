@@ -0,0 +1,111 @@
+"""Module benchmarks.data.py
+
+This module contains the functions generating the synthetic payloads, templates and reports of the benchmarks
+"""
+
+from typing import (
+    Any,
+    Dict,
+    List
+)
+
+from compliance_suite.functions.report import (
+    Report,
+    ReportUtility
+)
+
+
+def create_task(index: int) -> Dict[str, Any]:
+    """Create a TES task in FULL view, named and tagged as the synthetic tasks of the mock server
+
+    Args:
+        index (int): The task number
+
+    Returns:
+        (Dict[str, Any]): The task with inputs, outputs, resources, executors and logs
+    """
+
+    return {
+        "id": f"task-{index:06d}",
+        "state": "COMPLETE",
+        "name": f"MockTask-{index}",
+        "description": "Benchmark task " * 4,
+        "inputs": [{"url": f"s3://bucket/input-{index}-{file}", "path": f"/data/input-{file}", "type": "FILE"}
+                   for file in range(3)],
+        "outputs": [{"url": f"s3://bucket/output-{index}", "path": "/data/output", "type": "FILE"}],
+        "resources": {"cpu_cores": 4, "preemptible": False, "ram_gb": 8.0, "disk_gb": 40.0, "zones": ["eu-west-1"]},
+        "executors": [{"image": "alpine", "command": ["sh", "-c", f"echo {index} && sleep 1"], "workdir": "/data",
+                       "env": {"INDEX": str(index)}}],
+        "volumes": ["/vol/A/"],
+        "tags": {"mock": "true", "index": str(index)},
+        "logs": [{"logs": [{"start_time": "2023-01-01T00:00:00Z", "end_time": "2023-01-01T00:00:01Z",
+                            "stdout": "hello", "stderr": "", "exit_code": 0}],
+                  "metadata": {"host": "node-1"}, "start_time": "2023-01-01T00:00:00Z",
+                  "end_time": "2023-01-01T00:00:01Z",
+                  "outputs": [{"url": f"s3://bucket/output-{index}", "path": "/data/output", "size_bytes": "1024"}],
+                  "system_logs": ["scheduled", "completed"]}],
+        "creation_time": "2023-01-01T00:00:00Z"
+    }
+
+
+def create_list_tasks_payload(count: int) -> Dict[str, Any]:
+    """Create a list tasks response in FULL view
+
+    Args:
+        count (int): The number of tasks
+
+    Returns:
+        (Dict[str, Any]): The list tasks response
+    """
+
+    return {"tasks": [create_task(index) for index in range(count)], "next_page_token": "token"}
+
+
+def create_template(job_count: int) -> List[Dict[str, Any]]:
+    """Create a large template whose jobs refer to the template arguments
+
+    Args:
+        job_count (int): The number of jobs
+
+    Returns:
+        (List[Dict[str, Any]]): The template jobs
+    """
+
+    return [{
+        "name": "create_task",
+        "description": f"Create task {index}",
+        "endpoint": "/tasks",
+        "operation": "POST",
+        "query_parameters": [{"view": "{view_value}"}, {"name_prefix": "{name_prefix}"}],
+        "request_body": "{request_body}",
+        "storage_vars": {f"id_{index}": "$response.id"},
+        "filter": [{"path": "$response.tasks[0].name", "type": "string", "value": "{name_prefix}", "regex": True}],
+        "response": {"200": {}}
+    } for index in range(job_count)]
+
+
+def create_report(case_count: int, cases_per_test: int = 10, tests_per_phase: int = 10) -> Report:
+    """Create a report of passed cases
+
+    Args:
+        case_count (int): The total number of cases
+        cases_per_test (int): The number of cases of each test
+        tests_per_phase (int): The number of tests of each phase
+
+    Returns:
+        (Report): The report
+    """
+
+    report = Report()
+    report.set_platform_details("http://localhost/")
+    phase = test = None
+    for index in range(case_count):
+        if index % (cases_per_test * tests_per_phase) == 0:
+            phase = report.add_phase(f"tests/test_{index}.yml", "Benchmark test file")
+        if index % cases_per_test == 0:
+            test = phase.add_test()
+            ReportUtility.set_test(test, f"job_{index}", "Benchmark job")
+        case = test.add_case()
+        ReportUtility.set_case(case, "status_code", "Check if response status code is 200")
+        ReportUtility.case_pass(case, "Successful Response status code", "No logs for success")
+    return report
@@ -0,0 +1,230 @@
+"""Module benchmarks.hot_paths.py
+
+This module contains the benchmarks of the runner's hot paths. A benchmark is a setup function returning the callable
+which is timed, so that the synthetic data is created once and not timed
+"""
+
+import io
+import json
+import os
+from pathlib import Path
+import shutil
+import subprocess
+import sys
+import tempfile
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List
+)
+
+from benchmarks.data import (
+    create_list_tasks_payload,
+    create_report,
+    create_template
+)
+from compliance_suite.constants.constants import TEST
+from compliance_suite.functions.model_registry import model_registry
+from compliance_suite.functions.session_pool import SessionPool
+from compliance_suite.job_runner import JobRunner
+from compliance_suite.mock_server import MockServer
+from compliance_suite.report_server import ReportServer
+from compliance_suite.test_runner import TestRunner
+from compliance_suite.utils.test_utils import (
+    instantiate_template,
+    replace_string
+)
+from ga4gh.testbed.report.test import Test
+from requests.models import Response
+
+REPOSITORY_DIR = Path(__file__).resolve().parents[1]
+VERSION = "1.1.0"
+LIST_TASKS_COUNT = 500          # Tasks of the big list tasks FULL payload
+TEMPLATE_JOB_COUNT = 2000       # Jobs of the large template
+REPORT_CASE_COUNT = 10000       # Cases of the generated report
+
+BENCHMARKS: Dict[str, Callable[[], Callable[[], Any]]] = {}     # Benchmark name -> setup function
+TEARDOWNS: List[Callable[[], None]] = []                        # Cleanups of the setups, eg. stopping the mock server
+
+
+def benchmark(name: str) -> Callable:
+    """Register a benchmark setup function
+
+    Args:
+        name (str): The benchmark name under which its baseline is recorded
+
+    Returns:
+        (Callable): The decorator registering the setup function
+    """
+
+    def register(setup: Callable[[], Callable[[], Any]]) -> Callable[[], Callable[[], Any]]:
+        BENCHMARKS[name] = setup
+        return setup
+
+    return register
+
+
+def create_test_runner(job_data: Dict[str, Any], server: str = "http://127.0.0.1/") -> TestRunner:
+    """Create a Test Runner with a new report test for a job
+
+    Args:
+        job_data (Dict[str, Any]): The sub-job
+        server (str): The server URL
+
+    Returns:
+        (TestRunner): The Test Runner
+    """
+
+    test_runner = TestRunner("TES", server, VERSION)
+    test_runner.set_job_data(job_data)
+    test_runner.set_report_test(Test())
+    return test_runner
+
+
+def create_list_tasks_job() -> Dict[str, Any]:
+    """Create the list tasks FULL job with its filters and storage variables
+
+    Returns:
+        (Dict[str, Any]): The sub-job
+    """
+
+    return {
+        "name": "list_tasks",
+        "description": "Retrieve the FULL view of the tasks",
+        "endpoint": "/tasks",
+        "operation": "GET",
+        "query_parameters": [{"view": "FULL"}, {"page_size": LIST_TASKS_COUNT}],
+        "filter": [
+            {"path": "$response.tasks", "type": "array", "size": LIST_TASKS_COUNT},
+            {"path": f"$response.tasks[{LIST_TASKS_COUNT - 1}].name", "type": "string", "value": "^MockTask-",
+             "regex": True},
+            {"path": "$response.tasks[0].tags", "type": "object", "value": '{"mock": "true"}'}
+        ],
+        "storage_vars": {"first_id": "$response.tasks[0].id", "last_id": f"$response.tasks[{LIST_TASKS_COUNT - 1}].id",
+                         "token": "$response.next_page_token"},
+        "response": {"200": {}}
+    }
+
+
+@benchmark("load_and_validate_yaml_data")
+def setup_load_yaml() -> Callable[[], Any]:
+    job_runner = JobRunner("http://127.0.0.1/", VERSION)
+    yaml_files: List[str] = sorted(str(yaml_file) for yaml_file in (REPOSITORY_DIR / "tests").glob("*.yml"))
+
+    def run() -> None:
+        for yaml_file in yaml_files:
+            job_runner.load_and_validate_yaml_data(yaml_file, TEST)
+
+    return run
+
+
+@benchmark("replace_string")
+def setup_replace_string() -> Callable[[], Any]:
+    data: List[Dict[str, Any]] = create_template(TEMPLATE_JOB_COUNT)
+
+    def run() -> None:
+        # The data is replaced in place, so that the later calls traverse it without any match
+        for search_str, replace_str in [("{view_value}", "FULL"), ("{name_prefix}", "CompTest"),
+                                        ("{request_body}", "{}")]:
+            replace_string(data, search_str, replace_str)
+
+    return run
+
+
+@benchmark("instantiate_template")
+def setup_instantiate_template() -> Callable[[], Any]:
+    template: List[Dict[str, Any]] = create_template(TEMPLATE_JOB_COUNT)
+    args: Dict[str, str] = {"view_value": "FULL", "name_prefix": "CompTest", "request_body": "{}"}
+
+    return lambda: instantiate_template(template, args)
+
+
+@benchmark("validate_logic_list_tasks_full")
+def setup_validate_logic() -> Callable[[], Any]:
+    model_registry.load(VERSION)
+    payload: Dict[str, Any] = create_list_tasks_payload(LIST_TASKS_COUNT)
+    job_data: Dict[str, Any] = create_list_tasks_job()
+
+    return lambda: create_test_runner(job_data).validate_logic("list_tasks_FULL", payload, "Response")
+
+
+@benchmark("validate_streamed_list_tasks_full")
+def setup_validate_streamed() -> Callable[[], Any]:
+    model_registry.load(VERSION)
+    body: bytes = json.dumps(create_list_tasks_payload(LIST_TASKS_COUNT)).encode()
+    job_data: Dict[str, Any] = create_list_tasks_job()
+
+    def run() -> None:
+        test_runner = create_test_runner(job_data)
+        response = Response()
+        response.status_code = 200
+        response.raw = io.BytesIO(body)
+        test_runner.validate_streamed_response(response, "list_tasks_FULL")
+
+    return run
+
+
+@benchmark("validate_filters_and_storage_vars")
+def setup_validate_filters() -> Callable[[], Any]:
+    payload: Dict[str, Any] = create_list_tasks_payload(LIST_TASKS_COUNT)
+    job_data: Dict[str, Any] = create_list_tasks_job()
+
+    def run() -> None:
+        for _ in range(100):
+            test_runner = create_test_runner(job_data)
+            test_runner.validate_filters(payload)
+            test_runner.save_storage_vars(payload)
+
+    return run
+
+
+@benchmark("report_generate_10k_cases")
+def setup_report_generate() -> Callable[[], Any]:
+    return create_report(REPORT_CASE_COUNT).generate
+
+
+@benchmark("render_html")
+def setup_render_html() -> Callable[[], Any]:
+    web_dir: str = tempfile.mkdtemp()
+    TEARDOWNS.append(lambda: shutil.rmtree(web_dir, ignore_errors=True))
+    shutil.copytree(REPOSITORY_DIR / "compliance_suite" / "web", web_dir, dirs_exist_ok=True)
+    with open(os.path.join(web_dir, "web_report.json"), "w") as output:
+        output.write(create_report(REPORT_CASE_COUNT // 10).generate())
+    report_server = ReportServer(web_dir)
+
+    return report_server.render_html
+
+
+@benchmark("run_tests_list_tasks_full")
+def setup_run_tests() -> Callable[[], Any]:
+    model_registry.load(VERSION)
+    mock_server = MockServer(VERSION)
+    mock_server.set_task_count(LIST_TASKS_COUNT)
+    mock_server.start(0)
+    TEARDOWNS.append(mock_server.stop)
+    session_pool = SessionPool(1)
+    TEARDOWNS.append(session_pool.close)
+    job_data: Dict[str, Any] = create_list_tasks_job()
+
+    def run() -> None:
+        test_runner = create_test_runner(job_data, f"http://127.0.0.1:{mock_server.local_server.server_address[1]}/")
+        test_runner.set_session_pool(session_pool)
+        test_runner.run_tests(json.loads(json.dumps(job_data)), Test())
+
+    return run
+
+
+@benchmark("cli_help")
+def setup_cli_help() -> Callable[[], Any]:
+    command: List[str] = [sys.executable, "-m", "compliance_suite.cli", "--help"]
+
+    # The interpreter startup is timed as well, as it is paid by each invocation of the CLI
+    return lambda: subprocess.run(command, cwd=REPOSITORY_DIR, stdout=subprocess.DEVNULL, check=True)
+
+
+def teardown() -> None:
+    """Run and clear the cleanups of the setups"""
+
+    while TEARDOWNS:
+        TEARDOWNS.pop()()
@@ -0,0 +1,158 @@
+"""Module benchmarks.run_benchmarks.py
+
+This module contains the command timing the runner's hot paths and comparing them with the recorded baselines. The
+timings are divided by the time of a fixed pure Python calibration loop, so that the baselines recorded on one machine
+can be compared on another one
+"""
+
+import gc
+import json
+import logging
+import math
+from pathlib import Path
+import statistics
+import sys
+import time
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List
+)
+
+import click
+
+from benchmarks.hot_paths import (
+    BENCHMARKS,
+    teardown
+)
+from compliance_suite.functions.log import logger
+
+BASELINES_FILE = Path(__file__).resolve().parent / "baselines.json"
+CALIBRATION_LOOPS = 200000
+BASELINE_ROUNDS = 3     # Runs of the benchmarks whose median is recorded as the baseline
+MIN_CALL_SECONDS = 0.2  # Minimum duration of a timed call, reached by running the short benchmarks several times
+
+
+def calibrate() -> float:
+    """Time the calibration loop of dictionary, list and string operations similar to the hot paths
+
+    Returns:
+        (float): The seconds of the calibration loop
+    """
+
+    def run() -> None:
+        data: Dict[str, Any] = {}
+        for index in range(CALIBRATION_LOOPS):
+            key: str = f"key-{index % 100}"
+            data[key] = [index, key.upper()]
+            if key.startswith("{") or len(data[key]) > 2:
+                data.pop(key)
+
+    return time_function(run, 9)
+
+
+def time_function(function: Callable[[], Any], repeat: int) -> float:
+    """Time a function after a warm-up call. Each timed call runs the function as many times as fit in
+    MIN_CALL_SECONDS, so that the short benchmarks are not dominated by the timer and scheduler noise, and the median
+    of the timed calls is kept, so that a single slow or fast call does not move the result
+
+    Args:
+        function (Callable[[], Any]): The timed function
+        repeat (int): The number of timed calls
+
+    Returns:
+        (float): The median seconds of one run of the function
+    """
+
+    gc.collect()
+    start_time: float = time.perf_counter()
+    function()
+    loops: int = max(1, math.ceil(MIN_CALL_SECONDS / max(time.perf_counter() - start_time, 1e-9)))
+    timings: List[float] = []
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        for _ in range(loops):
+            function()
+        timings.append((time.perf_counter() - start_time) / loops)
+    return statistics.median(timings)
+
+
+def run_benchmarks(names: List[str], repeat: int) -> Dict[str, float]:
+    """Run the selected benchmarks and normalize their timings by the calibration loop. The machine is calibrated
+    right before each benchmark, so that a drift in the speed of the machine during the run, eg. a noisy neighbour on
+    a shared runner, affects the benchmark and its calibration alike
+
+    Args:
+        names (List[str]): The benchmark names
+        repeat (int): The number of timed calls of each benchmark
+
+    Returns:
+        (Dict[str, float]): The seconds of each benchmark divided by the seconds of the calibration loop
+    """
+
+    results: Dict[str, float] = {}
+    try:
+        for name in names:
+            function: Callable[[], Any] = BENCHMARKS[name]()
+            calibration: float = calibrate()
+            results[name] = time_function(function, repeat) / calibration
+    finally:
+        teardown()
+    return results
+
+
+@click.command(help='Benchmark the hot paths of the runner against the recorded baselines')
+@click.option('--name', '-n', 'names', multiple=True, help='benchmark to run. All benchmarks are run if not provided')
+@click.option('--repeat', default=7, show_default=True, help='number of timed calls of each benchmark')
+@click.option('--threshold', default=1.5, show_default=True,
+              help='slowdown factor relative to the baseline above which a benchmark fails')
+@click.option('--update-baselines', is_flag=True, default=False, help='record the timings as the new baselines')
+def main(names: List[str], repeat: int, threshold: float, update_baselines: bool) -> None:
+    """Time the hot paths and compare them with the baselines. Exits with status 1 if a benchmark regressed
+
+    Args:
+        names (List[str]): The benchmarks to run
+        repeat (int): The number of timed calls of each benchmark
+        threshold (float): The slowdown factor above which a benchmark fails
+        update_baselines (bool): If True, the timings are recorded as the baselines instead of being compared
+    """
+
+    logger.setLevel(logging.WARNING)
+    unknown: List[str] = [name for name in names if name not in BENCHMARKS]
+    if unknown:
+        raise click.BadParameter(f"Unknown benchmarks {', '.join(unknown)}", param_hint="--name")
+
+    selected: List[str] = list(names) or list(BENCHMARKS)
+    baselines: Dict[str, float] = json.loads(BASELINES_FILE.read_text()) if BASELINES_FILE.exists() else {}
+
+    if update_baselines:
+        rounds: List[Dict[str, float]] = [run_benchmarks(selected, repeat) for _ in range(BASELINE_ROUNDS)]
+        for name in selected:
+            baselines[name] = statistics.median(result[name] for result in rounds)
+            click.echo(f"{name:40} {baselines[name]:10.3f}  recorded")
+        BASELINES_FILE.write_text(json.dumps(dict(sorted(baselines.items())), indent=4) + "\n")
+        return
+
+    results: Dict[str, float] = run_benchmarks(selected, repeat)
+    regressions: List[str] = []
+    for name in selected:
+        if name not in baselines:
+            click.echo(f"{name:40} {results[name]:10.3f}  no baseline")
+            continue
+        ratio: float = results[name] / baselines[name]
+        if ratio > threshold:
+            # A regression is confirmed by timing the benchmark again, to rule out a noisy neighbour
+            ratio = min(ratio, run_benchmarks([name], repeat)[name] / baselines[name])
+        status: str = "REGRESSED" if ratio > threshold else "ok"
+        if ratio > threshold:
+            regressions.append(name)
+        click.echo(f"{name:40} {results[name]:10.3f}  {ratio:5.2f}x baseline  {status}")
+
+    if regressions:
+        click.echo(f"{len(regressions)} benchmarks regressed more than {threshold}x: {', '.join(regressions)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,7 @@
 This module is the entry point for the compliance suite and contains a CLI functionality
 """
 
+import json
 import os
 from pathlib import Path
 import re
@@ -13,9 +14,14 @@ from typing import (
 
 import click
 
-from compliance_suite.functions.log import logger
-from compliance_suite.job_runner import JobRunner
-from compliance_suite.report_server import ReportServer
+from compliance_suite.constants.constants import (
+    MOCK_SERVER_PORT,
+    RESULT_CACHE_TTL,
+    TEST_PLAN_FILE
+)
+
+# The runners and servers are imported by the commands using them, so that the CLI starts without loading the HTTP,
+# schema validation and templating libraries, eg. for --help or an invalid argument
 
 
 @click.group()
@@ -58,6 +64,40 @@ def validate_regex(ctx: Any, param: Any, value: List[str]):
 @click.option('--serve', default=False, is_flag=True, help='spin up a server')
 @click.option('--port', default=15800, help='port at which the compliance report is served')
 @click.option('--uptime', '-u', default=3600, help='time that server will remain up in seconds')
+@click.option('--workers', '-w', default=1, type=click.IntRange(min=1),
+              help='number of YAML test files run in parallel')
+@click.option('--async', 'use_async', default=False, is_flag=True,
+              help='run the test files as coroutines on a single event loop')
+@click.option('--job-concurrency', 'job_concurrency', type=click.IntRange(min=1), default=1,
+              help='number of independent sub-jobs of a test file run concurrently')
+@click.option('--stream-responses', 'stream_responses', default=False, is_flag=True,
+              help='stream the list tasks responses and validate their tasks one by one as they are read')
+@click.option('--pool-size', 'pool_size', default=10, type=click.IntRange(min=1),
+              help='number of keep-alive connections pooled per server')
+@click.option('--batch-polling', 'batch_polling', default=False, is_flag=True,
+              help='poll the task states in batches via a central scheduler')
+@click.option('--batch-polling-prefix', 'batch_polling_prefix', default="",
+              help='task name prefix of the batched list tasks requests, required for listing')
+@click.option('--polling-history', 'polling_history', default=None,
+              help='path of the file storing the task completion times for the adaptive polling strategy')
+@click.option('--profile', 'profile', is_flag=True, default=False,
+              help='report the time and memory spent in the test file processing stages')
+@click.option('--profile-output', 'profile_output', default="",
+              help='directory to which the cProfile statistics and the collapsed stage stacks are written')
+@click.option('--stream-report', 'stream_report', default="",
+              help='path of the NDJSON file to which the finished test files are streamed')
+@click.option('--checkpoint', 'checkpoint', default=None,
+              help='path of the journal in which the finished test files are recorded')
+@click.option('--resume', 'resume', default=None,
+              help='path of the journal of an interrupted run. Its finished test files are not run again')
+@click.option('--reuse-passed', 'reuse_passed', is_flag=True, default=False,
+              help='reuse the cached result of the unchanged test files which passed recently')
+@click.option('--result-cache-ttl', 'result_cache_ttl', type=click.FloatRange(min=0), default=RESULT_CACHE_TTL,
+              help='seconds after which a cached passed result is not reused')
+@click.option('--metrics-port', 'metrics_port', type=click.IntRange(min=0), default=0,
+              help='port at which the live run metrics are served in the Prometheus format')
+@click.option('--plan', 'plan', default=None,
+              help='path of the test plan written by the compile command, run instead of the test path')
 def report(server: str,
            version: str,
            include_tags: List[str],
@@ -66,7 +106,24 @@ def report(server: str,
            output_path: str,
            serve: bool,
            port: int,
-           uptime: int) -> None:
+           uptime: int,
+           workers: int,
+           use_async: bool,
+           job_concurrency: int,
+           stream_responses: bool,
+           pool_size: int,
+           batch_polling: bool,
+           batch_polling_prefix: str,
+           polling_history: str,
+           profile: bool,
+           profile_output: str,
+           stream_report: str,
+           checkpoint: str,
+           resume: str,
+           reuse_passed: bool,
+           result_cache_ttl: float,
+           metrics_port: int,
+           plan: str) -> None:
     """ Program entrypoint called via "report" in CLI.
     Run the compliance suite for the given tags.
 
@@ -81,40 +138,232 @@ def report(server: str,
         serve (bool): If true, runs a local server and displays the JSON report in webview
         port (int): Set the local server port. Default - 16800
         uptime (int): The local server duration in seconds. Default - 3600 seconds
+        workers (int): The number of YAML test files run in parallel. Default - 1
+        use_async (bool): If true, runs the test files via the asynchronous engine
+        job_concurrency (int): The number of independent sub-jobs of a test file run concurrently. Default - 1
+        stream_responses (bool): If true, the list tasks responses are streamed and their tasks validated one by one
+        pool_size (int): The number of keep-alive connections pooled per server. Default - 10
+        batch_polling (bool): If true, the task states are polled in batches via a central scheduler
+        batch_polling_prefix (str): The task name prefix of the batched list tasks requests, required for listing
+        polling_history (str): The path of the file storing the task completion times for the adaptive polling
+            strategy. Default - ~/.cache/openapi-test-runner/polling_history.json
+        profile (bool): If true, reports the time and memory spent in the test file processing stages
+        profile_output (str): The directory to which the cProfile statistics and the collapsed stage stacks are
+            written. Implies profile
+        stream_report (str): The path of the NDJSON file to which the finished test files are streamed. The report
+            is then assembled from the stream file instead of being held in memory
+        checkpoint (str): The path of the journal in which the finished test files are recorded
+        resume (str): The path of the journal of an interrupted run. The finished test files are restored from it
+            and the remaining test files are appended to it
+        reuse_passed (bool): If true, the unchanged test files which passed recently are restored from the result
+            cache instead of being run
+        result_cache_ttl (float): The seconds after which a cached passed result is not reused. Default - 86400
+        metrics_port (int): The port at which the live run metrics are served at /metrics. Not served if 0
+        plan (str): The path of the compiled test plan. If provided, its test files are run instead of the test path
     """
 
-    for path in test_path:
+    for path in test_path if plan is None else []:
         if not Path(path).exists():
             raise FileNotFoundError(f"Test path: {path} not found. Please provide a valid path.")
 
+    from compliance_suite.functions.log import logger
+    from compliance_suite.job_runner import JobRunner
+
     # Convert the tags into lowercase to allow case-insensitive tags
     include_tags = [val.lower() for val in include_tags]
     exclude_tags = [val.lower() for val in exclude_tags]
 
     logger.info(f"Provided server: {server} version: {version}")
     logger.info(f"Provided tags - include: {include_tags} exclude: {exclude_tags}")
-    logger.info(f"Provided test path: {test_path}")
+    logger.info(f"Provided test path: {test_path}" if plan is None else f"Provided test plan: {plan}")
     job_runner = JobRunner(server, version)
     job_runner.set_tags(include_tags, exclude_tags)
     job_runner.set_test_path(test_path)
+    if plan is not None:
+        job_runner.set_plan(plan)
+    job_runner.set_workers(workers)
+    job_runner.set_async(use_async)
+    job_runner.set_job_concurrency(job_concurrency)
+    job_runner.set_stream_responses(stream_responses)
+    job_runner.set_pool_size(pool_size)
+    job_runner.set_batch_polling(batch_polling, batch_polling_prefix)
+    if polling_history is not None:
+        job_runner.set_polling_history(polling_history)
+    job_runner.set_profile(profile, profile_output)
+    job_runner.set_stream_report(stream_report)
+    if resume is not None:
+        job_runner.set_checkpoint(resume, resume=True)
+    elif checkpoint is not None:
+        job_runner.set_checkpoint(checkpoint)
+    job_runner.set_reuse_passed(reuse_passed, result_cache_ttl)
+    job_runner.set_metrics_port(metrics_port)
     job_runner.run_jobs()
 
-    json_report = job_runner.generate_report()
-
-    # Store the report in given output path
+    # Store the report in given output path and a report copy in web dir for local server
+    output_files: List[str] = []
     if output_path is not None:
         logger.info(f"Writing JSON Report on directory {output_path}")
-        with open(os.path.join(output_path, "report.json"), "w+") as output:
-            output.write(json_report)
-
-    # Writing a report copy to web dir for local server
-    with open(os.path.join(os.getcwd(), "compliance_suite", "web", "web_report.json"), "w+") as output:
-        output.write(json_report)
+        output_files.append(os.path.join(output_path, "report.json"))
+    output_files.append(os.path.join(os.getcwd(), "compliance_suite", "web", "web_report.json"))
+    job_runner.write_report(output_files)
 
     if serve is True:
+        from compliance_suite.report_server import ReportServer
+
         report_server = ReportServer(os.path.join(os.getcwd(), "compliance_suite", "web"))
         report_server.serve_thread(port, uptime)
 
 
+@main.command(name='compile', help='Compile the YAML test files into a test plan run via report --plan')
+@click.option('--test-path', '-tp', 'test_path', multiple=True,
+              help='the absolute or relative path of the tests to be compiled', default=["tests"])
+@click.option('--output', '-o', 'output', default=TEST_PLAN_FILE, help='path of the test plan file')
+def compile_plan(test_path: List[str], output: str) -> None:
+    """ Program entrypoint called via "compile" in CLI.
+    Discover, validate and resolve the test files once into a test plan file.
+
+    Args:
+        test_path: The list of absolute or relative paths from the project root of the test file/directory.
+            Default - ["tests"]
+        output (str): The path of the test plan file. Default - plan.bin
+    """
+
+    for path in test_path:
+        if not Path(path).exists():
+            raise FileNotFoundError(f"Test path: {path} not found. Please provide a valid path.")
+
+    from compliance_suite.functions.log import logger
+    from compliance_suite.job_runner import JobRunner
+
+    # The server and version are not used, the version and tags are matched when the plan is run
+    job_runner = JobRunner("", "")
+    job_runner.set_test_path(test_path)
+    plan = job_runner.compile_plan(output)
+    invalid: int = sum(1 for entry in plan.tests if entry["error"] is not None)
+    logger.info(f"Compiled {len(plan.tests)} test files, {invalid} invalid, and {len(plan.templates)} templates "
+                f"into {output}")
+
+
+@main.command(help='Replay the YAML test files as load against a TES server')
+@click.option('--server', '-s', required=True, type=str, prompt="Enter server",
+              help='server URL on which the load is generated. Format - https://<url>/')
+@click.option('--version', '-v', required=True, type=str, prompt="Enter version",
+              help='TES version. Example - "1.0.0"')
+@click.option('--include-tags', '-i', 'include_tags', multiple=True,
+              help='replay tests for provided tags', callback=validate_regex)
+@click.option('--exclude-tags', '-e', 'exclude_tags', multiple=True,
+              help='skip tests for provided tags', callback=validate_regex)
+@click.option('--test-path', '-tp', 'test_path', multiple=True,
+              help='the absolute or relative path of the tests to be replayed', default=["tests"])
+@click.option('--duration', '-d', type=click.FloatRange(min=0), default=60.0,
+              help='seconds during which the load is generated')
+@click.option('--rate', '-r', type=click.FloatRange(min=0), default=0.0,
+              help='test file iterations started per second. The workers loop back to back if 0')
+@click.option('--concurrency', '-c', type=click.IntRange(min=1), default=10,
+              help='maximum number of test file iterations in flight')
+@click.option('--output_path', '-o', help='path to output the JSON load summary')
+def load(server: str,
+         version: str,
+         include_tags: List[str],
+         exclude_tags: List[str],
+         test_path: List[str],
+         duration: float,
+         rate: float,
+         concurrency: int,
+         output_path: str) -> None:
+    """ Program entrypoint called via "load" in CLI.
+    Replay the jobs of the test files for the given tags at a target rate or concurrency.
+
+    Args:
+        server (str): The server URL on which the load is generated. Format - https://<url>/
+        version (str): The TES version of the server. Example - "1.0.0"
+        include_tags (List[str]): The list of the tags for which the test files are replayed.
+        exclude_tags (List[str]): The list of the tags for which the test files are not replayed.
+        test_path: The list of absolute or relative paths from the project root of the test file/directory.
+            Default - ["tests"]
+        duration (float): The seconds during which the load is generated. Default - 60
+        rate (float): The number of test file iterations started per second. If 0, the workers run the iterations
+            back to back. Default - 0
+        concurrency (int): The maximum number of test file iterations in flight. Default - 10
+        output_path (str): The output path to store the JSON load summary
+    """
+
+    for path in test_path:
+        if not Path(path).exists():
+            raise FileNotFoundError(f"Test path: {path} not found. Please provide a valid path.")
+
+    from compliance_suite.functions.log import logger
+    from compliance_suite.load_runner import LoadRunner
+
+    include_tags = [val.lower() for val in include_tags]
+    exclude_tags = [val.lower() for val in exclude_tags]
+
+    logger.info(f"Provided server: {server} version: {version}")
+    load_runner = LoadRunner(server, version)
+    load_runner.set_tags(include_tags, exclude_tags)
+    load_runner.set_test_path(test_path)
+    load_runner.set_duration(duration)
+    load_runner.set_rate(rate)
+    load_runner.set_concurrency(concurrency)
+    summary = load_runner.run()
+    load_runner.generate_summary()
+
+    if output_path is not None:
+        logger.info(f"Writing JSON load summary on directory {output_path}")
+        with open(os.path.join(output_path, "load_report.json"), "w") as output:
+            json.dump(summary, output, indent=4)
+
+
+@main.command(name='mock-server', help='Serve a mock TES server to run the suite without a real backend')
+@click.option('--version', '-v', type=click.Choice(["1.0.0", "1.1.0"]), default="1.1.0",
+              help='TES version which is served')
+@click.option('--port', '-p', type=click.IntRange(min=0), default=MOCK_SERVER_PORT,
+              help='port at which the mock server runs')
+@click.option('--latency', type=click.FloatRange(min=0), default=0.0, help='seconds added before each response')
+@click.option('--queued-seconds', 'queued_seconds', type=click.FloatRange(min=0), default=0.0,
+              help='seconds after which a created task is RUNNING')
+@click.option('--running-seconds', 'running_seconds', type=click.FloatRange(min=0), default=2.0,
+              help='seconds after which a RUNNING task is COMPLETE')
+@click.option('--error-rate', 'error_rate', type=click.FloatRange(min=0, max=1), default=0.0,
+              help='fraction of the requests answered with the error status')
+@click.option('--error-status', 'error_status', type=click.IntRange(min=400, max=599), default=500,
+              help='status code of the injected errors')
+@click.option('--seed', type=int, default=0, help='seed selecting the requests answered with an injected error')
+@click.option('--task-count', 'task_count', type=click.IntRange(min=0), default=0,
+              help='number of synthetic COMPLETE tasks listed by the mock server')
+def mock_server(version: str,
+                port: int,
+                latency: float,
+                queued_seconds: float,
+                running_seconds: float,
+                error_rate: float,
+                error_status: int,
+                seed: int,
+                task_count: int) -> None:
+    """ Program entrypoint called via "mock-server" in CLI.
+    Serve the TES endpoints of a version until the process is interrupted.
+
+    Args:
+        version (str): The TES version which is served. Default - "1.1.0"
+        port (int): The port at which the mock server runs. Default - 8080
+        latency (float): The seconds added before each response. Default - 0
+        queued_seconds (float): The seconds after which a created task is RUNNING. Default - 0
+        running_seconds (float): The seconds after which a RUNNING task is COMPLETE. Default - 2
+        error_rate (float): The fraction of the requests answered with the error status. Default - 0
+        error_status (int): The status code of the injected errors. Default - 500
+        seed (int): The seed selecting the requests answered with an injected error. Default - 0
+        task_count (int): The number of synthetic COMPLETE tasks listed by the mock server. Default - 0
+    """
+
+    from compliance_suite.mock_server import MockServer
+
+    server = MockServer(version)
+    server.set_latency(latency)
+    server.set_state_timings(queued_seconds, running_seconds)
+    server.set_error_injection(error_rate, error_status, seed)
+    server.set_task_count(task_count)
+    server.serve(port)
+
+
 if __name__ == "__main__":
     main()
@@ -27,6 +27,16 @@ ENDPOINT_TO_MODEL = {
     'cancel_task': 'TesCancelTaskResponse'
 }
 
+# 2. Responses validated element by element in the streaming mode. Endpoint model -> array member, endpoint model of the
+# array elements
+
+STREAMED_RESPONSES = {
+    'list_tasks_MINIMAL': ('tasks', 'get_task_MINIMAL'),
+    'list_tasks_BASIC': ('tasks', 'get_task_BASIC'),
+    'list_tasks_FULL': ('tasks', 'get_task_FULL')
+}
+STREAM_CHUNK_SIZE = 65536           # Bytes read at once from a streamed response
+
 REQUEST_HEADERS = {
     'TES': {
         'Accept': 'application/json',
@@ -34,6 +44,47 @@ REQUEST_HEADERS = {
     }
 }
 
+# Polling Constants
+# The task states at which a polling request is successful, depending on if the Cancel status is validated or not
+
+POLLING_CANCEL_STATES = ["CANCELED", "CANCELING"]
+POLLING_FINAL_STATES = ["COMPLETE", "EXECUTOR_ERROR", "SYSTEM_ERROR", "PREEMPTED"]
+
+POLLING_BACKOFF_FACTOR = 2          # Multiplier of the exponential polling interval
+POLLING_MAX_INTERVAL = 60           # Default cap of the polling interval in seconds
+POLLING_MIN_INTERVAL = 0.5          # Shortest wait of the exponential and adaptive polling in seconds
+POLLING_HISTORY_SIZE = 20           # Number of completion times kept per task type for the adaptive polling
+POLLING_HISTORY_FILE = "polling_history.json"
+
+# Load Constants
+
+LOAD_PERCENTILES = [50, 90, 95, 99]     # Latency percentiles reported per endpoint by the load command
+
+# Metrics Constants
+
+METRICS_PREFIX = "openapi_test_runner"
+METRICS_BUCKETS = [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10]     # Request latency buckets in seconds
+
+# Mock Server Constants
+
+MOCK_SERVER_PORT = 8080
+MOCK_PAGE_SIZE = 256                # Default number of tasks of a list tasks page
+MOCK_MAX_PAGE_SIZE = 2048
+MOCK_BACKEND_PARAMETERS = ["VmSize"]    # Backend parameters supported by the mock server
+MOCK_FAILING_COMMAND = "ERROR"          # Program whose executors exit with an error on the mock server
+
+# File Constants
+
+CACHE_DIRECTORY = "~/.cache/openapi-test-runner"
+RESULT_CACHE_DIRECTORY = "results"
+RESULT_CACHE_TTL = 86400            # Seconds after which a cached passing result is not reused
+RESULT_CACHE_SIZE = 1000            # Number of cached passing results kept, the oldest are evicted
+RESULT_CACHE_BYTES = 268435456      # Serialized bytes of the cached passing results kept, the oldest are evicted
+DISCOVERY_INDEX_FILE = "discovery_index.json"
+YAML_BULK_READ_SIZE = 1048576      # Bytes up to which a YAML file is read at once instead of streamed to the parser
+TEST_PLAN_FILE = "plan.bin"
+TEST_PLAN_FORMAT = 1                # Incremented when the test plan layout changes, so that older plans are refused
+
 # String Constants
 
 PATTERN_HASH_CENTERED = "{:#^120}"
@@ -0,0 +1,160 @@
+"""Module compliance_suite.functions.checkpoint.py
+
+This module contains class definition for the checkpoint journal which records the finished test files, so that an
+interrupted run can be resumed without running them again
+"""
+
+import json
+import os
+from typing import (
+    Any,
+    Dict,
+    IO,
+    List,
+    Optional
+)
+
+from ga4gh.testbed.report.case import Case
+from ga4gh.testbed.report.phase import Phase
+from ga4gh.testbed.report.status import Status
+from ga4gh.testbed.report.test import Test
+
+from compliance_suite.exceptions.compliance_exception import JobValidationException
+from compliance_suite.functions.report_writer import serialize
+
+
+def load_component(component: Any, data: Dict[str, Any]) -> Any:
+    """Restore a report component (phase, test or case) from its JSON data. The summaries are not restored, they are
+    calculated again when the report is finalized
+
+    Args:
+        component (Any): The empty report component
+        data (Dict[str, Any]): The JSON data of the report component
+
+    Returns:
+        (Any): The restored report component
+    """
+
+    for key, value in data.items():
+        if key == "summary":
+            continue
+        elif key == "status":
+            component.status = Status(value)
+        elif key == "tests":
+            component.tests = [load_component(Test(), test) for test in value]
+        elif key == "cases":
+            component.cases = [load_component(Case(), case) for case in value]
+        else:
+            setattr(component, key, value)
+    return component
+
+
+class CheckpointJournal():
+    """NDJSON journal of the finished test files. The first line identifies the server and version of the run, each
+    further line records the status and report phases of a finished test file. Every line is flushed to disk once
+    written, so that the journal survives an interrupted run"""
+
+    def __init__(self, journal_file: str, server: str, version: str):
+        """Initialize the Checkpoint Journal object
+
+        Args:
+            journal_file (str): The path of the journal file
+            server (str): The server URL of the run
+            version (str): The version of the run
+        """
+
+        self.journal_file: str = journal_file
+        self.server: str = server
+        self.version: str = version
+        self.completed: Dict[str, Dict[str, Any]] = {}      # Test file -> journal entry of the resumed run
+        self.journal: Optional[IO] = None
+
+    def load(self) -> None:
+        """Load the finished test files of an earlier run. A truncated last line of an interrupted write is ignored
+
+        Raises:
+            (JobValidationException): If the journal was written for another server or version
+        """
+
+        self.completed = {}
+        if not os.path.exists(self.journal_file):
+            return
+
+        with open(self.journal_file, "r") as journal:
+            lines: List[str] = journal.read().splitlines()
+        for line_number, line in enumerate(lines):
+            try:
+                entry: Dict[str, Any] = json.loads(line)
+            except ValueError:
+                continue
+            if line_number == 0:
+                if entry != {"server": self.server, "version": self.version}:
+                    raise JobValidationException(name="Invalid checkpoint journal",
+                                                 message=f"Journal {self.journal_file} was written for another "
+                                                         f"server or version",
+                                                 details=entry)
+                continue
+            self.completed[entry["file"]] = entry
+
+    def open(self, resume: bool) -> None:
+        """Open the journal for writing
+
+        Args:
+            resume (bool): If True, the finished test files are appended to the loaded journal. Otherwise, a new
+                journal is started
+        """
+
+        if resume and os.path.exists(self.journal_file):
+            self.journal = open(self.journal_file, "a")
+            self.journal.write("\n")    # Terminate a truncated last line, empty lines are ignored
+        else:
+            self.journal = open(self.journal_file, "w")
+            self.write_line({"server": self.server, "version": self.version})
+
+    def close(self) -> None:
+        """Close the journal"""
+
+        if self.journal is not None:
+            self.journal.close()
+            self.journal = None
+
+    def write_line(self, entry: Dict[str, Any]) -> None:
+        """Append a line to the journal and flush it to disk
+
+        Args:
+            entry (Dict[str, Any]): The JSON journal entry
+        """
+
+        self.journal.write(json.dumps(entry, default=serialize, separators=(",", ":")) + "\n")
+        self.journal.flush()
+        os.fsync(self.journal.fileno())
+
+    def record(self, yaml_file: str, status: str, phases: List[Any]) -> None:
+        """Record a finished test file. The test files restored from the loaded journal are not recorded again
+
+        Args:
+            yaml_file (str): The path to the YAML test file
+            status (str): The test status key, one of "passed", "failed" or "skipped"
+            phases (List[Any]): The report phases of the test file
+        """
+
+        if self.journal is not None and yaml_file not in self.completed:
+            self.write_line({"file": yaml_file, "status": status, "phases": phases})
+
+    def get_result(self, yaml_file: str) -> Optional[Dict[str, Any]]:
+        """Get the result of a test file finished in the earlier run
+
+        Args:
+            yaml_file (str): The path to the YAML test file
+
+        Returns:
+            (Optional[Dict[str, Any]]): The status and restored report phases, None if the test file has not finished
+        """
+
+        entry: Optional[Dict[str, Any]] = self.completed.get(yaml_file)
+        if entry is None:
+            return None
+        return {
+            "status": entry["status"],
+            "phases": [load_component(Phase(), phase) for phase in entry["phases"]]
+        }
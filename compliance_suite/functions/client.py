@@ -1,33 +1,215 @@
 """Module compliance_suite.functions.client.py
 
-This module contains class definition for client to send the requests to the server
+This module contains class definition for client to send the requests to the server, and the engines on which its
+coroutines are run
 """
 
+import asyncio
+import concurrent.futures
+import contextvars
+import functools
 import json
+import time
 from typing import (
     Any,
-    Dict
+    Callable,
+    Coroutine,
+    Dict,
+    List
 )
 
-import polling2
 import requests
 from requests.models import Response
 
-from compliance_suite.constants.constants import REQUEST_HEADERS
+from compliance_suite.constants.constants import (
+    POLLING_CANCEL_STATES,
+    POLLING_FINAL_STATES,
+    REQUEST_HEADERS
+)
 from compliance_suite.exceptions.compliance_exception import (
     TestFailureException,
     TestRunnerException
 )
 from compliance_suite.functions.log import logger
+from compliance_suite.functions.polling_strategy import PollingStrategy
+from compliance_suite.functions.profiler import profiler
+from compliance_suite.functions.request_timing import time_request
+
+
+class BlockingEngine():
+    """Engine of the sync client API. Its coroutines block the calling thread and complete without suspending, so that
+    a client coroutine run on it is driven to its end by run_blocking, without an event loop"""
+
+    async def call(self, function: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Call a blocking function, eg. the HTTP exchange
+
+        Args:
+            function (Callable[..., Any]): The blocking function
+            args (Any): The positional arguments of the function
+            kwargs (Any): The keyword arguments of the function
+
+        Returns:
+            (Any): The result of the function
+        """
+
+        return function(*args, **kwargs)
+
+    async def sleep(self, seconds: float) -> None:
+        """Wait between two polling requests
+
+        Args:
+            seconds (float): The seconds to wait
+        """
+
+        time.sleep(seconds)
+
+    async def wait(self, future: concurrent.futures.Future, timeout: float) -> Any:
+        """Wait for a future resolved by another thread, eg. the poll scheduler
+
+        Args:
+            future (concurrent.futures.Future): The future
+            timeout (float): The seconds to wait at most
+
+        Returns:
+            (Any): The result of the future
+
+        Raises:
+            concurrent.futures.TimeoutError: If the future is not resolved within the timeout
+        """
+
+        return future.result(timeout=timeout)
+
+
+class AsyncioEngine():
+    """Engine of the coroutine client API. The blocking HTTP exchange is sent by the same requests session as the sync
+    API on a thread of the event loop executor, so that both APIs behave alike towards the server, eg. with respect to
+    the redirects, the proxies and the CA bundle. The waits do not hold a thread"""
+
+    async def call(self, function: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Call a blocking function on the event loop executor, in the context of the calling task
+
+        Args:
+            function (Callable[..., Any]): The blocking function
+            args (Any): The positional arguments of the function
+            kwargs (Any): The keyword arguments of the function
+
+        Returns:
+            (Any): The result of the function
+        """
+
+        return await asyncio.get_running_loop().run_in_executor(None, functools.partial(
+            contextvars.copy_context().run, function, *args, **kwargs))
+
+    async def sleep(self, seconds: float) -> None:
+        """Wait between two polling requests
+
+        Args:
+            seconds (float): The seconds to wait
+        """
+
+        await asyncio.sleep(seconds)
+
+    async def wait(self, future: concurrent.futures.Future, timeout: float) -> Any:
+        """Wait for a future resolved by another thread, eg. the poll scheduler. The future is not cancelled on timeout,
+        as with the blocking engine
+
+        Args:
+            future (concurrent.futures.Future): The future
+            timeout (float): The seconds to wait at most
+
+        Returns:
+            (Any): The result of the future
+
+        Raises:
+            concurrent.futures.TimeoutError: If the future is not resolved within the timeout
+        """
+
+        try:
+            return await asyncio.wait_for(asyncio.shield(asyncio.wrap_future(future)), timeout=timeout)
+        except asyncio.TimeoutError:
+            raise concurrent.futures.TimeoutError()
+
+
+blocking_engine = BlockingEngine()
+asyncio_engine = AsyncioEngine()
+
+
+def run_blocking(coroutine: Coroutine) -> Any:
+    """Run a client coroutine on the blocking engine to its end on the calling thread
+
+    Args:
+        coroutine (Coroutine): The client coroutine, whose awaits are all on the blocking engine
+
+    Returns:
+        (Any): The result of the coroutine
+    """
+
+    try:
+        coroutine.send(None)
+    except StopIteration as stop:
+        return stop.value
+    coroutine.close()
+    raise RuntimeError("The client coroutine was suspended outside of an event loop")
 
 
 class Client():
-    """ This class is used to send REST requests to the provided server URL """
+    """ This class is used to send REST requests to the provided server URL. The requests are implemented once as
+    coroutines, and the sync methods run them on the blocking engine """
 
-    def __init__(self):
-        """ Initialize the Client object"""
+    def __init__(self, session: Any = None):
+        """ Initialize the Client object
+
+        Args:
+            session (Any): The keep-alive session used to send the requests. If not provided, the requests are sent
+                via the module-level requests API
+        """
 
         self.check_cancel = False   # Checks if the Cancel status is to be validated or not
+        self.session: Any = session if session is not None else requests
+        self.timings: List[Dict[str, Any]] = []     # Timing of each HTTP exchange, in the order they were sent
+
+    @staticmethod
+    def get_base_url(
+            server: str,
+            version: str,
+            endpoint: str,
+            path_params: Dict
+    ) -> str:
+        """ Builds the request URL from the server, the major API version and the endpoint
+
+        Args:
+            server (str): The server URL to send the request
+            version (str): The version of the deployed server
+            endpoint (str): The endpoint of the given server
+            path_params (dict): URI parameters in the endpoint
+
+        Returns:
+            (str): The request URL
+        """
+
+        for key in path_params.keys():
+            endpoint = endpoint.replace(f"{{{key}}}", path_params[key])
+
+        version = "v" + version.split(".")[0]  # Convert SemVer into Major API version
+        return str(server) + version + endpoint
+
+    async def async_timed_request(self, engine: Any, send: Any, url: str, **kwargs: Any) -> Response:
+        """ Sends a request via the session method on the engine and records the timing of the HTTP exchange
+
+        Args:
+            engine (Any): The engine running the request
+            send (Any): The session method sending the request, eg. session.get
+            url (str): The request URL
+            kwargs (Any): The keyword arguments of the request
+
+        Returns:
+            (Response): The response from the server is returned
+        """
+
+        with profiler.stage("http_wait"):
+            response, timing = await engine.call(time_request, send, url, **kwargs)
+        self.timings.append(timing)
+        return response
 
     def send_request(
             self,
@@ -38,7 +220,8 @@ class Client():
             path_params: Dict,
             query_params: Dict,
             operation: str,
-            request_body: str
+            request_body: str,
+            stream: bool = False
     ) -> Response:
         """ Sends the REST request to provided server
 
@@ -51,31 +234,81 @@ class Client():
             query_params (dict): The query parameters to be sent along with the request
             operation (str): The HTTP operation for the endpoint
             request_body (str): The request body for the request
+            stream (bool): If True, the GET response body is not read, so that it can be streamed. Default - False
 
         Returns:
             (Response): The response from the server is returned
         """
 
-        for key in path_params.keys():
-            endpoint = endpoint.replace(f"{{{key}}}", path_params[key])
+        return run_blocking(self.async_send_request(
+            service=service, server=server, version=version, endpoint=endpoint, path_params=path_params,
+            query_params=query_params, operation=operation, request_body=request_body, stream=stream,
+            engine=blocking_engine))
 
-        version = "v" + version.split(".")[0]  # Convert SemVer into Major API version
-        base_url: str = str(server) + version + endpoint
+    async def async_send_request(
+            self,
+            service: str,
+            server: str,
+            version: str,
+            endpoint: str,
+            path_params: Dict,
+            query_params: Dict,
+            operation: str,
+            request_body: str,
+            stream: bool = False,
+            engine: Any = None
+    ) -> Response:
+        """ Coroutine version of send_request. The event loop is free to drive the other jobs while the request is in
+        flight
+
+        Args:
+            service (str): The GA4GH service name (eg. TES)
+            server (str): The server URL to send the request
+            version (str): The version of the deployed server
+            endpoint (str): The endpoint of the given server
+            path_params (dict): URI parameters in the endpoint
+            query_params (dict): The query parameters to be sent along with the request
+            operation (str): The HTTP operation for the endpoint
+            request_body (str): The request body for the request
+            stream (bool): If True, the GET response body is not read, so that it can be streamed. Default - False
+            engine (Any): The engine running the coroutine. The asyncio engine if not provided
+
+        Returns:
+            (Response): The response from the server is returned
+        """
+
+        engine = engine or asyncio_engine
+        base_url: str = self.get_base_url(server, version, endpoint, path_params)
         request_headers: dict = REQUEST_HEADERS[service]
         response = None
         logger.info(f"Sending {operation} request to {base_url}. Query Parameters - {query_params}")
         try:
             if operation == "GET":
-                response = requests.get(base_url, headers=request_headers, params=query_params)
+                response = await self.async_timed_request(engine, self.session.get, base_url,
+                                                          headers=request_headers, params=query_params, stream=stream)
             elif operation == "POST":
                 request_body = json.loads(request_body)
-                response = requests.post(base_url, headers=request_headers, json=request_body)
+                response = await self.async_timed_request(engine, self.session.post, base_url,
+                                                          headers=request_headers, json=request_body)
             return response
         except OSError as err:
             raise TestRunnerException(name="OS Error",
                                       message=f"Connection error to {operation} {base_url}",
                                       details=err)
 
+    @staticmethod
+    def get_valid_states(check_cancel: bool) -> List[str]:
+        """ Get the task states at which a polling request is successful
+
+        Args:
+            check_cancel (bool): Bool to verify Cancel status or not
+
+        Returns:
+            (List[str]): The expected task states
+        """
+
+        return POLLING_CANCEL_STATES if check_cancel else POLLING_FINAL_STATES
+
     def check_poll(
             self,
             response: Any
@@ -94,9 +327,7 @@ class Client():
             return False
 
         response_json: Any = response.json()
-        valid_states = ["CANCELED", "CANCELING"] if self.check_cancel else ["COMPLETE", "EXECUTOR_ERROR",
-                                                                            "SYSTEM_ERROR", "PREEMPTED"]
-        if response_json["state"] in valid_states:
+        if response_json["state"] in self.get_valid_states(self.check_cancel):
             logger.info("Expected response received. Polling request successful")
             return True
 
@@ -114,7 +345,8 @@ class Client():
             operation: str,
             polling_interval: int,
             polling_timeout: int,
-            check_cancel_val: bool
+            check_cancel_val: bool,
+            polling_strategy: Any = None
     ) -> Response:
         """ This function polls a request to specified server with given interval and timeout
 
@@ -129,31 +361,171 @@ class Client():
             polling_interval (int): The duration between polling
             polling_timeout (int): The timeout for the polling request. Raises Timeout exception if exceeded
             check_cancel_val (bool): Bool to verify Cancel status or not
+            polling_strategy (Any): The strategy defining the wait between the polling requests. Fixed interval
+                if not provided
 
         Returns:
             (Response): The response from the server is returned
         """
 
-        for key in path_params.keys():
-            endpoint = endpoint.replace(f"{{{key}}}", path_params[key])
+        return run_blocking(self.async_poll_request(
+            service=service, server=server, version=version, endpoint=endpoint, path_params=path_params,
+            query_params=query_params, operation=operation, polling_interval=polling_interval,
+            polling_timeout=polling_timeout, check_cancel_val=check_cancel_val, polling_strategy=polling_strategy,
+            engine=blocking_engine))
+
+    async def async_poll_request(
+            self,
+            service: str,
+            server: str,
+            version: str,
+            endpoint: str,
+            path_params: Dict,
+            query_params: Dict,
+            operation: str,
+            polling_interval: int,
+            polling_timeout: int,
+            check_cancel_val: bool,
+            polling_strategy: Any = None,
+            engine: Any = None
+    ) -> Response:
+        """ Coroutine version of poll_request. With the asyncio engine, the wait between two polling requests is an
+        asyncio sleep, hence no thread is held while the task is running on the server.
+
+        Args:
+            service (str): The GA4GH service name (eg. TES)
+            server (str): The server URL to send the request
+            version (str): The version of the deployed server
+            endpoint (str): The endpoint of the given server
+            path_params (dict): URI parameters in the endpoint
+            query_params (dict): The query parameters to be sent along with the request
+            operation (str): The HTTP operation for the endpoint
+            polling_interval (int): The duration between polling
+            polling_timeout (int): The timeout for the polling request. Raises Timeout exception if exceeded
+            check_cancel_val (bool): Bool to verify Cancel status or not
+            polling_strategy (Any): The strategy defining the wait between the polling requests. Fixed interval
+                if not provided
+            engine (Any): The engine running the coroutine. The asyncio engine if not provided
 
+        Returns:
+            (Response): The response from the server is returned
+        """
+
+        engine = engine or asyncio_engine
         self.check_cancel = check_cancel_val
-        version = "v" + version.split(".")[0]  # Convert SemVer into Major API version
-        base_url: str = str(server) + version + endpoint
+        base_url: str = self.get_base_url(server, version, endpoint, path_params)
         request_headers: dict = REQUEST_HEADERS[service]
+        if polling_strategy is None:
+            polling_strategy = PollingStrategy(float(polling_interval))
 
         logger.info(f"Sending {operation} polling request to {base_url}. Query Parameters - {query_params}")
 
+        deadline: float = time.monotonic() + float(polling_timeout)
         try:
-            response = polling2.poll(lambda: requests.get(base_url, headers=request_headers, params=query_params),
-                                     step=polling_interval, timeout=polling_timeout,
-                                     check_success=self.check_poll)
-            return response
-        except polling2.TimeoutException:
-            raise TestFailureException(name="Polling Timeout Exception",
-                                       message=f"Polling timeout for {operation} {base_url}",
-                                       details=None)
+            while True:
+                response = await self.async_timed_request(engine, self.session.get, base_url,
+                                                          headers=request_headers, params=query_params)
+                if self.check_poll(response):
+                    return response
+                wait: float = polling_strategy.next_interval()
+                if time.monotonic() + wait > deadline:
+                    raise TestFailureException(name="Polling Timeout Exception",
+                                               message=f"Polling timeout for {operation} {base_url}",
+                                               details=None)
+                await engine.sleep(wait)
         except OSError as err:
             raise TestRunnerException(name="OS Error",
                                       message=f"Connection error to {operation} {base_url}",
                                       details=err)
+
+    def scheduled_poll_request(
+            self,
+            poll_scheduler: Any,
+            service: str,
+            server: str,
+            version: str,
+            endpoint: str,
+            path_params: Dict,
+            query_params: Dict,
+            operation: str,
+            polling_interval: int,
+            polling_timeout: int,
+            check_cancel_val: bool
+    ) -> Response:
+        """ Waits for the poll scheduler to resolve the task state, instead of polling the task separately. Once the
+        task reaches an expected state, the request is sent once to return the response with the requested view.
+
+        Args:
+            poll_scheduler (Any): The poll scheduler tracking the outstanding tasks
+            service (str): The GA4GH service name (eg. TES)
+            server (str): The server URL to send the request
+            version (str): The version of the deployed server
+            endpoint (str): The endpoint of the given server
+            path_params (dict): URI parameters in the endpoint. The "id" parameter identifies the polled task
+            query_params (dict): The query parameters to be sent along with the request
+            operation (str): The HTTP operation for the endpoint
+            polling_interval (int): The duration between polling
+            polling_timeout (int): The timeout for the polling request. Raises Timeout exception if exceeded
+            check_cancel_val (bool): Bool to verify Cancel status or not
+
+        Returns:
+            (Response): The response from the server is returned
+        """
+
+        return run_blocking(self.async_scheduled_poll_request(
+            poll_scheduler, service=service, server=server, version=version, endpoint=endpoint,
+            path_params=path_params, query_params=query_params, operation=operation,
+            polling_interval=polling_interval, polling_timeout=polling_timeout, check_cancel_val=check_cancel_val,
+            engine=blocking_engine))
+
+    async def async_scheduled_poll_request(
+            self,
+            poll_scheduler: Any,
+            service: str,
+            server: str,
+            version: str,
+            endpoint: str,
+            path_params: Dict,
+            query_params: Dict,
+            operation: str,
+            polling_interval: int,
+            polling_timeout: int,
+            check_cancel_val: bool,
+            engine: Any = None
+    ) -> Response:
+        """ Coroutine version of scheduled_poll_request
+
+        Args:
+            poll_scheduler (Any): The poll scheduler tracking the outstanding tasks
+            service (str): The GA4GH service name (eg. TES)
+            server (str): The server URL to send the request
+            version (str): The version of the deployed server
+            endpoint (str): The endpoint of the given server
+            path_params (dict): URI parameters in the endpoint. The "id" parameter identifies the polled task
+            query_params (dict): The query parameters to be sent along with the request
+            operation (str): The HTTP operation for the endpoint
+            polling_interval (int): The duration between polling
+            polling_timeout (int): The timeout for the polling request. Raises Timeout exception if exceeded
+            check_cancel_val (bool): Bool to verify Cancel status or not
+            engine (Any): The engine running the coroutine. The asyncio engine if not provided
+
+        Returns:
+            (Response): The response from the server is returned
+        """
+
+        engine = engine or asyncio_engine
+        self.check_cancel = check_cancel_val
+        registration = poll_scheduler.register(path_params["id"], check_cancel_val, float(polling_interval))
+        logger.info(f"Waiting for scheduled polling of task {path_params['id']}")
+        try:
+            await engine.wait(registration.future, float(polling_timeout))
+        except concurrent.futures.TimeoutError:
+            poll_scheduler.unregister(path_params["id"], registration)
+            base_url: str = self.get_base_url(server, version, endpoint, path_params)
+            raise TestFailureException(name="Polling Timeout Exception",
+                                       message=f"Polling timeout for {operation} {base_url}",
+                                       details=None)
+        logger.info("Expected response received. Polling request successful")
+        return await self.async_send_request(service=service, server=server, version=version, endpoint=endpoint,
+                                             path_params=path_params, query_params=query_params,
+                                             operation=operation, request_body="", engine=engine)
@@ -0,0 +1,142 @@
+"""Module compliance_suite.functions.discovery_index.py
+
+This module contains class definition for the discovery index which caches the header of each test file, ie. its
+description, service, versions and tags, so that the test files are selected without parsing and validating them
+"""
+
+import json
+import os
+from pathlib import Path
+import threading
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional
+)
+
+import yaml
+
+from compliance_suite.functions.yaml_loader import load_yaml_string
+
+HEADER_KEYS = ["description", "service", "versions", "tags"]
+
+
+class DiscoveryIndex():
+    """Persistent index of the test file headers, keyed by the absolute path of the test file. An entry is reused while
+    the modification time and size of the test file are unchanged, otherwise the header is scanned again. Only the top
+    level header keys of a test file are parsed, its jobs and fixtures are skipped."""
+
+    def __init__(self, index_file: str):
+        """Initialize the Discovery Index object
+
+        Args:
+            index_file (str): The path of the JSON file storing the headers
+        """
+
+        self.index_file: str = index_file
+        self.entries: Dict[str, Dict[str, Any]] = {}    # Absolute test file path -> modification time, size, header
+        self.updated: bool = False          # Checks if headers were scanned since loading
+        self.hits: int = 0
+        self.misses: int = 0
+        self.lock = threading.Lock()
+
+    def load(self) -> None:
+        """Load the headers of the earlier runs. A missing or unreadable file starts an empty index"""
+
+        try:
+            with open(self.index_file, "r") as f:
+                self.entries = json.load(f)
+        except (OSError, ValueError):
+            self.entries = {}
+        self.hits = 0
+        self.misses = 0
+
+    def save(self) -> None:
+        """Store the headers for the later runs, if headers were scanned. The entries of deleted test files are
+        dropped"""
+
+        with self.lock:
+            if not self.updated:
+                return
+            self.entries = {path: entry for path, entry in self.entries.items() if os.path.exists(path)}
+            Path(self.index_file).parent.mkdir(parents=True, exist_ok=True)
+            temp_file: str = self.index_file + ".tmp"
+            with open(temp_file, "w") as f:
+                json.dump(self.entries, f)
+            os.replace(temp_file, self.index_file)
+            self.updated = False
+
+    @staticmethod
+    def scan_header(yaml_file: str) -> Optional[Dict[str, Any]]:
+        """Parse the header keys of a test file. The lines of the other top level keys are not parsed
+
+        Args:
+            yaml_file (str): The path of the test file
+
+        Returns:
+            (Optional[Dict[str, Any]]): The description, service, versions and tags of the test file, and if it
+                declares fixtures. None if the header cannot be parsed, so that the test file is fully loaded and its
+                error reported
+        """
+
+        header_lines: List[str] = []
+        top_level_keys: List[str] = []
+        key: str = ""
+        try:
+            with open(yaml_file, "r") as f:
+                for line in f:
+                    if line[:1] not in ("", " ", "\t", "\n", "#", "-"):
+                        key = line.split(":", 1)[0].strip()
+                        top_level_keys.append(key)
+                    if key in HEADER_KEYS:
+                        header_lines.append(line)
+            header: Any = load_yaml_string("".join(header_lines))
+        except (OSError, UnicodeDecodeError, yaml.YAMLError):
+            return None
+
+        if (not isinstance(header, dict) or set(header) != set(HEADER_KEYS)
+                or not isinstance(header["description"], str) or not isinstance(header["service"], str)
+                or not all(isinstance(header[key], list) and all(isinstance(value, str) for value in header[key])
+                           for key in ["versions", "tags"])):
+            return None
+        header["fixtures"] = "fixtures" in top_level_keys
+        return header
+
+    def get_header(self, yaml_file: Path) -> Optional[Dict[str, Any]]:
+        """Get the header of a test file, from the index if the test file is unchanged
+
+        Args:
+            yaml_file (Path): The path of the test file
+
+        Returns:
+            (Optional[Dict[str, Any]]): The header of the test file. None if it cannot be parsed or the test file
+                cannot be read
+        """
+
+        path: str = os.path.abspath(yaml_file)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        with self.lock:
+            entry: Optional[Dict[str, Any]] = self.entries.get(path)
+            if entry is not None and entry["mtime"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+                self.hits += 1
+                return entry["header"]
+        header: Optional[Dict[str, Any]] = self.scan_header(path)
+        with self.lock:
+            self.entries[path] = {"mtime": stat.st_mtime_ns, "size": stat.st_size, "header": header}
+            self.misses += 1
+            self.updated = True
+        return header
+
+    def get_statistics(self) -> Dict[str, int]:
+        """Get the index statistics
+
+        Returns:
+            (Dict[str, int]): The number of headers read from the index and scanned from the test files
+        """
+
+        with self.lock:
+            return {"hits": self.hits, "misses": self.misses}
@@ -0,0 +1,165 @@
+"""Module compliance_suite.functions.fixture_pool.py
+
+This module contains class definition for the fixture pool which creates the shared fixtures of the test files once per
+run and hands their storage variables to the test files
+"""
+
+from concurrent.futures import (
+    Future,
+    ThreadPoolExecutor
+)
+import hashlib
+import json
+import threading
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List
+)
+
+from ga4gh.testbed.report.test import Test
+
+from compliance_suite.exceptions.compliance_exception import (
+    JobValidationException,
+    TestFailureException,
+    TestRunnerException
+)
+from compliance_suite.functions.log import logger
+
+
+class FixturePool():
+    """Run-scoped pool of the shared fixtures, eg. the tasks read by the get_task and list_tasks test files. A fixture
+    instance is identified by its resolved sub-jobs and instance number, so that the test files declaring a same fixture
+    share its instances. The instances are created concurrently in a worker pool, on first declaration. The report tests
+    of the fixture sub-jobs are handed to the first test file declaring the instance, its owner."""
+
+    def __init__(self, create_test_runner: Callable[[str], Any], workers: int = 10):
+        """Initialize the Fixture Pool object
+
+        Args:
+            create_test_runner (Callable[[str], Any]): The factory of the Test Runners creating the fixtures
+            workers (int): The maximum number of fixture instances created concurrently
+        """
+
+        self.create_test_runner: Callable[[str], Any] = create_test_runner
+        self.executor = ThreadPoolExecutor(max_workers=workers)
+        self.fixtures: Dict[str, Future] = {}   # Fixture key -> future resolved with the fixture storage variables
+        self.owners: Dict[str, str] = {}        # Fixture key -> test file reporting the fixture sub-jobs
+        self.report_tests: Dict[str, List[Test]] = {}   # Fixture key -> report tests of the fixture sub-jobs
+        self.lock = threading.Lock()
+        self.statistics: Dict[str, int] = {
+            "created": 0,
+            "failed": 0,
+            "reused": 0
+        }
+
+    @staticmethod
+    def get_key(service: str, jobs: List[Dict], instance: int) -> str:
+        """Get the key identifying a fixture instance
+
+        Args:
+            service (str): The GA4GH service name (eg. TES)
+            jobs (List[Dict]): The resolved sub-jobs creating the fixture
+            instance (int): The instance number of the fixture
+
+        Returns:
+            (str): The SHA-256 digest of the fixture instance
+        """
+
+        return hashlib.sha256(json.dumps([service, jobs, instance], sort_keys=True).encode()).hexdigest()
+
+    def add(self, service: str, jobs: List[Dict], instance: int, owner: str = "") -> Future:
+        """Declare a fixture instance. The instance is created in the background on first declaration
+
+        Args:
+            service (str): The GA4GH service name (eg. TES)
+            jobs (List[Dict]): The resolved sub-jobs creating the fixture
+            instance (int): The instance number of the fixture
+            owner (str): The test file declaring the fixture instance
+
+        Returns:
+            (Future): The future resolved with the storage variables of the fixture instance
+        """
+
+        key: str = self.get_key(service, jobs, instance)
+        with self.lock:
+            if key in self.fixtures:
+                self.statistics["reused"] += 1
+            else:
+                self.owners[key] = owner
+                self.report_tests[key] = []
+                self.fixtures[key] = self.executor.submit(self.create, key, service, jobs)
+            return self.fixtures[key]
+
+    def create(self, key: str, service: str, jobs: List[Dict]) -> Dict[str, Any]:
+        """Create a fixture instance by running its sub-jobs. The report test of each started sub-job is kept for the
+        owner of the fixture instance
+
+        Args:
+            key (str): The fixture instance key
+            service (str): The GA4GH service name (eg. TES)
+            jobs (List[Dict]): The resolved sub-jobs creating the fixture
+
+        Returns:
+            (Dict[str, Any]): The storage variables of the fixture instance
+
+        Raises:
+            (JobValidationException, TestFailureException, TestRunnerException): The exception of the failed sub-job
+        """
+
+        test_runner = self.create_test_runner(service)
+        for job in jobs:
+            logger.info(f'Creating fixture via sub-job -> {job["name"]}')
+            report_test = Test()
+            with self.lock:
+                self.report_tests[key].append(report_test)
+            try:
+                test_runner.run_tests(job, report_test)
+            except (JobValidationException, TestFailureException, TestRunnerException):
+                with self.lock:
+                    self.statistics["failed"] += 1
+                raise
+        with self.lock:
+            self.statistics["created"] += 1
+        return dict(test_runner.auxiliary_space)
+
+    def get_report_tests(self, key: str, owner: str) -> List[Test]:
+        """Get the report tests of the sub-jobs of a created or failed fixture instance, for its owner only
+
+        Args:
+            key (str): The fixture instance key
+            owner (str): The test file reading the fixture instance
+
+        Returns:
+            (List[Test]): The report tests in sub-job order. Empty if the test file is not the owner
+        """
+
+        with self.lock:
+            if self.owners.get(key) != owner:
+                return []
+            return list(self.report_tests.get(key, []))
+
+    def close(self, wait: bool = True) -> None:
+        """Stop the worker pool
+
+        Args:
+            wait (bool): If True, wait for the fixture instances in creation. Otherwise, the instances not yet in
+                creation are cancelled, eg. if the run was interrupted
+        """
+
+        if not wait:
+            with self.lock:
+                for future in self.fixtures.values():
+                    future.cancel()
+        self.executor.shutdown(wait=wait)
+
+    def get_statistics(self) -> Dict[str, int]:
+        """Get the fixture pool counters
+
+        Returns:
+            (Dict[str, int]): The number of created, failed and reused fixture instances
+        """
+
+        with self.lock:
+            return dict(self.statistics)
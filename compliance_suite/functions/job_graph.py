@@ -0,0 +1,179 @@
+"""Module compliance_suite.functions.job_graph.py
+
+This module contains class definition for the job graph which orders the sub-jobs of a test file by their storage
+variables, so that the independent sub-jobs can be run concurrently
+"""
+
+import re
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    Set
+)
+
+STORAGE_VAR_PATTERN = re.compile(r"^\{(.+)\}$")
+
+
+class JobGraph():
+    """Dependency graph of the sub-jobs of a test file. A sub-job depends on an earlier sub-job if:
+
+    - it consumes a storage variable produced by the earlier sub-job
+    - either of them modifies the server state (non GET operation) and both refer to a same storage variable, eg. a
+      get_task after a cancel_task of the same task
+    - either of them modifies the server state and the other refers to no storage variable, eg. a list_tasks after a
+      create_task
+
+    The remaining sub-jobs are independent, eg. the create_task sub-jobs of two template references."""
+
+    def __init__(self, jobs: List[Dict[str, Any]]):
+        """Initialize the Job Graph object
+
+        Args:
+            jobs (List[Dict[str, Any]]): The resolved sub-jobs of the test file in their file order
+        """
+
+        self.jobs: List[Dict[str, Any]] = jobs
+        self.consumed: List[Set[str]] = [self.get_consumed_vars(job) for job in jobs]
+        self.produced: List[Set[str]] = [set(job.get("storage_vars", {}).keys()) for job in jobs]
+        self.dependencies: List[Set[int]] = [self.get_dependencies(index) for index in range(len(jobs))]
+
+    @staticmethod
+    def get_consumed_vars(job: Dict[str, Any]) -> Set[str]:
+        """Get the storage variables referred in the path and query parameters of a sub-job
+
+        Args:
+            job (Dict[str, Any]): The sub-job data
+
+        Returns:
+            (Set[str]): The names of the consumed storage variables
+        """
+
+        values: List[Any] = list(job.get("path_parameters", {}).values())
+        for query_parameter in job.get("query_parameters", []):
+            values.extend(query_parameter.values())
+
+        consumed: Set[str] = set()
+        for value in values:
+            match = STORAGE_VAR_PATTERN.match(str(value))
+            if match is not None:
+                consumed.add(match.group(1))
+        return consumed
+
+    def is_mutating(self, index: int) -> bool:
+        """Check if a sub-job modifies the server state
+
+        Args:
+            index (int): The sub-job index
+
+        Returns:
+            (bool): True for a non GET operation
+        """
+
+        return self.jobs[index]["operation"] != "GET"
+
+    def get_dependencies(self, index: int) -> Set[int]:
+        """Get the earlier sub-jobs which must finish before a sub-job is started
+
+        Args:
+            index (int): The sub-job index
+
+        Returns:
+            (Set[int]): The indices of the earlier sub-jobs
+        """
+
+        dependencies: Set[int] = set()
+        for earlier in range(index):
+            earlier_mutating: bool = self.is_mutating(earlier)
+            mutating: bool = self.is_mutating(index)
+            if (self.produced[earlier] & self.consumed[index]
+                    or ((earlier_mutating or mutating) and self.consumed[earlier] & self.consumed[index])
+                    or (earlier_mutating and not mutating and not self.consumed[index])
+                    or (mutating and not earlier_mutating and not self.consumed[earlier])):
+                dependencies.add(earlier)
+        return dependencies
+
+    def get_ready(self, finished: Set[int], started: Set[int]) -> List[int]:
+        """Get the sub-jobs which are not started and whose dependencies are finished
+
+        Args:
+            finished (Set[int]): The indices of the finished sub-jobs
+            started (Set[int]): The indices of the started sub-jobs
+
+        Returns:
+            (List[int]): The indices of the sub-jobs ready to be started, in file order
+        """
+
+        return [index for index in range(len(self.jobs))
+                if index not in started and self.dependencies[index] <= finished]
+
+    def get_producers(self, storage_var: str, index: int) -> List[int]:
+        """Get the earlier sub-jobs producing a storage variable. As in a sequential run, the value of the first
+        producer in file order which stored the variable is visible to the consuming sub-job
+
+        Args:
+            storage_var (str): The storage variable name
+            index (int): The consuming sub-job index
+
+        Returns:
+            (List[int]): The indices of the producing sub-jobs in file order
+        """
+
+        return [earlier for earlier in range(index) if storage_var in self.produced[earlier]]
+
+
+class JobGraphRun():
+    """State of a run of the sub-jobs along the job graph, shared by the thread pool and event loop runs, which only
+    differ in how the started sub-jobs are awaited. Once a sub-job failed, no further sub-job is started."""
+
+    def __init__(self, graph: JobGraph, concurrency: int):
+        """Initialize the Job Graph Run object
+
+        Args:
+            graph (JobGraph): The job graph of the test file
+            concurrency (int): The maximum number of sub-jobs in flight
+        """
+
+        self.graph: JobGraph = graph
+        self.concurrency: int = concurrency
+        self.test_runners: Dict[int, Any] = {}      # Sub-job index -> Test Runner of the started sub-job
+        self.report_tests: Dict[int, Any] = {}      # Sub-job index -> report test of the started sub-job
+        self.errors: Dict[int, BaseException] = {}
+        self.finished: Set[int] = set()
+
+    def get_startable(self) -> List[int]:
+        """Get the sub-jobs to be started, within the concurrency left by the sub-jobs in flight
+
+        Returns:
+            (List[int]): The indices of the sub-jobs to be started in file order. Empty once a sub-job failed
+        """
+
+        if self.errors:
+            return []
+        running: int = len(self.test_runners) - len(self.finished)
+        return self.graph.get_ready(self.finished, set(self.test_runners.keys()))[:self.concurrency - running]
+
+    def start(self, index: int, test_runner: Any, report_test: Any) -> None:
+        """Record a started sub-job
+
+        Args:
+            index (int): The sub-job index
+            test_runner (Any): The Test Runner of the sub-job
+            report_test (Any): The report test of the sub-job
+        """
+
+        self.test_runners[index] = test_runner
+        self.report_tests[index] = report_test
+
+    def finish(self, index: int, err: Optional[BaseException]) -> None:
+        """Record a finished sub-job
+
+        Args:
+            index (int): The sub-job index
+            err (Optional[BaseException]): The exception of the sub-job, None if it passed
+        """
+
+        self.finished.add(index)
+        if err is not None:
+            self.errors[index] = err
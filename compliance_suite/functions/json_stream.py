@@ -0,0 +1,306 @@
+"""Module compliance_suite.functions.json_stream.py
+
+This module contains class definitions for the incremental reader of a JSON object, which parses the elements of one of
+its array members one at a time, and for the stand-in of the streamed array, so that a large response is validated
+without holding the whole document in memory
+"""
+
+from collections import deque
+import json
+import re
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set
+)
+
+WHITESPACE = b" \t\r\n"
+STRING_PATTERN = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+# Opening and closing brackets, complete strings, and the quote of a string which is not complete in the buffer
+TOKEN_PATTERN = re.compile(rb'([\[{])|([\]}])|"[^"\\]*(?:\\.[^"\\]*)*"|"', re.DOTALL)
+SCALAR_END_PATTERN = re.compile(rb'[ \t\r\n,\]}]')
+
+
+class JsonStreamReader():
+    """Incremental reader of a JSON document received in chunks. The boundaries of a value are found by scanning for
+    the structural characters, and only the bytes of the value being read are buffered, so that the memory is bounded
+    by the largest value read at once rather than by the document"""
+
+    def __init__(self, chunks: Iterable[bytes]):
+        """Initialize the JSON Stream Reader object
+
+        Args:
+            chunks (Iterable[bytes]): The chunks of the JSON document, eg. the iterated content of a streamed response
+        """
+
+        self.chunks: Iterator[bytes] = iter(chunks)
+        self.buffer = bytearray()
+        self.position: int = 0      # Offset of the next unread byte in the buffer
+        self.mark: int = 0          # Offset of the value being read, the bytes before it are dropped on refill
+        self.bytes_read: int = 0
+
+    def fill(self) -> bool:
+        """Append the next chunk to the buffer, after dropping the bytes which were read
+
+        Returns:
+            (bool): False if the document is exhausted
+        """
+
+        for chunk in self.chunks:
+            if chunk:
+                del self.buffer[:self.mark]
+                self.position -= self.mark
+                self.mark = 0
+                self.buffer += chunk
+                self.bytes_read += len(chunk)
+                return True
+        return False
+
+    def get_error(self, message: str) -> json.JSONDecodeError:
+        """Create the decoding error at the current position
+
+        Args:
+            message (str): The error message
+
+        Returns:
+            (json.JSONDecodeError): The decoding error, located by its byte offset in the document
+        """
+
+        return json.JSONDecodeError(message, "", self.bytes_read - len(self.buffer) + self.position)
+
+    def peek(self) -> Optional[int]:
+        """Skip the whitespace before the next value or structural character
+
+        Returns:
+            (Optional[int]): The next byte, None if the document is exhausted
+        """
+
+        while True:
+            while self.position < len(self.buffer):
+                if self.buffer[self.position] not in WHITESPACE:
+                    return self.buffer[self.position]
+                self.position += 1
+            self.mark = self.position
+            if not self.fill():
+                return None
+
+    def expect(self, character: bytes) -> None:
+        """Read a structural character
+
+        Args:
+            character (bytes): The expected character, eg. b"{"
+
+        Raises:
+            (json.JSONDecodeError): If the next character is another one
+        """
+
+        if self.peek() != character[0]:
+            raise self.get_error(f"Expecting {character.decode()}")
+        self.position += 1
+
+    def search(self, pattern: Any) -> Any:
+        """Find the next match of a pattern, reading chunks until it is found
+
+        Args:
+            pattern (Any): The compiled pattern
+
+        Returns:
+            (Any): The match, None if the document is exhausted before a match
+        """
+
+        while True:
+            match = pattern.search(self.buffer, self.position)
+            if match is not None:
+                return match
+            self.position = len(self.buffer)
+            if not self.fill():
+                return None
+
+    def read_string(self) -> None:
+        """Move past the string starting at the current position
+
+        Raises:
+            (json.JSONDecodeError): If the string is not terminated
+        """
+
+        while True:
+            match = STRING_PATTERN.match(self.buffer, self.position)
+            if match is not None:
+                self.position = match.end()
+                return
+            if not self.fill():
+                raise self.get_error("Unterminated string")
+
+    def read_container(self) -> None:
+        """Move past the array or object starting at the current position. The nested strings are matched as a whole,
+        so that the brackets they contain are not counted
+
+        Raises:
+            (json.JSONDecodeError): If the array or object is not terminated
+        """
+
+        depth: int = 0
+        while True:
+            for match in TOKEN_PATTERN.finditer(self.buffer, self.position):
+                if match.lastindex == 1:
+                    depth += 1
+                elif match.lastindex == 2:
+                    depth -= 1
+                    if depth == 0:
+                        self.position = match.end()
+                        return
+                elif match.end() - match.start() == 1:
+                    self.position = match.start()       # The string continues in the next chunk
+                    break
+            else:
+                self.position = len(self.buffer)
+            if not self.fill():
+                raise self.get_error("Unterminated array or object")
+
+    def read_value(self) -> Any:
+        """Read and parse the next value
+
+        Returns:
+            (Any): The parsed value
+
+        Raises:
+            (json.JSONDecodeError): If the value is not valid JSON
+        """
+
+        first: Optional[int] = self.peek()
+        if first is None:
+            raise self.get_error("Expecting value")
+        self.mark = self.position
+        if first == ord('"'):
+            self.read_string()
+        elif first in b"[{":
+            self.read_container()
+        else:
+            match = self.search(SCALAR_END_PATTERN)
+            self.position = len(self.buffer) if match is None else match.start()
+        value: Any = json.loads(bytes(self.buffer[self.mark:self.position]))
+        self.mark = self.position
+        return value
+
+    def read_separator(self, end: bytes) -> bool:
+        """Read the separator after a member or element
+
+        Args:
+            end (bytes): The character closing the object or array, eg. b"}"
+
+        Returns:
+            (bool): True if another member or element follows, False if the object or array is closed
+
+        Raises:
+            (json.JSONDecodeError): If the next character is neither a comma nor the closing character
+        """
+
+        separator: Optional[int] = self.peek()
+        if separator not in (ord(","), end[0]):
+            raise self.get_error(f"Expecting , or {end.decode()} delimiter")
+        self.position += 1
+        return separator == ord(",")
+
+    def read_object(self, array_key: str, handle_element: Callable[[Any], None]) -> Dict[str, Any]:
+        """Read a JSON object, passing each element of its array member to the handler as soon as it is parsed. The
+        elements are not kept by the reader
+
+        Args:
+            array_key (str): The name of the streamed array member, eg. "tasks"
+            handle_element (Callable[[Any], None]): The handler of the array elements, called in order
+
+        Returns:
+            (Dict[str, Any]): The members of the object. The streamed array member is an empty list
+
+        Raises:
+            (json.JSONDecodeError): If the document is not a valid JSON object
+        """
+
+        members: Dict[str, Any] = {}
+        self.expect(b"{")
+        if self.peek() == ord("}"):
+            self.position += 1
+        else:
+            while True:
+                if self.peek() != ord('"'):
+                    raise self.get_error("Expecting property name enclosed in double quotes")
+                key: str = self.read_value()
+                self.expect(b":")
+                if key == array_key and self.peek() == ord("["):
+                    self.position += 1
+                    members[key] = []
+                    if self.peek() == ord("]"):
+                        self.position += 1
+                    else:
+                        handle_element(self.read_value())
+                        while self.read_separator(b"]"):
+                            handle_element(self.read_value())
+                else:
+                    members[key] = self.read_value()
+                if not self.read_separator(b"}"):
+                    break
+        if self.peek() is not None:
+            raise self.get_error("Extra data")
+        return members
+
+
+class StreamedArray(list):
+    """List standing in for a JSON array which was streamed without being kept. It holds the number of elements, the
+    elements at the indices looked up by the job and the looked up values found in the array, which is all that the
+    filters and storage variables read. The other elements cannot be read"""
+
+    def __init__(self, indices: Set[int], tail_size: int, values: List[Any]):
+        """Initialize the Streamed Array object
+
+        Args:
+            indices (Set[int]): The non-negative indices whose elements are kept
+            tail_size (int): The number of last elements which are kept, for the negative indices
+            values (List[Any]): The values whose membership in the array is checked
+        """
+
+        super().__init__()
+        self.indices: Set[int] = indices
+        self.elements: Dict[int, Any] = {}
+        self.tail: Deque[Any] = deque(maxlen=tail_size)
+        self.values: List[Any] = values
+        self.found: List[Any] = []          # Looked up values found in the array
+        self.length: int = 0
+
+    def add(self, element: Any) -> None:
+        """Count the next element of the array and keep it if it is looked up
+
+        Args:
+            element (Any): The array element
+        """
+
+        if self.length in self.indices:
+            self.elements[self.length] = element
+        if self.tail.maxlen:
+            self.tail.append(element)
+        for value in self.values:
+            if value not in self.found and value == element:
+                self.found.append(value)
+        self.length += 1
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __getitem__(self, index: Any) -> Any:
+        if index < 0:
+            index += self.length
+        tail_start: int = self.length - len(self.tail)
+        if self.tail and index >= tail_start:
+            return self.tail[index - tail_start]
+        return self.elements[index]
+
+    def __contains__(self, value: Any) -> bool:
+        return value in self.found
+
+    def __repr__(self) -> str:
+        return f"<StreamedArray of {self.length} elements>"
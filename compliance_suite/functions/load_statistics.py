@@ -0,0 +1,133 @@
+"""Module compliance_suite.functions.load_statistics.py
+
+This module contains class definition for the load statistics which collect the request latencies and errors of a load
+or compliance run and summarize them per endpoint and operation
+"""
+
+import math
+import threading
+from typing import (
+    Any,
+    Dict,
+    List
+)
+
+from compliance_suite.constants.constants import LOAD_PERCENTILES
+
+
+class LoadStatistics():
+    """Thread-safe collector of the latency and outcome of each request of a load or compliance run. The requests are
+    grouped by their operation and endpoint template, eg. "GET /tasks/{id}", so that the requests to different tasks
+    are summarized together."""
+
+    def __init__(self):
+        """Initialize the Load Statistics object"""
+
+        self.latencies: Dict[str, List[float]] = {}     # Request key -> latencies in seconds
+        self.errors: Dict[str, int] = {}                # Request key -> number of failed requests
+        self.iterations: int = 0
+        self.dropped: int = 0       # Iterations not started, as all the workers were busy at their scheduled time
+        self.lock = threading.Lock()
+
+    def record(self, key: str, seconds: float, success: bool = True) -> None:
+        """Record a request
+
+        Args:
+            key (str): The request operation and endpoint template, eg. "GET /tasks/{id}"
+            seconds (float): The request latency
+            success (bool): True if the request passed the validations, otherwise False. Default - True
+        """
+
+        with self.lock:
+            self.latencies.setdefault(key, []).append(seconds)
+            self.errors.setdefault(key, 0)
+            if not success:
+                self.errors[key] += 1
+
+    def add_iteration(self) -> None:
+        """Count a replayed test file"""
+
+        with self.lock:
+            self.iterations += 1
+
+    def add_dropped(self) -> None:
+        """Count an iteration which could not be started at its scheduled time"""
+
+        with self.lock:
+            self.dropped += 1
+
+    def get_latencies(self) -> Dict[str, List[float]]:
+        """Get a copy of the recorded latencies
+
+        Returns:
+            (Dict[str, List[float]]): The latencies in seconds of each request key
+        """
+
+        with self.lock:
+            return {key: list(latencies) for key, latencies in self.latencies.items()}
+
+    @staticmethod
+    def get_percentile(sorted_values: List[float], percentile: float) -> float:
+        """Get the nearest-rank percentile of the sorted values
+
+        Args:
+            sorted_values (List[float]): The values in ascending order
+            percentile (float): The percentile between 0 and 100
+
+        Returns:
+            (float): The smallest value which is greater than or equal to the percentile of the values
+        """
+
+        if not sorted_values:
+            return 0.0
+        rank: int = max(math.ceil(percentile / 100 * len(sorted_values)), 1)
+        return sorted_values[rank - 1]
+
+    def summarize(self, latencies: List[float], errors: int, elapsed: float) -> Dict[str, Any]:
+        """Summarize the requests of a key
+
+        Args:
+            latencies (List[float]): The request latencies in seconds
+            errors (int): The number of failed requests
+            elapsed (float): The duration of the load run in seconds
+
+        Returns:
+            (Dict[str, Any]): The request count, throughput, error rate and latency percentiles in seconds
+        """
+
+        sorted_latencies: List[float] = sorted(latencies)
+        latency: Dict[str, float] = {
+            "mean": sum(sorted_latencies) / len(sorted_latencies) if sorted_latencies else 0.0
+        }
+        for percentile in LOAD_PERCENTILES:
+            latency[f"p{percentile}"] = self.get_percentile(sorted_latencies, percentile)
+        latency["max"] = sorted_latencies[-1] if sorted_latencies else 0.0
+        return {
+            "requests": len(sorted_latencies),
+            "errors": errors,
+            "error_rate": errors / len(sorted_latencies) if sorted_latencies else 0.0,
+            "throughput": len(sorted_latencies) / elapsed if elapsed > 0 else 0.0,
+            "latency": latency
+        }
+
+    def get_summary(self, elapsed: float) -> Dict[str, Any]:
+        """Get the summary of the load run
+
+        Args:
+            elapsed (float): The duration of the load run in seconds
+
+        Returns:
+            (Dict[str, Any]): The summary of all the requests under "total", and of the requests of each key under
+                "endpoints"
+        """
+
+        with self.lock:
+            all_latencies: List[float] = [latency for latencies in self.latencies.values() for latency in latencies]
+            return {
+                "duration": elapsed,
+                "iterations": self.iterations,
+                "dropped": self.dropped,
+                "total": self.summarize(all_latencies, sum(self.errors.values()), elapsed),
+                "endpoints": {key: self.summarize(self.latencies[key], self.errors[key], elapsed)
+                              for key in sorted(self.latencies)}
+            }
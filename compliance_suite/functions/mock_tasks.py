@@ -0,0 +1,332 @@
+"""Module compliance_suite.functions.mock_tasks.py
+
+This module contains class definition for the task store of the mock TES server, which moves the created tasks through
+their states after configured durations and renders them in the requested view
+"""
+
+import copy
+from datetime import (
+    datetime,
+    timedelta,
+    timezone
+)
+import threading
+import time
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    Tuple
+)
+import uuid
+
+from pydantic import ValidationError
+
+from compliance_suite.constants.constants import (
+    MOCK_BACKEND_PARAMETERS,
+    MOCK_FAILING_COMMAND,
+    MOCK_MAX_PAGE_SIZE,
+    MOCK_PAGE_SIZE
+)
+from compliance_suite.functions.model_registry import model_registry
+
+
+def format_time(timestamp: datetime) -> str:
+    """Format a timestamp in the RFC 3339 format of the TES API
+
+    Args:
+        timestamp (datetime): The UTC timestamp
+
+    Returns:
+        (str): The formatted timestamp, eg. "2023-01-01T00:00:00Z"
+    """
+
+    return timestamp.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def get_exit_codes(task: Dict[str, Any]) -> List[int]:
+    """Get the exit codes of the executors run for a task. An executor whose program is MOCK_FAILING_COMMAND exits with
+    1, and the next executors are not run unless its ignore_error flag is set
+
+    Args:
+        task (Dict[str, Any]): The submitted task
+
+    Returns:
+        (List[int]): The exit codes of the executors which are run, in order
+    """
+
+    exit_codes: List[int] = []
+    for executor in task.get("executors", []):
+        exit_codes.append(1 if executor["command"][:1] == [MOCK_FAILING_COMMAND] else 0)
+        if exit_codes[-1] and not executor.get("ignore_error"):
+            break
+    return exit_codes
+
+
+class MockTaskStore():
+    """Thread-safe store of the tasks of the mock TES server. A task is QUEUED on creation, RUNNING after the queued
+    duration and COMPLETE, or EXECUTOR_ERROR if an executor failed, after the running duration. The state is derived
+    from the task age at each request, so no background thread is needed and the transitions happen at reproducible
+    times."""
+
+    def __init__(self, version: str):
+        """Initialize the Mock Task Store object
+
+        Args:
+            version (str): The TES version whose API models validate the created tasks. Example - "1.1.0"
+        """
+
+        self.version: str = version
+        self.queued_seconds: float = 0.0
+        self.running_seconds: float = 2.0
+        self.tasks: Dict[str, Dict[str, Any]] = {}      # Task ID -> submitted task, creation and cancel times
+        self.order: List[str] = []                      # Task IDs in creation order
+        self.lock = threading.Lock()
+
+    def set_state_timings(self, queued_seconds: float, running_seconds: float) -> None:
+        """Set the durations of the task states
+
+        Args:
+            queued_seconds (float): The seconds after which a created task is RUNNING
+            running_seconds (float): The seconds after which a RUNNING task is COMPLETE
+        """
+
+        self.queued_seconds = queued_seconds
+        self.running_seconds = running_seconds
+
+    def add_task(self, task: Dict[str, Any], age: float = 0.0) -> str:
+        """Store a task
+
+        Args:
+            task (Dict[str, Any]): The submitted task
+            age (float): The seconds since the task was created. Default - 0
+
+        Returns:
+            (str): The task ID assigned by the store
+        """
+
+        task_id: str = str(uuid.uuid4())
+        created_at: datetime = datetime.now(timezone.utc) - timedelta(seconds=age)
+        task = dict(task, id=task_id, creation_time=format_time(created_at))
+        with self.lock:
+            self.tasks[task_id] = {"task": task, "created": time.monotonic() - age, "created_at": created_at,
+                                   "canceled": None}
+            self.order.append(task_id)
+        return task_id
+
+    def add_synthetic_tasks(self, count: int) -> None:
+        """Store COMPLETE tasks with inputs, outputs, resources and tags, so that the list tasks responses are large
+
+        Args:
+            count (int): The number of tasks
+        """
+
+        age: float = self.queued_seconds + self.running_seconds
+        for index in range(count):
+            self.add_task({
+                "name": f"MockTask-{index}",
+                "description": "Synthetic task of the mock server",
+                "inputs": [{"url": f"s3://mock/input-{index}", "path": "/data/input", "type": "FILE"}],
+                "outputs": [{"url": f"s3://mock/output-{index}", "path": "/data/output", "type": "FILE"}],
+                "resources": {"cpu_cores": 1, "ram_gb": 1.0, "disk_gb": 10.0, "preemptible": False},
+                "executors": [{"image": "alpine", "command": ["echo", str(index)], "workdir": "/data"}],
+                "volumes": ["/vol/"],
+                "tags": {"mock": "true", "index": str(index)}
+            }, age)
+
+    def get_state(self, record: Dict[str, Any], now: float) -> str:
+        """Get the state of a task
+
+        Args:
+            record (Dict[str, Any]): The stored task record
+            now (float): The monotonic time of the request
+
+        Returns:
+            (str): The task state at the given time
+        """
+
+        age: float = now - record["created"]
+        if record["canceled"] is not None and record["canceled"] < self.queued_seconds + self.running_seconds:
+            return "CANCELED"
+        if age < self.queued_seconds:
+            return "QUEUED"
+        if age < self.queued_seconds + self.running_seconds:
+            return "RUNNING"
+        exit_codes: List[int] = get_exit_codes(record["task"])
+        if exit_codes and exit_codes[-1] and not record["task"]["executors"][len(exit_codes) - 1].get("ignore_error"):
+            return "EXECUTOR_ERROR"
+        return "COMPLETE"
+
+    def render(self, record: Dict[str, Any], view: str, now: float) -> Dict[str, Any]:
+        """Render a task in a view. The BASIC view omits the executor stdout and stderr, the input contents and the
+        system logs, as defined by the TES API
+
+        Args:
+            record (Dict[str, Any]): The stored task record
+            view (str): The view, one of MINIMAL, BASIC and FULL
+            now (float): The monotonic time of the request
+
+        Returns:
+            (Dict[str, Any]): The task
+        """
+
+        state: str = self.get_state(record, now)
+        if view == "MINIMAL":
+            return {"id": record["task"]["id"], "state": state}
+
+        task: Dict[str, Any] = copy.deepcopy(record["task"])
+        task["state"] = state
+        if state != "QUEUED":
+            start_time: datetime = record["created_at"] + timedelta(seconds=self.queued_seconds)
+            end_time: datetime = start_time + timedelta(seconds=self.running_seconds)
+            task_log: Dict[str, Any] = {"logs": [], "start_time": format_time(start_time), "outputs": [],
+                                        "system_logs": [f"Task {state.lower()}"]}
+            for exit_code in get_exit_codes(task):
+                task_log["logs"].append({"start_time": format_time(start_time), "stdout": "", "stderr": "",
+                                         "exit_code": exit_code})
+            if state != "RUNNING":
+                task_log["end_time"] = format_time(end_time)
+                for executor_log in task_log["logs"]:
+                    executor_log["end_time"] = format_time(end_time)
+            task["logs"] = [task_log]
+
+        if view == "BASIC":
+            for task_input in task.get("inputs") or []:
+                task_input.pop("content", None)
+            for task_log in task.get("logs", []):
+                task_log.pop("system_logs", None)
+                for executor_log in task_log["logs"]:
+                    executor_log.pop("stdout", None)
+                    executor_log.pop("stderr", None)
+        return task
+
+    @staticmethod
+    def get_view(query: Dict[str, List[str]]) -> Optional[str]:
+        """Get the requested view
+
+        Args:
+            query (Dict[str, List[str]]): The query parameters of the request
+
+        Returns:
+            (Optional[str]): The view, MINIMAL if not requested. None if the view is invalid
+        """
+
+        view: str = query.get("view", ["MINIMAL"])[0]
+        return view if view in ["MINIMAL", "BASIC", "FULL"] else None
+
+    def create_task(self, body: Any) -> Tuple[int, Dict[str, Any]]:
+        """Create a task after validating it against the API model of the version
+
+        Args:
+            body (Any): The request body
+
+        Returns:
+            (Tuple[int, Dict[str, Any]]): The status code, and the task ID or the error message
+        """
+
+        if not isinstance(body, dict):
+            return 400, {"message": "The request body is not a JSON object"}
+        try:
+            model_registry.get_model(self.version, "create_task_request_body")(**body)
+        except ValidationError as err:
+            return 400, {"message": str(err)}
+        backend_parameters: Dict[str, str] = (body.get("resources") or {}).get("backend_parameters") or {}
+        unsupported: List[str] = [key for key in backend_parameters if key not in MOCK_BACKEND_PARAMETERS]
+        if unsupported and (body.get("resources") or {}).get("backend_parameters_strict"):
+            return 400, {"message": f"Unsupported backend parameters {', '.join(unsupported)}"}
+        return 200, {"id": self.add_task(body)}
+
+    def get_task(self, task_id: str, query: Dict[str, List[str]]) -> Tuple[int, Dict[str, Any]]:
+        """Get a task
+
+        Args:
+            task_id (str): The task ID
+            query (Dict[str, List[str]]): The query parameters of the request
+
+        Returns:
+            (Tuple[int, Dict[str, Any]]): The status code, and the task or the error message
+        """
+
+        view: Optional[str] = self.get_view(query)
+        if view is None:
+            return 400, {"message": "Invalid view"}
+        with self.lock:
+            record: Optional[Dict[str, Any]] = self.tasks.get(task_id)
+        if record is None:
+            return 404, {"message": f"Task {task_id} not found"}
+        return 200, self.render(record, view, time.monotonic())
+
+    def is_listed(self, record: Dict[str, Any], query: Dict[str, List[str]], now: float) -> bool:
+        """Check if a task matches the list tasks filters. The state and tag filters are only supported from 1.1.0
+
+        Args:
+            record (Dict[str, Any]): The stored task record
+            query (Dict[str, List[str]]): The query parameters of the request
+            now (float): The monotonic time of the request
+
+        Returns:
+            (bool): True if the task matches all the filters
+        """
+
+        task: Dict[str, Any] = record["task"]
+        if "name_prefix" in query and not str(task.get("name", "")).startswith(query["name_prefix"][0]):
+            return False
+        if self.version == "1.0.0":
+            return True
+        if "state" in query and self.get_state(record, now) != query["state"][0]:
+            return False
+        tags: Dict[str, str] = task.get("tags") or {}
+        tag_values: List[str] = query.get("tag_value", [])
+        for index, tag_key in enumerate(query.get("tag_key", [])):
+            if tag_key not in tags or (index < len(tag_values) and tags[tag_key] != tag_values[index]):
+                return False
+        return True
+
+    def list_tasks(self, query: Dict[str, List[str]]) -> Tuple[int, Dict[str, Any]]:
+        """List the tasks matching the filters, newest first. The page token is the offset of the next page
+
+        Args:
+            query (Dict[str, List[str]]): The query parameters of the request
+
+        Returns:
+            (Tuple[int, Dict[str, Any]]): The status code, and the page of tasks or the error message
+        """
+
+        view: Optional[str] = self.get_view(query)
+        try:
+            page_size: int = min(int(query.get("page_size", [MOCK_PAGE_SIZE])[0]), MOCK_MAX_PAGE_SIZE)
+            offset: int = int(query.get("page_token", ["0"])[0])
+        except ValueError:
+            return 400, {"message": "Invalid page size or page token"}
+        if view is None or page_size < 1 or offset < 0:
+            return 400, {"message": "Invalid view, page size or page token"}
+
+        now: float = time.monotonic()
+        with self.lock:
+            records: List[Dict[str, Any]] = [self.tasks[task_id] for task_id in reversed(self.order)]
+        listed: List[Dict[str, Any]] = [record for record in records if self.is_listed(record, query, now)]
+        response: Dict[str, Any] = {
+            "tasks": [self.render(record, view, now) for record in listed[offset:offset + page_size]]
+        }
+        if offset + page_size < len(listed):
+            response["next_page_token"] = str(offset + page_size)
+        return 200, response
+
+    def cancel_task(self, task_id: str) -> Tuple[int, Dict[str, Any]]:
+        """Cancel a task. A task which is already COMPLETE stays COMPLETE
+
+        Args:
+            task_id (str): The task ID
+
+        Returns:
+            (Tuple[int, Dict[str, Any]]): The status code, and an empty object or the error message
+        """
+
+        with self.lock:
+            record: Optional[Dict[str, Any]] = self.tasks.get(task_id)
+            if record is None:
+                return 404, {"message": f"Task {task_id} not found"}
+            if record["canceled"] is None:
+                record["canceled"] = time.monotonic() - record["created"]
+        return 200, {}
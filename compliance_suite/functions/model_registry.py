@@ -0,0 +1,99 @@
+"""Module compliance_suite.functions.model_registry.py
+
+This module contains class definition for the model registry which resolves the Pydantic API models of each version
+once, and its singleton instance
+"""
+
+import importlib
+import threading
+from typing import (
+    Any,
+    Dict
+)
+
+from compliance_suite.constants.constants import ENDPOINT_TO_MODEL
+from compliance_suite.exceptions.compliance_exception import JobValidationException
+
+
+class ModelRegistry():
+    """Version-keyed registry of the Pydantic API models. The models module of a version is imported and every model
+    of ENDPOINT_TO_MODEL is resolved at once, so that a missing version or model is reported before any request is
+    sent"""
+
+    def __init__(self):
+        """Initialize the Model Registry object"""
+
+        self.models: Dict[str, Dict[str, Any]] = {}     # Version -> endpoint model name -> Pydantic model class
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def get_module_name(version: str) -> str:
+        """Get the name of the models module of a version
+
+        Args:
+            version (str): The API version. Example - "1.0.0"
+
+        Returns:
+            (str): The models module name
+        """
+
+        return "compliance_suite.models.v" + version.replace('.', '_') + "_specs"
+
+    def load(self, version: str) -> Dict[str, Any]:
+        """Resolve all the API models of a version. The models are resolved once and reused afterwards
+
+        Args:
+            version (str): The API version. Example - "1.0.0"
+
+        Returns:
+            (Dict[str, Any]): The Pydantic model classes per endpoint model name
+
+        Raises:
+            (JobValidationException): If the version is not supported or a model is not defined for the version
+        """
+
+        with self.lock:
+            if version in self.models:
+                return self.models[version]
+
+            try:
+                pydantic_module: Any = importlib.import_module(self.get_module_name(version))
+            except ModuleNotFoundError as err:
+                raise JobValidationException(name="Unsupported Version",
+                                             message=f"No API models found for version {version}",
+                                             details=err)
+
+            models: Dict[str, Any] = {}
+            for endpoint_model, model_name in ENDPOINT_TO_MODEL.items():
+                if not hasattr(pydantic_module, model_name):
+                    raise JobValidationException(name="Missing API Model",
+                                                 message=f"Model {model_name} for {endpoint_model} is not defined "
+                                                         f"for version {version}",
+                                                 details=None)
+                models[endpoint_model] = getattr(pydantic_module, model_name)
+            self.models[version] = models
+            return models
+
+    def get_model(self, version: str, endpoint_model: str) -> Any:
+        """Get the API model of an endpoint
+
+        Args:
+            version (str): The API version. Example - "1.0.0"
+            endpoint_model (str): The endpoint name for mapping the model class
+
+        Returns:
+            (Any): The Pydantic model class
+
+        Raises:
+            (JobValidationException): If the version or the endpoint model is not supported
+        """
+
+        models: Dict[str, Any] = self.load(version)
+        if endpoint_model not in models:
+            raise JobValidationException(name="Missing API Model",
+                                         message=f"No model mapped for {endpoint_model}",
+                                         details=None)
+        return models[endpoint_model]
+
+
+model_registry = ModelRegistry()
@@ -0,0 +1,319 @@
+"""Module compliance_suite.functions.poll_scheduler.py
+
+This module contains class definition for the poll scheduler which resolves the states of the polled TES tasks in
+batches instead of polling each task separately
+"""
+
+from concurrent.futures import Future
+import threading
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    Tuple
+)
+
+from compliance_suite.exceptions.compliance_exception import TestRunnerException
+from compliance_suite.functions.client import Client
+from compliance_suite.functions.log import logger
+
+
+class PollRegistration():
+    """A polling job waiting for its task to reach an expected state"""
+
+    def __init__(self, check_cancel: bool, interval: float):
+        """Initialize the Poll Registration object
+
+        Args:
+            check_cancel (bool): Bool to verify Cancel status or not
+            interval (float): The polling interval of the job in seconds
+        """
+
+        self.check_cancel: bool = check_cancel
+        self.interval: float = interval
+        self.future: Future = Future()     # Resolved with the task state once it is expected by the job
+
+
+class PollScheduler():
+    """Central scheduler which keeps the set of outstanding task IDs. At every tick, the states of the tasks are
+    resolved via paged list_tasks requests in MINIMAL view, filtered by the task name prefix and the expected states.
+    Without a name prefix, or once a listing resolves none of the tasks, the tasks are fetched individually. A waiting
+    job is woken up once its task reaches a state accepted by the client polling check."""
+
+    def __init__(
+            self,
+            service: str,
+            server: str,
+            version: str,
+            session: Any = None,
+            name_prefix: str = "",
+            page_size: int = 256,
+            max_pages: int = 8
+    ):
+        """Initialize the Poll Scheduler object
+
+        Args:
+            service (str): The GA4GH service name (eg. TES)
+            server (str): The server URL to send the requests
+            version (str): The version of the deployed server
+            session (Any): The keep-alive session used to send the requests
+            name_prefix (str): The task name prefix of the list_tasks requests. Empty to poll the tasks individually
+            page_size (int): The number of tasks requested per list_tasks page
+            max_pages (int): The maximum number of list_tasks pages requested per tick
+        """
+
+        self.service: str = service
+        self.server: str = server
+        self.version: str = version
+        self.client = Client(session)
+        self.name_prefix: str = name_prefix
+        self.page_size: int = page_size
+        self.max_pages: int = max_pages
+        self.list_supported: bool = True    # Disabled if the server does not support list_tasks
+        self.state_filter: bool = tuple(int(part) for part in version.split(".")[:2]) >= (1, 1)  # TES 1.1.0 filter
+        self.registrations: Dict[str, List[PollRegistration]] = {}
+        self.condition = threading.Condition()
+        self.stopped: bool = False
+        self.thread: Optional[threading.Thread] = None
+        self.statistics: Dict[str, int] = {
+            "ticks": 0,
+            "list_requests": 0,
+            "get_requests": 0,
+            "resolved": 0
+        }
+
+    def start(self) -> None:
+        """Start the scheduler thread"""
+
+        if not self.name_prefix:
+            logger.info("Batched polling without task name prefix. Polling the tasks individually")
+        self.stopped = False
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def stop(self) -> None:
+        """Stop the scheduler thread. The jobs still waiting are not resolved"""
+
+        with self.condition:
+            self.stopped = True
+            self.condition.notify_all()
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+
+    def register(self, task_id: str, check_cancel: bool, interval: float) -> PollRegistration:
+        """Add a task to the outstanding set
+
+        Args:
+            task_id (str): The TES task ID to be polled
+            check_cancel (bool): Bool to verify Cancel status or not
+            interval (float): The polling interval of the job in seconds
+
+        Returns:
+            (PollRegistration): The registration whose future is resolved with the expected task state
+        """
+
+        registration = PollRegistration(check_cancel, interval)
+        with self.condition:
+            self.registrations.setdefault(task_id, []).append(registration)
+            self.condition.notify_all()
+        return registration
+
+    def unregister(self, task_id: str, registration: PollRegistration) -> None:
+        """Remove a registration from the outstanding set, eg. if the polling job timed out
+
+        Args:
+            task_id (str): The TES task ID
+            registration (PollRegistration): The registration to be removed
+        """
+
+        with self.condition:
+            if registration in self.registrations.get(task_id, []):
+                self.registrations[task_id].remove(registration)
+                if not self.registrations[task_id]:
+                    del self.registrations[task_id]
+
+    def get_interval(self) -> float:
+        """Get the tick interval, which is the shortest polling interval of the outstanding jobs
+
+        Returns:
+            (float): The tick interval in seconds
+        """
+
+        with self.condition:
+            intervals: List[float] = [registration.interval for registrations in self.registrations.values()
+                                      for registration in registrations]
+        return min(intervals) if intervals else 0
+
+    def run(self) -> None:
+        """Scheduler thread loop. Ticks while there are outstanding tasks, otherwise waits for a registration"""
+
+        while True:
+            with self.condition:
+                self.condition.wait_for(lambda: self.stopped or self.registrations)
+                if self.stopped:
+                    return
+                if self.condition.wait_for(lambda: self.stopped, timeout=self.get_interval()):
+                    return
+            try:
+                self.tick()
+            except (TestRunnerException, ValueError) as err:
+                logger.info(f"Batched polling request failed. Retrying... {err}")
+            except Exception as err:
+                logger.warning(f"Batched polling failed unexpectedly. Failing the waiting jobs... {err!r}")
+                self.fail_registrations(err)
+            finally:
+                # The request timings are only kept for the jobs, not for the scheduler requests
+                self.client.timings.clear()
+
+    def fail_registrations(self, err: Exception) -> None:
+        """Fail all the waiting jobs, so that they are reported as failed instead of waiting until their timeout
+
+        Args:
+            err (Exception): The unexpected exception raised by the tick
+        """
+
+        with self.condition:
+            registrations: Dict[str, List[PollRegistration]] = self.registrations
+            self.registrations = {}
+        for task_id, task_registrations in registrations.items():
+            for registration in task_registrations:
+                registration.future.set_exception(TestRunnerException(
+                    name="Batched Polling Error",
+                    message=f"Batched polling of task {task_id} failed",
+                    details=err))
+
+    def get_expected_states(self) -> List[str]:
+        """Get the states expected by any of the waiting jobs
+
+        Returns:
+            (List[str]): The expected task states, in the order of the client polling check
+        """
+
+        expected_states: List[str] = []
+        with self.condition:
+            for registrations in self.registrations.values():
+                for registration in registrations:
+                    for state in Client.get_valid_states(registration.check_cancel):
+                        if state not in expected_states:
+                            expected_states.append(state)
+        return expected_states
+
+    def list_states(self, task_ids: List[str], expected_states: List[str]) -> Tuple[Dict[str, str], bool]:
+        """Resolve the task states via paged list_tasks requests in MINIMAL view, filtered by the name prefix and,
+        from TES 1.1.0, by each of the expected states
+
+        Args:
+            task_ids (List[str]): The outstanding task IDs
+            expected_states (List[str]): The task states expected by the waiting jobs
+
+        Returns:
+            (Tuple[Dict[str, str], bool]): The states of the outstanding tasks found in the listed pages, and True if
+                the listings are complete, ie. the tasks not found are in none of the expected states
+        """
+
+        states: Dict[str, str] = {}
+        outstanding = set(task_ids)
+        complete: bool = self.state_filter
+        for state in expected_states if self.state_filter else [None]:
+            query_params: Dict[str, Any] = {"view": "MINIMAL", "page_size": self.page_size,
+                                            "name_prefix": self.name_prefix}
+            if state is not None:
+                query_params["state"] = state
+
+            for _ in range(self.max_pages):
+                response = self.client.send_request(service=self.service, server=self.server, version=self.version,
+                                                    endpoint="/tasks", path_params={},
+                                                    query_params=dict(query_params), operation="GET",
+                                                    request_body="")
+                self.statistics["list_requests"] += 1
+                if response.status_code != 200:
+                    logger.info("List tasks not supported for batched polling. Polling the tasks individually")
+                    self.list_supported = False
+                    return states, False
+
+                response_json: Any = response.json()
+                for task in response_json.get("tasks", []):
+                    if state is not None and task.get("state") != state:
+                        # The server ignores the state filter, so that a single listing contains all the states
+                        logger.info("List tasks state filter not supported. Listing the tasks by name prefix only")
+                        self.state_filter = False
+                        complete = False
+                    if task.get("id") in outstanding:
+                        states[task["id"]] = task.get("state", "UNKNOWN")
+                        outstanding.discard(task["id"])
+
+                next_page_token: Any = response_json.get("next_page_token")
+                if not outstanding:
+                    return states, True
+                if not next_page_token:
+                    break
+                query_params["page_token"] = next_page_token
+            else:
+                complete = False    # Pages left beyond the maximum number of pages per tick
+
+            if state is not None and not self.state_filter:
+                break
+        return states, complete
+
+    def get_state(self, task_id: str) -> Optional[str]:
+        """Resolve the state of a single task via get_task request in MINIMAL view
+
+        Args:
+            task_id (str): The TES task ID
+
+        Returns:
+            (Optional[str]): The task state, None if the task could not be retrieved
+        """
+
+        response = self.client.send_request(service=self.service, server=self.server, version=self.version,
+                                            endpoint="/tasks/{id}", path_params={"id": task_id},
+                                            query_params={"view": "MINIMAL"}, operation="GET", request_body="")
+        self.statistics["get_requests"] += 1
+        if response.status_code != 200:
+            return None
+        return response.json().get("state")
+
+    def tick(self) -> None:
+        """Resolve the states of all the outstanding tasks and wake up the jobs whose task reached an expected state"""
+
+        with self.condition:
+            task_ids: List[str] = list(self.registrations.keys())
+        if not task_ids:
+            return
+
+        self.statistics["ticks"] += 1
+        states: Dict[str, str] = {}
+        complete: bool = False
+        if self.list_supported and self.name_prefix:
+            states, complete = self.list_states(task_ids, self.get_expected_states())
+            if not states and not complete and self.list_supported:
+                logger.info("List tasks resolved none of the outstanding tasks. Polling the tasks individually")
+                self.list_supported = False
+
+        # The tasks missing from complete state-filtered listings have not reached an expected state yet
+        for task_id in [] if complete else task_ids:
+            if task_id not in states:
+                state: Optional[str] = self.get_state(task_id)
+                if state is not None:
+                    states[task_id] = state
+
+        with self.condition:
+            for task_id, state in states.items():
+                for registration in list(self.registrations.get(task_id, [])):
+                    if state in Client.get_valid_states(registration.check_cancel):
+                        registration.future.set_result(state)
+                        self.registrations[task_id].remove(registration)
+                        self.statistics["resolved"] += 1
+                if task_id in self.registrations and not self.registrations[task_id]:
+                    del self.registrations[task_id]
+
+    def get_statistics(self) -> Dict[str, int]:
+        """Get the batched polling counters
+
+        Returns:
+            (Dict[str, int]): The number of ticks, list and get requests sent and resolved polling jobs
+        """
+
+        return dict(self.statistics)
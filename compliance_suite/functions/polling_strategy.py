@@ -0,0 +1,207 @@
+"""Module compliance_suite.functions.polling_strategy.py
+
+This module contains class definitions for the polling strategies which define the wait between polling requests, and
+the polling history from which the adaptive strategy learns the typical completion time of a task
+"""
+
+import json
+import os
+from pathlib import Path
+import random
+import statistics
+import threading
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional
+)
+
+from compliance_suite.constants.constants import (
+    POLLING_BACKOFF_FACTOR,
+    POLLING_HISTORY_SIZE,
+    POLLING_MAX_INTERVAL,
+    POLLING_MIN_INTERVAL
+)
+from compliance_suite.exceptions.compliance_exception import JobValidationException
+
+
+class PollingStrategy():
+    """Fixed polling strategy. Waits the same interval between every polling request"""
+
+    def __init__(self, interval: float, max_interval: float = POLLING_MAX_INTERVAL):
+        """Initialize the Polling Strategy object
+
+        Args:
+            interval (float): The polling interval in seconds
+            max_interval (float): The cap for the polling interval in seconds
+        """
+
+        self.interval: float = interval
+        self.max_interval: float = max(max_interval, interval)
+
+    def next_interval(self) -> float:
+        """Get the wait before the next polling request
+
+        Returns:
+            (float): The wait in seconds
+        """
+
+        return self.interval
+
+
+class ExponentialPollingStrategy(PollingStrategy):
+    """Exponential backoff polling strategy. The interval starts short, at the minimum polling interval or at the
+    polling interval if shorter, so that a quick task is not waited for a whole polling interval, and is multiplied at
+    every polling request up to the cap. Equal jitter is applied, so that tasks started together do not poll in
+    lockstep"""
+
+    def __init__(self, interval: float, max_interval: float = POLLING_MAX_INTERVAL):
+        """Initialize the Exponential Polling Strategy object
+
+        Args:
+            interval (float): The polling interval in seconds, which bounds the first interval
+            max_interval (float): The cap for the polling interval in seconds
+        """
+
+        super().__init__(interval, max_interval)
+        self.step: float = min(interval, POLLING_MIN_INTERVAL)
+
+    def next_interval(self) -> float:
+        """Get the wait before the next polling request and back off the interval
+
+        Returns:
+            (float): The wait in seconds
+        """
+
+        step: float = self.step
+        self.step = min(self.step * POLLING_BACKOFF_FACTOR, self.max_interval)
+        return step / 2 + random.uniform(0, step / 2)
+
+
+class AdaptivePollingStrategy(ExponentialPollingStrategy):
+    """Adaptive polling strategy. The first wait is derived from the typical completion time of earlier tasks of the
+    same type, after which the strategy backs off exponentially. Without history, it is an exponential strategy"""
+
+    def __init__(self, interval: float, expected_duration: Optional[float],
+                 max_interval: float = POLLING_MAX_INTERVAL):
+        """Initialize the Adaptive Polling Strategy object
+
+        Args:
+            interval (float): The polling interval in seconds, which bounds the first backoff interval
+            expected_duration (Optional[float]): The typical completion time in seconds. None if not known
+            max_interval (float): The cap for the backoff interval in seconds
+        """
+
+        super().__init__(interval, max_interval)
+        self.expected_duration: Optional[float] = expected_duration
+
+    def next_interval(self) -> float:
+        """Get the wait before the next polling request. The first wait ends just before the expected completion, even
+        if it is shorter than the polling interval
+
+        Returns:
+            (float): The wait in seconds
+        """
+
+        if self.expected_duration is not None:
+            expected_duration: float = self.expected_duration
+            self.expected_duration = None
+            return max(expected_duration * 0.9, POLLING_MIN_INTERVAL)
+        return super().next_interval()
+
+
+class PollingHistory():
+    """Persistent record of the observed completion times per task type, used by the adaptive polling strategy"""
+
+    def __init__(self, history_file: str):
+        """Initialize the Polling History object
+
+        Args:
+            history_file (str): The path of the JSON file storing the completion times
+        """
+
+        self.history_file: str = history_file
+        self.durations: Dict[str, List[float]] = {}
+        self.updated: bool = False          # Checks if new completion times were recorded since loading
+        self.lock = threading.Lock()
+
+    def load(self) -> None:
+        """Load the completion times of the earlier runs. A missing or unreadable file starts an empty history"""
+
+        try:
+            with open(self.history_file, "r") as f:
+                self.durations = json.load(f)
+        except (OSError, ValueError):
+            self.durations = {}
+
+    def save(self) -> None:
+        """Store the completion times for the later runs, if new completion times were recorded"""
+
+        with self.lock:
+            if not self.updated:
+                return
+            Path(self.history_file).parent.mkdir(parents=True, exist_ok=True)
+            temp_file: str = self.history_file + ".tmp"
+            with open(temp_file, "w") as f:
+                json.dump(self.durations, f)
+            os.replace(temp_file, self.history_file)
+            self.updated = False
+
+    def record(self, task_type: str, duration: float) -> None:
+        """Record the observed completion time of a task. Only the most recent observations are kept
+
+        Args:
+            task_type (str): The key identifying the task type
+            duration (float): The completion time in seconds
+        """
+
+        with self.lock:
+            durations: List[float] = self.durations.setdefault(task_type, [])
+            durations.append(round(duration, 3))
+            del durations[:-POLLING_HISTORY_SIZE]
+            self.updated = True
+
+    def get_expected_duration(self, task_type: str) -> Optional[float]:
+        """Get the typical completion time of a task type
+
+        Args:
+            task_type (str): The key identifying the task type
+
+        Returns:
+            (Optional[float]): The median of the observed completion times, None if there are no observations
+        """
+
+        with self.lock:
+            durations: List[float] = self.durations.get(task_type, [])
+            return statistics.median(durations) if durations else None
+
+
+def create_polling_strategy(polling: Dict[str, Any], history: Any = None, task_type: str = "") -> PollingStrategy:
+    """Create the polling strategy of a polling job
+
+    Args:
+        polling: The polling object of the YAML job
+        history: The polling history for the adaptive strategy
+        task_type: The key identifying the polled task type for the adaptive strategy
+
+    Returns:
+        (PollingStrategy): The polling strategy, fixed if not specified in the job
+    """
+
+    strategy: str = polling.get("strategy", "fixed")
+    interval: float = float(polling["interval"])
+    max_interval: float = float(polling.get("max_interval", POLLING_MAX_INTERVAL))
+
+    if strategy == "fixed":
+        return PollingStrategy(interval, max_interval)
+    elif strategy == "exponential":
+        return ExponentialPollingStrategy(interval, max_interval)
+    elif strategy == "adaptive":
+        expected_duration: Optional[float] = None
+        if history is not None:
+            expected_duration = history.get_expected_duration(task_type)
+        return AdaptivePollingStrategy(interval, expected_duration, max_interval)
+    raise JobValidationException(name="Invalid polling strategy",
+                                 message=f"Polling strategy {strategy} is not supported",
+                                 details=None)
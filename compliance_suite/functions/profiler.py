@@ -0,0 +1,210 @@
+"""Module compliance_suite.functions.profiler.py
+
+This module contains class definition for the profiler which times the processing stages of a run, eg. the YAML loading
+or the HTTP wait, and the profiler singleton shared by the run
+"""
+
+import contextvars
+import cProfile
+import pstats
+import sys
+import threading
+import time
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    Tuple
+)
+
+
+class StageFrame():
+    """A running stage, charged with the time of the stages nested in it"""
+
+    __slots__ = ("name", "start_time", "children_seconds")
+
+    def __init__(self, name: str):
+        """Initialize the Stage Frame object
+
+        Args:
+            name (str): The stage name
+        """
+
+        self.name: str = name
+        self.start_time: float = time.perf_counter()
+        self.children_seconds: float = 0.0      # Time spent in the nested stages
+
+
+# The running stages of the current thread or asyncio task, outermost first
+stage_stack: contextvars.ContextVar = contextvars.ContextVar("stage_stack", default=())
+
+
+class Stage():
+    """Context manager timing a stage. It does nothing if the profiler is disabled"""
+
+    __slots__ = ("profiler", "name", "token")
+
+    def __init__(self, profiler: "Profiler", name: str):
+        """Initialize the Stage object
+
+        Args:
+            profiler (Profiler): The profiler recording the stage
+            name (str): The stage name
+        """
+
+        self.profiler: "Profiler" = profiler
+        self.name: str = name
+        self.token: Any = None
+
+    def __enter__(self) -> "Stage":
+        if self.profiler.enabled:
+            self.token = stage_stack.set(stage_stack.get() + (StageFrame(self.name),))
+        return self
+
+    def __exit__(self, *args: Any) -> bool:
+        if self.token is None:
+            return False
+        frames: Tuple[StageFrame, ...] = stage_stack.get()
+        stage_stack.reset(self.token)
+        self.token = None
+        seconds: float = time.perf_counter() - frames[-1].start_time
+        if len(frames) > 1:
+            frames[-2].children_seconds += seconds
+        self.profiler.record(";".join(frame.name for frame in frames), seconds,
+                             max(seconds - frames[-1].children_seconds, 0.0))
+        return False
+
+
+class Profiler():
+    """Thread-safe profiler of the processing stages of a run. The inclusive time of a stage contains the time of its
+    nested stages, eg. the schema validation of a template within the template expansion, while the exclusive time does
+    not. Optionally, the run is profiled with cProfile as well, including the threads started while profiling, eg. the
+    workers of a parallel run or the poll scheduler."""
+
+    def __init__(self):
+        """Initialize the Profiler object"""
+
+        self.enabled: bool = False
+        self.stages: Dict[str, Dict[str, Any]] = {}     # Stage name -> calls, inclusive and exclusive seconds
+        self.stacks: Dict[str, float] = {}              # Collapsed stage stack -> exclusive seconds
+        self.cprofile: Optional[cProfile.Profile] = None
+        self.thread_cprofiles: List[cProfile.Profile] = []     # cProfile profiles of the threads started while enabled
+        self.lock = threading.Lock()
+
+    def enable(self, cprofile: bool = False) -> None:
+        """Reset the statistics and start profiling
+
+        Args:
+            cprofile (bool): If True, the calling thread and the threads started afterwards are profiled with cProfile
+                as well
+        """
+
+        with self.lock:
+            self.stages = {}
+            self.stacks = {}
+            self.thread_cprofiles = []
+        self.enabled = True
+        self.cprofile = None
+        if cprofile:
+            self.cprofile = cProfile.Profile()
+            self.cprofile.enable()
+            if sys.version_info < (3, 12):
+                # Before Python 3.12, cProfile only hooks the calling thread
+                threading.setprofile(self.start_thread_cprofile)
+
+    def start_thread_cprofile(self, *args: Any) -> None:
+        """Profile a new thread with cProfile. It is set as the initial profile function of the threads started while
+        profiling, and replaces itself with the cProfile profile on the first event of the thread
+
+        Args:
+            *args (Any): The frame, event and argument of the profile event
+        """
+
+        thread_cprofile = cProfile.Profile()
+        with self.lock:
+            self.thread_cprofiles.append(thread_cprofile)
+        thread_cprofile.enable()
+
+    def disable(self) -> None:
+        """Stop profiling. The threads still running at that time are profiled until they end"""
+
+        self.enabled = False
+        if self.cprofile is not None:
+            threading.setprofile(None)
+            self.cprofile.disable()
+
+    def stage(self, name: str) -> Stage:
+        """Time a stage
+
+        Args:
+            name (str): The stage name, eg. "yaml_load"
+
+        Returns:
+            (Stage): The context manager timing the stage
+        """
+
+        return Stage(self, name)
+
+    def record(self, stack: str, seconds: float, exclusive_seconds: float) -> None:
+        """Record a finished stage
+
+        Args:
+            stack (str): The names of the running stages separated by semicolons, the finished stage last
+            seconds (float): The inclusive time of the stage
+            exclusive_seconds (float): The time of the stage without its nested stages
+        """
+
+        name: str = stack.rsplit(";", 1)[-1]
+        with self.lock:
+            statistics: Dict[str, Any] = self.stages.setdefault(
+                name, {"calls": 0, "seconds": 0.0, "exclusive_seconds": 0.0})
+            statistics["calls"] += 1
+            statistics["seconds"] += seconds
+            statistics["exclusive_seconds"] += exclusive_seconds
+            self.stacks[stack] = self.stacks.get(stack, 0.0) + exclusive_seconds
+
+    def get_statistics(self) -> Dict[str, Dict[str, Any]]:
+        """Get the statistics of the stages
+
+        Returns:
+            (Dict[str, Dict[str, Any]]): The number of calls, inclusive and exclusive seconds of each stage, by
+                descending exclusive time
+        """
+
+        with self.lock:
+            return {name: dict(statistics) for name, statistics in
+                    sorted(self.stages.items(), key=lambda item: -item[1]["exclusive_seconds"])}
+
+    def write_collapsed(self, output_file: str) -> None:
+        """Write the exclusive time of the stage stacks in the collapsed stack format of the flame graph tools. The
+        times are written in microseconds
+
+        Args:
+            output_file (str): The path of the collapsed stack file
+        """
+
+        with self.lock:
+            lines = [f"{stack} {round(seconds * 1e6)}" for stack, seconds in sorted(self.stacks.items())]
+        with open(output_file, "w") as output:
+            output.write("\n".join(lines) + "\n")
+
+    def write_cprofile(self, output_file: str) -> None:
+        """Write the cProfile statistics of all the profiled threads, which can be read via the pstats module or
+        snakeviz
+
+        Args:
+            output_file (str): The path of the pstats file
+        """
+
+        if self.cprofile is not None:
+            statistics = pstats.Stats(self.cprofile)
+            with self.lock:
+                for thread_cprofile in self.thread_cprofiles:
+                    thread_cprofile.create_stats()
+                    if thread_cprofile.stats:
+                        statistics.add(thread_cprofile)
+            statistics.dump_stats(output_file)
+
+
+profiler = Profiler()
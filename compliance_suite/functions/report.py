@@ -3,10 +3,18 @@
 This module contains class definition for Report which will generate the report from each test case
 """
 
-from typing import Any
+import io
+import shutil
+from typing import (
+    Any,
+    Dict,
+    List
+)
 
 from ga4gh.testbed.report.report import Report as ReportBuilder
 
+from compliance_suite.functions.report_writer import ReportWriter
+
 
 class Report():
     """Class to generate the report and handle the internal tests and cases"""
@@ -16,6 +24,8 @@ class Report():
 
         self.platform_name = ""
         self.report = ReportBuilder()   # Object from the ga4gh-tested-lib
+        self.statistics: Dict = {}      # Run statistics added to the generated report
+        self.writer: Any = None         # Streams the finished phases instead of keeping them in memory
 
         self.initialize_report()
 
@@ -55,6 +65,50 @@ class Report():
         phase.set_phase_description(description)
         return phase
 
+    def extend_phases(self, report: "Report") -> None:
+        """Append the phases of another report, eg. the report buffer of a parallel worker
+
+        Args:
+            report (Report): The report whose phases are appended in their existing order
+        """
+
+        self.report.phases.extend(report.report.get_phases())
+
+    def set_stream(self, stream_file: str) -> None:
+        """Stream the phases of the finished test files to an NDJSON file instead of keeping them in memory
+
+        Args:
+            stream_file (str): The path of the NDJSON file
+        """
+
+        self.writer = ReportWriter(stream_file)
+
+    def add_test_result(self, test_number: int, yaml_file: str, status: str, report: "Report") -> None:
+        """Add the phases of a finished test file. The phases are streamed if a stream file is set, otherwise they are
+        appended to the report
+
+        Args:
+            test_number (int): The sequence number of the test
+            yaml_file (str): The path to the YAML test file
+            status (str): The test status key, one of "passed", "failed" or "skipped"
+            report (Report): The report buffer containing the phases of the test file
+        """
+
+        if self.writer is not None:
+            self.writer.write_result(test_number, yaml_file, status, report.report.get_phases())
+        else:
+            self.extend_phases(report)
+
+    def add_statistics(self, name: str, statistics: Any) -> None:
+        """Add run statistics which are not part of the test results, eg. connection reuse counters
+
+        Args:
+            name (str): The statistics name under which it is listed in the report
+            statistics (Any): The JSON serializable statistics
+        """
+
+        self.statistics[name] = statistics
+
     def generate(self) -> Any:
         """Calculate the statuses and generate a JSON report
 
@@ -62,9 +116,46 @@ class Report():
             (Any): Returns the final JSON report in pretty format
         """
 
+        if self.writer is not None:
+            output = io.StringIO()
+            self.write_output(output)
+            return output.getvalue()
+
         self.report.finalize()
+        if self.statistics:
+            self.report.statistics = self.statistics
         return self.report.to_json(True)
 
+    def write_output(self, output: Any) -> None:
+        """Write the JSON report of the streamed phases
+
+        Args:
+            output (Any): The file object to write the JSON report
+        """
+
+        if self.statistics:
+            self.report.statistics = self.statistics
+        self.writer.write_report(self.report, output)
+
+    def write(self, output_files: List[str]) -> None:
+        """Write the JSON report to the output files. The streamed phases are copied from the stream file one at a
+        time, so that the complete report is not held in memory
+
+        Args:
+            output_files (List[str]): The paths of the JSON report files
+        """
+
+        if not output_files:
+            return
+
+        with open(output_files[0], "w+") as output:
+            if self.writer is not None:
+                self.write_output(output)
+            else:
+                output.write(self.generate())
+        for output_file in output_files[1:]:
+            shutil.copyfile(output_files[0], output_file)
+
 
 class ReportUtility():
     """Utility class for Report to set the tests and cases"""
@@ -98,6 +189,18 @@ class ReportUtility():
         case.set_case_name(name)
         case.set_case_description(description)
 
+    @staticmethod
+    def set_case_metadata(case: Any, metadata: Dict[str, Any]) -> None:
+        """Attach metadata to the case, eg. the timing of the HTTP exchanges validated by the case. The metadata is
+        serialized along with the case
+
+        Args:
+            case (Any): The case object to attach the metadata to
+            metadata (Dict[str, Any]): The JSON serializable metadata
+        """
+
+        case.metadata = metadata
+
     @staticmethod
     def set_test(test: Any, name: str, description: str) -> None:
         """Set the test details
@@ -0,0 +1,163 @@
+"""Module compliance_suite.functions.report_writer.py
+
+This module contains class definition for the report writer which streams the finished report phases to an NDJSON
+file and assembles the final JSON report from it
+"""
+
+import json
+from typing import (
+    Any,
+    Dict,
+    IO,
+    Iterator,
+    List
+)
+
+from ga4gh.testbed.report.report import Report as ReportBuilder
+from ga4gh.testbed.report.status import Status
+from ga4gh.testbed.report.summary import Summary
+
+# Summary counter incremented per case status, as in the report finalization of the ga4gh-testbed-lib
+SUMMARY_COUNTERS: Dict[Status, str] = {
+    Status.UNKNOWN: "increment_unknown",
+    Status.PASS: "increment_passed",
+    Status.WARN: "increment_warned",
+    Status.FAIL: "increment_failed",
+    Status.SKIP: "increment_skipped"
+}
+
+
+def serialize(component: Any) -> Any:
+    """JSON serializer of the ga4gh-testbed-lib report components
+
+    Args:
+        component (Any): The report component which is not JSON serializable by default
+
+    Returns:
+        (Any): The attributes of the report component
+    """
+
+    return component.__dict__
+
+
+def set_status_from_summary(component: Any) -> None:
+    """Set the status of a report component from its summary, with the rules of the report finalization of the
+    ga4gh-testbed-lib
+
+    Args:
+        component (Any): The report, phase or test whose summary is complete
+    """
+
+    summary: Summary = component.get_summary()
+    if summary.get_failed() > 0:
+        component.set_status_fail()
+    elif summary.get_unknown() > 0:
+        component.set_status_unknown()
+    elif summary.get_warned() > 0:
+        component.set_status_warn()
+    elif summary.get_skipped() == summary.get_total():
+        component.set_status_skip()
+    elif summary.get_passed() + summary.get_skipped() == summary.get_total():
+        component.set_status_pass()
+
+
+def finalize_phase(phase: Any) -> None:
+    """Summarize a report phase and set the statuses of the phase and its tests from the statuses of their cases, as
+    the report finalization of the ga4gh-testbed-lib does for all the phases at once
+
+    Args:
+        phase (Any): The report phase whose summary is empty
+    """
+
+    for test in phase.get_tests():
+        for case in test.get_cases():
+            getattr(test.get_summary(), SUMMARY_COUNTERS[case.get_status()])()
+        set_status_from_summary(test)
+        phase.get_summary().aggregate_summary(test.get_summary())
+    set_status_from_summary(phase)
+
+
+class ReportWriter():
+    """Streams each finished test file to an NDJSON file, one line per test file containing its finalized phases.
+    The phases are released after being written, so that the memory does not grow with the number of test files. The
+    NDJSON file is usable as partial results if the run is interrupted."""
+
+    def __init__(self, stream_file: str):
+        """Initialize the Report Writer object. An existing stream file is overwritten
+
+        Args:
+            stream_file (str): The path of the NDJSON file
+        """
+
+        self.stream_file: str = stream_file
+        self.stream: IO = open(stream_file, "w")
+        self.summary = Summary()        # Aggregated summary of the streamed phases
+
+    def write_result(self, test_number: int, yaml_file: str, status: str, phases: List[Any]) -> None:
+        """Finalize the phases of a test file and append them to the NDJSON file
+
+        Args:
+            test_number (int): The sequence number of the test
+            yaml_file (str): The path to the YAML test file
+            status (str): The test status key, one of "passed", "failed" or "skipped"
+            phases (List[Any]): The report phases of the test file
+        """
+
+        for phase in phases:
+            finalize_phase(phase)
+            self.summary.aggregate_summary(phase.get_summary())
+
+        line: Dict[str, Any] = {"test": test_number, "file": yaml_file, "status": status, "phases": phases}
+        self.stream.write(json.dumps(line, default=serialize, separators=(",", ":")) + "\n")
+        self.stream.flush()
+
+    def close(self) -> None:
+        """Close the NDJSON file"""
+
+        if not self.stream.closed:
+            self.stream.close()
+
+    def read_phases(self) -> Iterator[Dict[str, Any]]:
+        """Read back the streamed phases in their written order, one test file at a time
+
+        Returns:
+            (Iterator[Dict[str, Any]]): The JSON phases
+        """
+
+        with open(self.stream_file, "r") as stream:
+            for line in stream:
+                if line.strip():
+                    yield from json.loads(line)["phases"]
+
+    def write_report(self, report: ReportBuilder, output: IO) -> None:
+        """Write the final JSON report. The report attributes are taken from the report builder whose phases were
+        streamed, and the phases are copied from the NDJSON file one at a time. The output is identical to the pretty
+        report of the ga4gh-testbed-lib.
+
+        Args:
+            report (ReportBuilder): The report builder without phases
+            output (IO): The file object to write the JSON report
+        """
+
+        self.close()
+        report.summary = Summary()
+        report.summary.aggregate_summary(self.summary)
+        set_status_from_summary(report)
+        document: Dict[str, Any] = json.loads(json.dumps(report, default=serialize))
+
+        output.write("{")
+        for position, (key, value) in enumerate(document.items()):
+            output.write(",\n    " if position else "\n    ")
+            output.write(json.dumps(key) + ": ")
+            if key != "phases":
+                output.write(json.dumps(value, indent=4).replace("\n", "\n    "))
+                continue
+
+            output.write("[")
+            phases_count: int = 0
+            for phase in self.read_phases():
+                output.write(",\n        " if phases_count else "\n        ")
+                output.write(json.dumps(phase, indent=4).replace("\n", "\n        "))
+                phases_count += 1
+            output.write("\n    ]" if phases_count else "]")
+        output.write("\n}")
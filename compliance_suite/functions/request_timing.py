@@ -0,0 +1,132 @@
+"""Module compliance_suite.functions.request_timing.py
+
+This module contains the timed HTTP adapter and the functions to time the HTTP exchanges with the server
+"""
+
+import threading
+import time
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Tuple
+)
+
+from requests.adapters import HTTPAdapter
+from requests.models import Response
+from urllib3.connection import (
+    HTTPConnection,
+    HTTPSConnection
+)
+from urllib3.connectionpool import (
+    HTTPConnectionPool,
+    HTTPSConnectionPool
+)
+
+connect_timer = threading.local()     # Seconds spent in opening connections by the requests of the current thread
+
+
+def reset_connect_seconds() -> None:
+    """Reset the connection time of the current thread, before a request is sent"""
+
+    connect_timer.seconds = 0.0
+
+
+def get_connect_seconds() -> float:
+    """Get the connection time of the current thread
+
+    Returns:
+        (float): The seconds spent in opening connections since the last reset. 0 if the connections were reused
+    """
+
+    return getattr(connect_timer, "seconds", 0.0)
+
+
+class TimedHTTPConnection(HTTPConnection):
+    """HTTP connection recording the time spent in opening it"""
+
+    def connect(self) -> None:
+        """Open the connection and add its duration to the connection time of the current thread"""
+
+        start_time: float = time.perf_counter()
+        try:
+            super().connect()
+        finally:
+            connect_timer.seconds = get_connect_seconds() + time.perf_counter() - start_time
+
+
+class TimedHTTPSConnection(HTTPSConnection):
+    """HTTPS connection recording the time spent in opening it, including the TLS handshake"""
+
+    def connect(self) -> None:
+        """Open the connection and add its duration to the connection time of the current thread"""
+
+        start_time: float = time.perf_counter()
+        try:
+            super().connect()
+        finally:
+            connect_timer.seconds = get_connect_seconds() + time.perf_counter() - start_time
+
+
+class TimedHTTPConnectionPool(HTTPConnectionPool):
+    """HTTP connection pool opening timed connections"""
+
+    ConnectionCls = TimedHTTPConnection
+
+
+class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    """HTTPS connection pool opening timed connections"""
+
+    ConnectionCls = TimedHTTPSConnection
+
+
+class TimedHTTPAdapter(HTTPAdapter):
+    """HTTP adapter whose connection pools record the time spent in opening the connections"""
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the pool manager with the timed connection pools
+
+        Args:
+            args (Any): The positional arguments of the requests HTTP adapter
+            kwargs (Any): The keyword arguments of the requests HTTP adapter
+        """
+
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": TimedHTTPConnectionPool,
+            "https": TimedHTTPSConnectionPool
+        }
+
+
+def time_request(send: Callable[..., Response], url: str, **kwargs: Any) -> Tuple[Response, Dict[str, Any]]:
+    """Send a request and time the HTTP exchange. The connection time is only measured for the sessions mounting the
+    timed HTTP adapter, otherwise it is included in the time to first byte
+
+    Args:
+        send (Callable[..., Response]): The session method sending the request, eg. session.get
+        url (str): The request URL
+        kwargs (Any): The keyword arguments of the request
+
+    Returns:
+        (Tuple[Response, Dict[str, Any]]): The response, and the seconds spent in opening the connection, until the
+            response headers are received after connecting and in total, with the response size in bytes. The size of
+            a streamed response is its Content-Length, as its body is not read here
+    """
+
+    reset_connect_seconds()
+    start_time: float = time.perf_counter()
+    response = send(url, **kwargs)
+    total: float = time.perf_counter() - start_time
+    connect: float = get_connect_seconds()
+    if kwargs.get("stream"):
+        size: int = int(response.headers.get("Content-Length") or 0)
+    else:
+        size: int = len(response.content or b"")
+    timing: Dict[str, Any] = {
+        "url": url,
+        "connect": connect,
+        "ttfb": max(float(response.elapsed.total_seconds()) - connect, 0.0),
+        "total": total,
+        "bytes": size
+    }
+    return response, timing
@@ -0,0 +1,152 @@
+"""Module compliance_suite.functions.result_cache.py
+
+This module contains class definition for the result cache which stores the report phases of the passed test files,
+so that unchanged test files are not run again
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+import threading
+import time
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    Tuple
+)
+
+from ga4gh.testbed.report.phase import Phase
+
+from compliance_suite.constants.constants import (
+    RESULT_CACHE_BYTES,
+    RESULT_CACHE_SIZE,
+    RESULT_CACHE_TTL
+)
+from compliance_suite.functions.checkpoint import load_component
+from compliance_suite.functions.report_writer import serialize
+
+
+class ResultCache():
+    """On-disk content-addressed cache of the passed test files. An entry is keyed by the server, version, resolved
+    test file and the service info of the server, so that any change to them is a cache miss. The entries expire after
+    the TTL and the oldest entries are evicted once the cache exceeds its number of entries or its serialized size"""
+
+    def __init__(self, cache_directory: str, ttl: float = RESULT_CACHE_TTL, max_entries: int = RESULT_CACHE_SIZE,
+                 max_bytes: int = RESULT_CACHE_BYTES):
+        """Initialize the Result Cache object
+
+        Args:
+            cache_directory (str): The directory storing one JSON file per cached result
+            ttl (float): The seconds after which a cached result is not reused
+            max_entries (int): The maximum number of cached results
+            max_bytes (int): The maximum total size of the cached result files in bytes
+        """
+
+        self.cache_directory = Path(cache_directory)
+        self.ttl: float = ttl
+        self.max_entries: int = max_entries
+        self.max_bytes: int = max_bytes
+        self.lock = threading.Lock()
+        self.statistics: Dict[str, int] = {
+            "hits": 0,
+            "misses": 0,
+            "stored": 0,
+            "evicted": 0
+        }
+
+    @staticmethod
+    def get_key(server: str, version: str, test_data: Any, service_info: Any) -> str:
+        """Get the content address of a test file result
+
+        Args:
+            server (str): The server URL
+            version (str): The version of the run
+            test_data (Any): The test file data with the resolved jobs
+            service_info (Any): The service info response of the server
+
+        Returns:
+            (str): The SHA-256 digest of the key components
+        """
+
+        key_data: str = json.dumps([server, version, test_data, service_info], sort_keys=True, default=str)
+        return hashlib.sha256(key_data.encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[List[Any]]:
+        """Get the report phases of a cached passed result. An expired result is removed
+
+        Args:
+            key (str): The content address of the result
+
+        Returns:
+            (Optional[List[Any]]): The restored report phases, None if there is no recent result
+        """
+
+        entry_file: Path = self.cache_directory / f"{key}.json"
+        with self.lock:
+            try:
+                with open(entry_file, "r") as f:
+                    entry: Dict[str, Any] = json.load(f)
+            except (OSError, ValueError):
+                self.statistics["misses"] += 1
+                return None
+
+            if time.time() - entry["created"] > self.ttl:
+                entry_file.unlink(missing_ok=True)
+                self.statistics["misses"] += 1
+                self.statistics["evicted"] += 1
+                return None
+            self.statistics["hits"] += 1
+        return [load_component(Phase(), phase) for phase in entry["phases"]]
+
+    def put(self, key: str, phases: List[Any]) -> None:
+        """Store the report phases of a passed result and evict the oldest results above the cache size
+
+        Args:
+            key (str): The content address of the result
+            phases (List[Any]): The report phases of the passed test file
+        """
+
+        with self.lock:
+            self.cache_directory.mkdir(parents=True, exist_ok=True)
+            entry_file: Path = self.cache_directory / f"{key}.json"
+            temp_file: Path = self.cache_directory / f"{key}.tmp"
+            with open(temp_file, "w") as f:
+                json.dump({"created": time.time(), "phases": phases}, f, default=serialize)
+            os.replace(temp_file, entry_file)
+            self.statistics["stored"] += 1
+            self.evict()
+
+    def evict(self) -> None:
+        """Remove the oldest results above the number of entries or the total size of the cache"""
+
+        entries: List[Tuple[float, int, Path]] = []
+        for entry_file in self.cache_directory.glob("*.json"):
+            try:
+                entry_stat: os.stat_result = entry_file.stat()
+            except OSError:
+                continue
+            entries.append((entry_stat.st_mtime, entry_stat.st_size, entry_file))
+        entries.sort(key=lambda entry: entry[0])
+
+        total_bytes: int = sum(entry[1] for entry in entries)
+        entries_count: int = len(entries)
+        for _, size, entry_file in entries:
+            if entries_count <= self.max_entries and total_bytes <= self.max_bytes:
+                break
+            entry_file.unlink(missing_ok=True)
+            entries_count -= 1
+            total_bytes -= size
+            self.statistics["evicted"] += 1
+
+    def get_statistics(self) -> Dict[str, int]:
+        """Get the result cache counters
+
+        Returns:
+            (Dict[str, int]): The number of reused, missed, stored and evicted results
+        """
+
+        with self.lock:
+            return dict(self.statistics)
@@ -0,0 +1,89 @@
+"""Module compliance_suite.functions.run_metrics.py
+
+This module contains class definition for the run metrics which count the live test, polling and transfer activity of a
+run
+"""
+
+import threading
+from typing import (
+    Any,
+    Dict
+)
+
+
+class RunMetrics():
+    """Thread-safe counters of the live activity of a run which are not part of the report, eg. the polling jobs in
+    flight. The counters are shared by the Test Runners of the run and exposed by the metrics server."""
+
+    def __init__(self):
+        """Initialize the Run Metrics object"""
+
+        self.finished_tests: Dict[str, int] = {     # Test status key -> test files finished with it
+            "passed": 0,
+            "failed": 0,
+            "skipped": 0
+        }
+        self.polls_in_flight: int = 0
+        self.poll_retries: int = 0          # Polling requests sent after the first one of a polling job
+        self.response_bytes: Dict[str, int] = {}    # Request key -> response bytes received
+        self.lock = threading.Lock()
+
+    def add_finished_test(self, status: str) -> None:
+        """Count a finished test file as soon as it finishes, irrespective of the order in which the test files are
+        merged in the report
+
+        Args:
+            status (str): The test status key, one of "passed", "failed" or "skipped"
+        """
+
+        with self.lock:
+            self.finished_tests[status] = self.finished_tests.get(status, 0) + 1
+
+    def start_poll(self) -> None:
+        """Count a polling job in flight"""
+
+        with self.lock:
+            self.polls_in_flight += 1
+
+    def finish_poll(self) -> None:
+        """Count a finished polling job"""
+
+        with self.lock:
+            self.polls_in_flight -= 1
+
+    def add_poll_retries(self, retries: int) -> None:
+        """Add the polling requests of a polling job sent after the first one
+
+        Args:
+            retries (int): The number of polling retries
+        """
+
+        with self.lock:
+            self.poll_retries += retries
+
+    def add_response_bytes(self, key: str, size: int) -> None:
+        """Add the size of a response
+
+        Args:
+            key (str): The request operation and endpoint template, eg. "GET /tasks/{id}"
+            size (int): The response size in bytes
+        """
+
+        with self.lock:
+            self.response_bytes[key] = self.response_bytes.get(key, 0) + size
+
+    def get_snapshot(self) -> Dict[str, Any]:
+        """Get a consistent copy of the counters
+
+        Returns:
+            (Dict[str, Any]): The finished test files per status, the polling jobs in flight, the polling retries and
+                the response bytes per request key
+        """
+
+        with self.lock:
+            return {
+                "finished_tests": dict(self.finished_tests),
+                "polls_in_flight": self.polls_in_flight,
+                "poll_retries": self.poll_retries,
+                "response_bytes": dict(self.response_bytes)
+            }
@@ -0,0 +1,148 @@
+"""Module compliance_suite.functions.schema_validator.py
+
+This module contains class definition for the schema validator registry which loads the YAML test and template JSON
+schemas once and validates the YAML files against them
+"""
+
+import json
+from pathlib import Path
+import threading
+import time
+import tracemalloc
+from typing import (
+    Any,
+    Dict,
+    Optional,
+    Tuple
+)
+
+from jsonschema import (
+    Draft4Validator,
+    RefResolver,
+    ValidationError
+)
+from jsonschema.exceptions import best_match
+
+from compliance_suite.constants.constants import (
+    TEMPLATE,
+    TEST
+)
+
+SCHEMA_DIRECTORY: Path = Path(__file__).resolve().parent.parent / "schemas"
+SCHEMA_FILES: Dict[str, str] = {
+    TEST: "test_schema.json",
+    TEMPLATE: "template_schema.json"
+}
+COMMON_SCHEMA_FILE: str = "common_schema.json"
+
+
+class SchemaValidatorRegistry():
+    """Registry of the validators for the YAML test and template schemas. The schemas are read from the package
+    resources and checked once. The common schema is preloaded into the reference resolvers, so that no schema file is
+    read while validating. As the reference resolver scope is not thread-safe, each thread validates with its own
+    validators, built from the loaded schemas"""
+
+    def __init__(self, schema_directory: Path = SCHEMA_DIRECTORY):
+        """Initialize the Schema Validator Registry object
+
+        Args:
+            schema_directory (Path): The directory containing the JSON schemas
+        """
+
+        self.schema_directory: Path = schema_directory
+        self.schemas: Dict[str, Tuple[str, Dict]] = {}      # Schema type -> base URI and checked schema
+        self.store: Dict[str, Dict] = {}                    # Common schema URI -> common schema
+        self.local = threading.local()                      # Validators of the current thread
+        self.lock = threading.Lock()                        # Guards the schema loading and the counters
+        self.statistics: Dict[str, Any] = {
+            "load_seconds": 0.0,
+            "load_bytes": 0,
+            "validations": 0,
+            "validation_seconds": 0.0,
+            "validation_bytes": 0
+        }
+
+    def read_schema(self, schema_file: str) -> Dict:
+        """Read a JSON schema from the schema directory
+
+        Args:
+            schema_file (str): The JSON schema file name
+
+        Returns:
+            (Dict): The JSON schema
+        """
+
+        with open(self.schema_directory / schema_file, "r") as f:
+            return json.load(f)
+
+    def load(self) -> None:
+        """Read and check the schemas"""
+
+        start_time: float = time.perf_counter()
+        start_memory: int = tracemalloc.get_traced_memory()[0]
+
+        common_schema: Dict = self.read_schema(COMMON_SCHEMA_FILE)
+        Draft4Validator.check_schema(common_schema)
+        self.store = {(self.schema_directory / COMMON_SCHEMA_FILE).as_uri(): common_schema}
+        for _type, schema_file in SCHEMA_FILES.items():
+            schema: Dict = self.read_schema(schema_file)
+            Draft4Validator.check_schema(schema)
+            self.schemas[_type] = ((self.schema_directory / schema_file).as_uri(), schema)
+
+        self.statistics["load_seconds"] += time.perf_counter() - start_time
+        self.statistics["load_bytes"] += tracemalloc.get_traced_memory()[0] - start_memory
+
+    def get_validator(self, _type: str) -> Draft4Validator:
+        """Get the validator of the current thread for the schema type. The schemas are loaded on first use
+
+        Args:
+            _type (str): The type of YAML file, either "Test" or "Template"
+
+        Returns:
+            (Draft4Validator): The schema validator
+        """
+
+        with self.lock:
+            if not self.schemas:
+                self.load()
+        validators: Dict[str, Draft4Validator] = getattr(self.local, "validators", {})
+        if _type not in validators:
+            base_uri, schema = self.schemas[_type]
+            resolver = RefResolver(base_uri, schema, store=dict(self.store))
+            validators[_type] = Draft4Validator(schema, resolver=resolver)
+            self.local.validators = validators
+        return validators[_type]
+
+    def validate(self, yaml_data: Any, _type: str) -> None:
+        """Validate the YAML data against the schema type
+
+        Args:
+            yaml_data (Any): The loaded YAML data
+            _type (str): The type of YAML file, either "Test" or "Template"
+
+        Raises:
+            (ValidationError): The best matching validation error, if the YAML data does not match the schema
+        """
+
+        validator: Draft4Validator = self.get_validator(_type)
+        start_time: float = time.perf_counter()
+        start_memory: int = tracemalloc.get_traced_memory()[0]
+        try:
+            error: Optional[ValidationError] = best_match(validator.iter_errors(yaml_data))
+            if error is not None:
+                raise error
+        finally:
+            with self.lock:
+                self.statistics["validations"] += 1
+                self.statistics["validation_seconds"] += time.perf_counter() - start_time
+                self.statistics["validation_bytes"] += max(tracemalloc.get_traced_memory()[0] - start_memory, 0)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get the schema loading and validation counters. The memory counters are only collected while tracemalloc
+        is tracing, and include the allocations of the other threads validating at the same time
+
+        Returns:
+            (Dict[str, Any]): The time and memory spent in loading the schemas and validating the YAML files
+        """
+
+        return dict(self.statistics)
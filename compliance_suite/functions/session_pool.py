@@ -0,0 +1,98 @@
+"""Module compliance_suite.functions.session_pool.py
+
+This module contains class definition for the session pool which shares keep-alive HTTP sessions across a run
+"""
+
+import threading
+from typing import Dict
+from urllib.parse import urlsplit
+
+import requests
+
+from compliance_suite.functions.request_timing import TimedHTTPAdapter
+
+
+class SessionPool():
+    """Run-scoped pool of keep-alive HTTP sessions. One session is created per server, so that every request and
+    polling iteration to the server reuses the open TCP/TLS connections instead of opening new ones. The sessions
+    record the time spent in opening the connections"""
+
+    def __init__(self, pool_size: int = 10):
+        """Initialize the Session Pool object
+
+        Args:
+            pool_size (int): The maximum number of connections kept alive per server
+        """
+
+        self.pool_size: int = pool_size
+        self.sessions: Dict[str, requests.Session] = {}
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def get_server_key(server: str) -> str:
+        """Get the key identifying the connection target of the server URL
+
+        Args:
+            server (str): The server URL
+
+        Returns:
+            (str): The scheme and network location of the server URL
+        """
+
+        url = urlsplit(server)
+        return f"{url.scheme}://{url.netloc}"
+
+    def get_session(self, server: str) -> requests.Session:
+        """Get the session for the server. The session is created on first use
+
+        Args:
+            server (str): The server URL to send the requests
+
+        Returns:
+            (requests.Session): The keep-alive session for the server
+        """
+
+        key: str = self.get_server_key(server)
+        with self.lock:
+            if key not in self.sessions:
+                session = requests.Session()
+                adapter = TimedHTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                self.sessions[key] = session
+            return self.sessions[key]
+
+    def get_statistics(self) -> Dict[str, Dict[str, int]]:
+        """Get the connection reuse counters of each server
+
+        Returns:
+            (Dict[str, Dict[str, int]]): The number of requests sent, connections opened and connections reused per
+                server
+        """
+
+        statistics: Dict[str, Dict[str, int]] = {}
+        with self.lock:
+            for key, session in self.sessions.items():
+                requests_count: int = 0
+                connections_count: int = 0
+                for adapter in set(session.adapters.values()):
+                    pools = adapter.poolmanager.pools
+                    for pool_key in pools.keys():
+                        pool = pools.get(pool_key)
+                        if pool is not None:
+                            requests_count += pool.num_requests
+                            connections_count += pool.num_connections
+                statistics[key] = {
+                    "requests": requests_count,
+                    "connections": connections_count,
+                    "reused": requests_count - connections_count
+                }
+        return statistics
+
+    def close(self) -> None:
+        """Close all the sessions and their open connections"""
+
+        with self.lock:
+            for session in self.sessions.values():
+                session.close()
+            self.sessions = {}
@@ -0,0 +1,77 @@
+"""Module compliance_suite.functions.template_cache.py
+
+This module contains class definition for the template cache which parses and validates each YAML template file once
+per run
+"""
+
+import os
+from pathlib import Path
+import threading
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Tuple
+)
+
+from compliance_suite.exceptions.compliance_exception import JobValidationException
+
+
+class TemplateCache():
+    """Run-scoped cache of the parsed and validated YAML templates. The entries are keyed by the template path and
+    its modification time, so that an edited template is parsed again. The cached data is shared by all the
+    references and must not be modified, the references instantiate a copy of it"""
+
+    def __init__(self):
+        """Initialize the Template Cache object"""
+
+        self.templates: Dict[str, Tuple[int, Any]] = {}     # Path -> (modification time, template data)
+        self.lock = threading.Lock()
+        self.statistics: Dict[str, int] = {
+            "hits": 0,
+            "misses": 0
+        }
+
+    def get(self, template_file: str, loader: Callable[[str], Any]) -> Any:
+        """Get the parsed template data. The template is loaded on first use or if it was modified
+
+        Args:
+            template_file (str): The path of the YAML template file
+            loader (Callable[[str], Any]): The function loading and validating the template file
+
+        Returns:
+            (Any): The cached template data
+
+        Raises:
+            (JobValidationException): If the template file does not exist
+        """
+
+        key: str = str(Path(template_file).resolve())
+        try:
+            mtime: int = os.stat(key).st_mtime_ns
+        except OSError as err:
+            raise JobValidationException(name="Template Error",
+                                         message=f"Template file {template_file} not found",
+                                         details=err)
+        with self.lock:
+            entry = self.templates.get(key)
+            if entry is not None and entry[0] == mtime:
+                self.statistics["hits"] += 1
+                return entry[1]
+
+        # Load outside the lock, so that the other templates can be served meanwhile
+        template_data: Any = loader(template_file)
+        with self.lock:
+            self.templates[key] = (mtime, template_data)
+            self.statistics["misses"] += 1
+        return template_data
+
+    def get_statistics(self) -> Dict[str, int]:
+        """Get the template cache counters
+
+        Returns:
+            (Dict[str, int]): The number of template references served from the cache and loaded from file
+        """
+
+        with self.lock:
+            return dict(self.statistics)
@@ -0,0 +1,186 @@
+"""Module compliance_suite.functions.test_plan.py
+
+This module contains class definition for the test plan which stores the discovered, validated and resolved test files
+in a single compressed file, so that a run can skip the YAML parsing, schema validation and template resolution
+"""
+
+import copy
+import json
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional
+)
+import zlib
+
+from compliance_suite.constants.constants import (
+    TEMPLATE,
+    TEST,
+    TEST_PLAN_FORMAT
+)
+from compliance_suite.exceptions.compliance_exception import JobValidationException
+
+
+class TestPlan():
+    """Compiled test files in the run order. A test file is stored with its validated YAML data and resolved sub-jobs,
+    or with the exception raised while loading or resolving it, so that a run from the plan reports the same failures
+    as a run from the YAML files. The referenced templates are stored as well for the fixtures. The plan is written as
+    zlib compressed JSON."""
+
+    def __init__(self):
+        """Initialize the Test Plan object"""
+
+        self.tests: List[Dict[str, Any]] = []               # Test file, YAML data, sub-jobs or error, in run order
+        self.test_index: Dict[str, Dict[str, Any]] = {}     # Test file -> test entry
+        self.templates: Dict[str, Any] = {}                 # Template reference -> validated YAML data
+
+    @staticmethod
+    def get_error(err: JobValidationException) -> Dict[str, str]:
+        """Serialize the exception raised for a test file
+
+        Args:
+            err (JobValidationException): The exception
+
+        Returns:
+            (Dict[str, str]): The exception name, message and details
+        """
+
+        return {"name": err.name, "message": err.message, "details": None if err.details is None else str(err.details)}
+
+    def add_test(self, yaml_file: str, yaml_data: Optional[Dict] = None, jobs: Optional[List[Dict]] = None,
+                 err: Optional[JobValidationException] = None) -> None:
+        """Add a compiled test file
+
+        Args:
+            yaml_file (str): The path of the test file
+            yaml_data (Optional[Dict]): The validated YAML data. None if the test file is invalid
+            jobs (Optional[List[Dict]]): The resolved sub-jobs. None if the test file or a template is invalid
+            err (Optional[JobValidationException]): The exception raised while loading or resolving the test file
+        """
+
+        entry: Dict[str, Any] = {"file": yaml_file, "data": yaml_data, "jobs": jobs,
+                                 "error": None if err is None else self.get_error(err)}
+        self.tests.append(entry)
+        self.test_index[yaml_file] = entry
+
+    def add_template(self, reference: str, yaml_data: Dict) -> None:
+        """Add a validated template
+
+        Args:
+            reference (str): The template reference, eg. "./templates/create_task_template.yml"
+            yaml_data (Dict): The validated YAML data of the template
+        """
+
+        self.templates[reference] = yaml_data
+
+    def get_files(self) -> List[str]:
+        """Get the test files
+
+        Returns:
+            (List[str]): The paths of the test files in the run order
+        """
+
+        return [entry["file"] for entry in self.tests]
+
+    def contains(self, yaml_file: str, _type: str) -> bool:
+        """Check if a test file or template is compiled in the plan
+
+        Args:
+            yaml_file (str): The path of the test file or the template reference
+            _type (str): The type of YAML file, either "Test" or "Template"
+
+        Returns:
+            (bool): True if the plan contains the YAML file
+        """
+
+        return yaml_file in (self.test_index if _type == TEST else self.templates)
+
+    def raise_error(self, error: Dict[str, str]) -> None:
+        """Raise the exception stored for a test file
+
+        Args:
+            error (Dict[str, str]): The stored exception name, message and details
+
+        Raises:
+            (JobValidationException): The stored exception
+        """
+
+        raise JobValidationException(name=error["name"], message=error["message"], details=error["details"])
+
+    def get_data(self, yaml_file: str, _type: str) -> Dict:
+        """Get the validated YAML data of a test file or template
+
+        Args:
+            yaml_file (str): The path of the test file or the template reference
+            _type (str): The type of YAML file, either "Test" or "Template"
+
+        Returns:
+            (Dict): The validated YAML data
+
+        Raises:
+            (JobValidationException): If the test file was invalid when the plan was compiled
+        """
+
+        if _type == TEMPLATE:
+            return self.templates[yaml_file]
+        entry: Dict[str, Any] = self.test_index[yaml_file]
+        if entry["data"] is None:
+            self.raise_error(entry["error"])
+        return entry["data"]
+
+    def get_jobs(self, yaml_file: str) -> List[Dict]:
+        """Get a copy of the resolved sub-jobs of a test file. The sub-jobs are copied, as the Test Runner replaces
+        their storage variables
+
+        Args:
+            yaml_file (str): The path of the test file
+
+        Returns:
+            (List[Dict]): The resolved sub-jobs
+
+        Raises:
+            (JobValidationException): If a template of the test file was invalid when the plan was compiled
+        """
+
+        entry: Dict[str, Any] = self.test_index[yaml_file]
+        if entry["jobs"] is None:
+            self.raise_error(entry["error"])
+        return copy.deepcopy(entry["jobs"])
+
+    def write(self, plan_file: str) -> None:
+        """Write the plan
+
+        Args:
+            plan_file (str): The path of the plan file
+        """
+
+        plan: Dict[str, Any] = {"format": TEST_PLAN_FORMAT, "tests": self.tests, "templates": self.templates}
+        with open(plan_file, "wb") as output:
+            output.write(zlib.compress(json.dumps(plan, separators=(",", ":"), default=str).encode(), 9))
+
+    def load(self, plan_file: str) -> None:
+        """Load a plan written by the compile command
+
+        Args:
+            plan_file (str): The path of the plan file
+
+        Raises:
+            (JobValidationException): If the file is not a plan, or a plan of another format
+        """
+
+        try:
+            with open(plan_file, "rb") as plan_input:
+                plan: Any = json.loads(zlib.decompress(plan_input.read()))
+        except (OSError, zlib.error, ValueError) as err:
+            raise JobValidationException(name="Invalid Test Plan",
+                                         message=f"The test plan {plan_file} cannot be read",
+                                         details=err)
+        if not isinstance(plan, dict) or plan.get("format") != TEST_PLAN_FORMAT:
+            raise JobValidationException(name="Invalid Test Plan",
+                                         message=f"The test plan {plan_file} was compiled in another format. "
+                                                 f"Compile it again",
+                                         details=None)
+        self.tests = plan["tests"]
+        self.test_index = {entry["file"]: entry for entry in self.tests}
+        self.templates = plan["templates"]
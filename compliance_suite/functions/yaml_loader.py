@@ -0,0 +1,89 @@
+"""Module compliance_suite.functions.yaml_loader.py
+
+This module contains class definition for the YAML loader of the test and template files, which parses them with the
+libyaml bindings of PyYAML if available and records the time spent
+"""
+
+import os
+import threading
+import time
+from typing import (
+    Any,
+    Dict
+)
+
+import yaml
+
+from compliance_suite.constants.constants import YAML_BULK_READ_SIZE
+
+# The libyaml parser is about ten times faster than the pure Python one, and builds the same data for the safe subset
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+YAML_PARSER = "python" if YAML_LOADER is yaml.SafeLoader else "libyaml"
+
+
+def load_yaml_string(yaml_string: str) -> Any:
+    """Parse a YAML document with the safe loader
+
+    Args:
+        yaml_string (str): The YAML document
+
+    Returns:
+        (Any): The parsed data
+
+    Raises:
+        (yaml.YAMLError): If the document is not valid YAML
+    """
+
+    return yaml.load(yaml_string, Loader=YAML_LOADER)
+
+
+class YamlLoader():
+    """Thread-safe loader of the YAML files. A file is read at once if it is small, otherwise it is streamed to the
+    parser, and it is closed as soon as it is parsed, so that parallel runs do not keep file handles open"""
+
+    def __init__(self):
+        """Initialize the YAML Loader object"""
+
+        self.parser: str = YAML_PARSER
+        self.lock = threading.Lock()
+        self.statistics: Dict[str, Any] = {
+            "files": 0,
+            "bytes": 0,
+            "seconds": 0.0
+        }
+
+    def load(self, yaml_file: str) -> Any:
+        """Load a YAML file
+
+        Args:
+            yaml_file (str): The path of the YAML file
+
+        Returns:
+            (Any): The parsed data
+
+        Raises:
+            (OSError): If the file cannot be read
+            (yaml.YAMLError): If the file is not valid YAML
+        """
+
+        start_time: float = time.perf_counter()
+        size: int = 0
+        try:
+            with open(yaml_file, "rb") as f:
+                size = os.fstat(f.fileno()).st_size
+                return yaml.load(f.read() if size <= YAML_BULK_READ_SIZE else f, Loader=YAML_LOADER)
+        finally:
+            with self.lock:
+                self.statistics["files"] += 1
+                self.statistics["bytes"] += size
+                self.statistics["seconds"] += time.perf_counter() - start_time
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get the loading statistics
+
+        Returns:
+            (Dict[str, Any]): The parser, and the number of loaded files, their bytes and the seconds spent loading them
+        """
+
+        with self.lock:
+            return dict(self.statistics, parser=self.parser)
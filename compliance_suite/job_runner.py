@@ -4,23 +4,37 @@ This module contains class definition for Job Runner to run the individual YAML
 directory
 """
 
+import asyncio
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    wait
+)
+import os
 from pathlib import Path
+import threading
+import time
+import tracemalloc
 from typing import (
     Any,
     Dict,
-    List
+    List,
+    Optional,
+    Tuple
 )
 
-from jsonschema import (
-    RefResolver,
-    validate,
-    ValidationError
-)
+from jsonschema import ValidationError
 import yaml
 
 from compliance_suite.constants.constants import (
+    CACHE_DIRECTORY,
+    DISCOVERY_INDEX_FILE,
     PATTERN_HASH_CENTERED,
     PATTERN_HASH_SPACED,
+    POLLING_HISTORY_FILE,
+    RESULT_CACHE_DIRECTORY,
+    RESULT_CACHE_TTL,
     TEMPLATE,
     TEST
 )
@@ -29,14 +43,35 @@ from compliance_suite.exceptions.compliance_exception import (
     TestFailureException,
     TestRunnerException
 )
+from compliance_suite.functions.checkpoint import CheckpointJournal
+from compliance_suite.functions.client import Client
+from compliance_suite.functions.discovery_index import DiscoveryIndex
+from compliance_suite.functions.fixture_pool import FixturePool
+from compliance_suite.functions.job_graph import (
+    JobGraph,
+    JobGraphRun
+)
+from compliance_suite.functions.load_statistics import LoadStatistics
 from compliance_suite.functions.log import logger
+from compliance_suite.functions.model_registry import model_registry
+from compliance_suite.functions.profiler import profiler
 from compliance_suite.functions.report import (
     Report,
     ReportUtility
 )
+from compliance_suite.functions.result_cache import ResultCache
+from compliance_suite.functions.run_metrics import RunMetrics
+from compliance_suite.functions.poll_scheduler import PollScheduler
+from compliance_suite.functions.polling_strategy import PollingHistory
+from compliance_suite.functions.schema_validator import SchemaValidatorRegistry
+from compliance_suite.functions.session_pool import SessionPool
+from compliance_suite.functions.template_cache import TemplateCache
+from compliance_suite.functions.test_plan import TestPlan
+from compliance_suite.functions.yaml_loader import YamlLoader
+from compliance_suite.metrics_server import MetricsServer
 from compliance_suite.test_runner import TestRunner
 from compliance_suite.utils.test_utils import (
-    replace_string,
+    instantiate_template,
     tag_matcher
 )
 from ga4gh.testbed.report.test import Test
@@ -59,6 +94,38 @@ class JobRunner:
         self.exclude_tags: List[str] = []
         self.test_path: List[str] = []
         self.test_count: int = 0
+        self.workers: int = 1
+        self.use_async: bool = False
+        self.job_concurrency: int = 1
+        self.stream_responses: bool = False     # Validate the large list responses element by element as read
+        self.pool_size: int = 10
+        self.session_pool: Any = None
+        self.connection_statistics: Dict = {}
+        self.request_statistics = LoadStatistics()      # Latencies of the HTTP exchanges per endpoint
+        self.run_seconds: float = 0.0
+        self.run_metrics = RunMetrics()
+        self.metrics_port: int = 0          # Port of the live metrics server, not served if 0
+        self.batch_polling: bool = False
+        self.batch_polling_prefix: str = ""
+        self.poll_scheduler: Any = None
+        self.polling_history = PollingHistory(str(Path(CACHE_DIRECTORY, POLLING_HISTORY_FILE).expanduser()))
+        self.schema_validator = SchemaValidatorRegistry()
+        self.template_cache = TemplateCache()
+        self.yaml_loader = YamlLoader()
+        self.discovery_index = DiscoveryIndex(str(Path(CACHE_DIRECTORY, DISCOVERY_INDEX_FILE).expanduser()))
+        self.plan: Any = None               # Compiled test plan run instead of the YAML files, if set
+        self.profile: bool = False
+        self.profile_output: str = ""      # Directory of the cProfile and collapsed stack files, not written if empty
+        self.profile_statistics: Dict = {}
+        self.stream_report: str = ""
+        self.checkpoint: Any = None
+        self.resume: bool = False
+        self.result_cache: Any = None
+        self.service_info: Any = None       # The service info response keying the cached results
+        self.fixture_pool: Any = None
+        self.fixture_instances: Dict[str, List[Tuple[int, str, Future]]] = {}  # Test file -> declared instances
+        self.fixture_lock = threading.Lock()    # Guards the declared fixture instances
+        self.prepared_data: Dict[str, Dict] = {}    # Test file -> YAML data validated while preparing the fixtures
         self.test_status: Dict = {        # To store the status of each test
             "passed": [],
             "failed": [],
@@ -94,6 +161,139 @@ class JobRunner:
 
         self.test_path = input_test_path
 
+    def set_plan(self, plan_file: str) -> None:
+        """ Set the compiled test plan which is run instead of the YAML files of the test path
+
+        Args:
+            plan_file: The path of the plan file written by the compile command
+
+        Raises:
+            (JobValidationException): If the plan cannot be read or was compiled in another format
+        """
+
+        self.plan = TestPlan()
+        self.plan.load(plan_file)
+
+    def set_workers(self, workers: int) -> None:
+        """ Set the number of YAML test files which are run in parallel
+
+        Args:
+            workers: The size of the worker pool. A value of 1 runs the test files sequentially
+        """
+
+        self.workers = workers
+
+    def set_async(self, use_async: bool) -> None:
+        """ Set if the test files are run via the asynchronous engine
+
+        Args:
+            use_async: If True, the test files are run as coroutines on a single event loop
+        """
+
+        self.use_async = use_async
+
+    def set_job_concurrency(self, job_concurrency: int) -> None:
+        """ Set the number of independent sub-jobs of a test file which are run concurrently
+
+        Args:
+            job_concurrency: The maximum number of sub-jobs in flight per test file. A value of 1 runs the sub-jobs
+                sequentially
+        """
+
+        self.job_concurrency = job_concurrency
+
+    def set_stream_responses(self, stream_responses: bool) -> None:
+        """ Set if the list responses are streamed and validated element by element, so that the memory used by a
+        response is bounded by one element rather than by the page
+
+        Args:
+            stream_responses: If True, the list tasks responses are streamed
+        """
+
+        self.stream_responses = stream_responses
+
+    def set_pool_size(self, pool_size: int) -> None:
+        """ Set the number of keep-alive connections pooled per server
+
+        Args:
+            pool_size: The maximum number of connections kept alive per server
+        """
+
+        self.pool_size = pool_size
+
+    def set_batch_polling(self, batch_polling: bool, name_prefix: str = "") -> None:
+        """ Set if the get_task polling jobs are resolved in batches by a central poll scheduler
+
+        Args:
+            batch_polling: If True, the task states are polled in batches via list_tasks requests
+            name_prefix: The task name prefix to narrow down the list_tasks requests. Empty for no filter
+        """
+
+        self.batch_polling = batch_polling
+        self.batch_polling_prefix = name_prefix
+
+    def set_polling_history(self, history_file: str) -> None:
+        """ Set the file in which the completion times for the adaptive polling strategy are stored
+
+        Args:
+            history_file: The path of the polling history JSON file
+        """
+
+        self.polling_history = PollingHistory(history_file)
+
+    def set_profile(self, profile: bool, profile_output: str = "") -> None:
+        """ Set if the time and memory spent in the test file processing stages are reported in the summary
+
+        Args:
+            profile: If True, the profiling statistics are collected and reported
+            profile_output: The directory to which the cProfile statistics and the collapsed stage stacks are written.
+                Profiling is enabled if set
+        """
+
+        self.profile = profile or bool(profile_output)
+        self.profile_output = profile_output
+
+    def set_stream_report(self, stream_file: str) -> None:
+        """ Set the NDJSON file to which the finished test files are streamed
+
+        Args:
+            stream_file: The path of the NDJSON file. Empty to keep the report in memory
+        """
+
+        self.stream_report = stream_file
+
+    def set_checkpoint(self, journal_file: str, resume: bool = False) -> None:
+        """ Set the journal in which the finished test files are recorded
+
+        Args:
+            journal_file: The path of the checkpoint journal
+            resume: If True, the test files finished in the journal are not run again and their results are merged
+        """
+
+        self.checkpoint = CheckpointJournal(journal_file, self.server, self.version)
+        self.resume = resume
+
+    def set_reuse_passed(self, reuse_passed: bool, ttl: float = RESULT_CACHE_TTL) -> None:
+        """ Set if the passed test files are cached and the unchanged ones are not run again
+
+        Args:
+            reuse_passed: If True, a test file whose cached result is recent and passed is restored from the cache
+            ttl: The seconds after which a cached result is not reused
+        """
+
+        self.result_cache = None
+        if reuse_passed:
+            self.result_cache = ResultCache(str(Path(CACHE_DIRECTORY, RESULT_CACHE_DIRECTORY).expanduser()), ttl)
+
+    def set_metrics_port(self, metrics_port: int) -> None:
+        """ Set the port at which the live metrics of the run are served
+
+        Args:
+            metrics_port: The port of the metrics server. The metrics are not served if 0
+        """
+
+        self.metrics_port = metrics_port
+
     def generate_summary(self) -> None:
         """Generate test summary at the completion"""
 
@@ -111,6 +311,37 @@ class JobRunner:
         logger.summary(f'Passed - {passed_tests_count} ({passed_tests})', PATTERN_HASH_SPACED)
         logger.summary(f'Failed - {failed_tests_count} ({failed_tests})', PATTERN_HASH_SPACED)
         logger.summary(f'Skipped - {skipped_tests_count} ({skipped_tests})', PATTERN_HASH_SPACED)
+        for server, statistics in self.connection_statistics.items():
+            logger.summary(f'Connections to {server} - {statistics["connections"]} opened, {statistics["reused"]} '
+                           f'reused for {statistics["requests"]} requests', PATTERN_HASH_SPACED)
+        request_statistics: Dict[str, Any] = self.request_statistics.get_summary(self.run_seconds)
+        for key, statistics in request_statistics["endpoints"].items():
+            latency: Dict[str, float] = statistics["latency"]
+            logger.summary(f'{key} - {statistics["requests"]} requests, p50 {latency["p50"] * 1000:.0f}ms, '
+                           f'p95 {latency["p95"] * 1000:.0f}ms, p99 {latency["p99"] * 1000:.0f}ms',
+                           PATTERN_HASH_SPACED)
+        yaml_statistics: Dict[str, Any] = self.yaml_loader.get_statistics()
+        if yaml_statistics["files"]:
+            logger.summary(f'YAML loading - {yaml_statistics["files"]} files, {yaml_statistics["bytes"] / 1024:.1f} '
+                           f'KiB in {yaml_statistics["seconds"]:.3f}s with the {yaml_statistics["parser"]} parser',
+                           PATTERN_HASH_SPACED)
+        template_statistics: Dict[str, int] = self.template_cache.get_statistics()
+        if template_statistics["hits"] or template_statistics["misses"]:
+            logger.summary(f'Template cache - {template_statistics["hits"]} hits, {template_statistics["misses"]} '
+                           f'misses', PATTERN_HASH_SPACED)
+        if "schema_validation" in self.profile_statistics:
+            statistics = self.profile_statistics["schema_validation"]
+            logger.summary(f'Schema validation - {statistics["validations"]} files in '
+                           f'{statistics["validation_seconds"]:.3f}s, {statistics["validation_bytes"] / 1024:.1f} KiB '
+                           f'(schemas loaded in {statistics["load_seconds"]:.3f}s, '
+                           f'{statistics["load_bytes"] / 1024:.1f} KiB)', PATTERN_HASH_SPACED)
+        for name, statistics in self.profile_statistics.get("stages", {}).items():
+            logger.summary(f'Stage {name} - {statistics["calls"]} calls, {statistics["exclusive_seconds"]:.3f}s '
+                           f'exclusive, {statistics["seconds"]:.3f}s inclusive', PATTERN_HASH_SPACED)
+        if self.result_cache is not None:
+            statistics = self.result_cache.get_statistics()
+            logger.summary(f'Result cache - {statistics["hits"]} reused, {statistics["stored"]} stored',
+                           PATTERN_HASH_SPACED)
         logger.summary("", PATTERN_HASH_SPACED)
         logger.summary("", PATTERN_HASH_CENTERED)
         logger.summary("\n\n\n")
@@ -127,26 +358,22 @@ class JobRunner:
             The loaded and validated YAML data.
         """
 
+        if self.plan is not None and self.plan.contains(yaml_file, _type):
+            return self.plan.get_data(yaml_file, _type)
+
         # Load YAML data
         try:
-            yaml_data = yaml.safe_load(open(yaml_file, "r"))
+            with profiler.stage("yaml_load"):
+                yaml_data = self.yaml_loader.load(yaml_file)
         except yaml.YAMLError as err:
             raise JobValidationException(name="YAML Error",
                                          message=f"Invalid YAML file {yaml_file}",
                                          details=err)
 
-        # Validate YAML data with schema
-        schema_dir_path = Path("docs/test_config").absolute()
-        test_schema_path = Path("docs/test_config/test_schema.json")
-        template_schema_path = Path("docs/test_config/template_schema.json")
-        schema_file_path = str(test_schema_path if _type == TEST else template_schema_path)
-        json_schema = yaml.safe_load(open(schema_file_path, "r"))
-
+        # Validate YAML data with the compiled schema validator
         try:
-            # Python-jsonschema does not reference local files directly
-            # Refer solution from https://github.com/python-jsonschema/jsonschema/issues/98#issuecomment-105475109
-            resolver = RefResolver('file:///' + str(schema_dir_path).replace("\\", "/") + '/', None)
-            validate(yaml_data, json_schema, resolver=resolver)
+            with profiler.stage("schema_validation"):
+                self.schema_validator.validate(yaml_data, _type)
             logger.info(f'YAML file valid for {_type}: {yaml_file}')
         except ValidationError as err:
             raise JobValidationException(name="YAML Schema Validation Error",
@@ -165,53 +392,253 @@ class JobRunner:
         json_report = self.report.generate()
         return json_report
 
-    def initialize_test(self, yaml_file: Path) -> None:
-        """ Initializes a test based on the provided YAML file.
+    def write_report(self, output_files: List[str]) -> None:
+        """Writes the JSON report to the output files
+
+        Args:
+            output_files (List[str]): The paths of the JSON report files
+        """
+
+        self.report.write(output_files)
+
+    def add_test_result(self, yaml_file: Path, status: str, report_buffer: Report) -> None:
+        """ Records the result of a finished test file in the summary and the report
 
         Args:
             yaml_file: The path to the YAML file containing the test data.
+            status: The test status key, one of "passed", "failed" or "skipped"
+            report_buffer: The report buffer containing the phase of the test file
         """
 
         self.test_count += 1
-        report_job_test = Test()
-        logger.summary("\n")
-        logger.summary(f"     Initiating Test-{self.test_count} for {yaml_file}     ", PATTERN_HASH_CENTERED)
+        self.test_status[status].append(str(self.test_count))
+        with profiler.stage("report_building"):
+            self.report.add_test_result(self.test_count, str(yaml_file), status, report_buffer)
+            if self.checkpoint is not None:
+                self.checkpoint.record(str(yaml_file), status, report_buffer.report.get_phases())
+
+    def get_service_info(self) -> Any:
+        """ Retrieves the service info of the server, which keys the cached results
 
+        Returns:
+            (Any): The service info response, None if it could not be retrieved
+        """
+
+        client = Client(self.session_pool.get_session(self.server))
         try:
-            yaml_data = self.load_and_validate_yaml_data(str(yaml_file), TEST)
-            report_phase = self.report.add_phase(str(yaml_file), yaml_data["description"])
-
-            if (self.version in yaml_data["versions"]
-                    and tag_matcher(self.include_tags, self.exclude_tags, yaml_data["tags"])):
-                test_runner = TestRunner(yaml_data["service"], self.server, self.version)
-                job_list: List[Dict] = []
-                for job in yaml_data["jobs"]:
+            response = client.send_request(service="TES", server=self.server, version=self.version,
+                                           endpoint="/service-info", path_params={}, query_params={},
+                                           operation="GET", request_body="")
+            return response.json() if response.status_code == 200 else None
+        except (TestRunnerException, ValueError):
+            return None
+
+    def get_result_key(self, yaml_data: Dict, jobs: List[Dict]) -> Optional[str]:
+        """ Gets the result cache key of a resolved test file
+
+        Args:
+            yaml_data: The validated YAML test data
+            jobs: The resolved sub-jobs of the test file
+
+        Returns:
+            (Optional[str]): The result cache key, None if the passed results are not reused
+        """
+
+        if self.result_cache is None:
+            return None
+        return self.result_cache.get_key(self.server, self.version, dict(yaml_data, jobs=jobs), self.service_info)
+
+    def restore_passed_result(self, result_key: Optional[str], report: Report) -> bool:
+        """ Restores the cached report phase of an unchanged passed test file
+
+        Args:
+            result_key: The result cache key of the test file
+            report: The report object whose test phase is replaced by the cached one
+
+        Returns:
+            (bool): True if the cached result was restored, otherwise False
+        """
+
+        if result_key is None:
+            return False
+        phases: Optional[List[Any]] = self.result_cache.get(result_key)
+        if phases is None:
+            return False
+        report.report.phases[-1:] = phases
+        return True
+
+    def store_passed_result(self, result_key: Optional[str], report: Report) -> None:
+        """ Stores the report phase of a passed test file in the result cache
+
+        Args:
+            result_key: The result cache key of the test file
+            report: The report object containing the test phase
+        """
+
+        if result_key is not None:
+            self.result_cache.put(result_key, report.report.get_phases()[-1:])
+
+    def resume_test(self, test_number: int, yaml_file: Path, report: Report) -> Optional[str]:
+        """ Restores the result of a test file finished in the resumed run
+
+        Args:
+            test_number: The sequence number of the test
+            yaml_file: The path to the YAML file containing the test data.
+            report: The report object in which the restored test phase is added
+
+        Returns:
+            (Optional[str]): The test status key of the finished test file, None if the test file is to be run
+        """
+
+        if self.checkpoint is None:
+            return None
+        result: Optional[Dict[str, Any]] = self.checkpoint.get_result(str(yaml_file))
+        if result is None:
+            return None
+        report.report.phases.extend(result["phases"])
+        logger.info(f'Test-{test_number} for {yaml_file} restored from the checkpoint journal. Status - '
+                    f'{result["status"]}')
+        return result["status"]
+
+    def initialize_test(self, yaml_file: Path) -> None:
+        """ Initializes a test based on the provided YAML file.
+
+        Args:
+            yaml_file: The path to the YAML file containing the test data.
+        """
+
+        report_buffer = Report()
+        status: str = self.execute_test(self.test_count + 1, yaml_file, report_buffer)
+        self.run_metrics.add_finished_test(status)
+        self.add_test_result(yaml_file, status, report_buffer)
+
+    def get_template(self, reference: str) -> Any:
+        """ Gets the validated data of a template, from the test plan if set, otherwise from the template cache
+
+        Args:
+            reference: The template reference, eg. "./templates/create_task_template.yml"
+
+        Returns:
+            (Any): The template data, which must not be modified
+        """
+
+        if self.plan is not None and self.plan.contains(reference, TEMPLATE):
+            return self.plan.get_data(reference, TEMPLATE)
+        return self.template_cache.get(
+            reference, lambda template_file: self.load_and_validate_yaml_data(template_file, TEMPLATE))
+
+    def resolve_jobs(self, yaml_data: Dict) -> List[Dict]:
+        """ Expands the template references of a test file into the ordered list of sub-jobs
+
+        Args:
+            yaml_data: The validated YAML test data
+
+        Returns:
+            (List[Dict]): The list of sub-jobs to be run by the Test Runner
+        """
+
+        job_list: List[Dict] = []
+        with profiler.stage("template_expansion"):
+            for job in yaml_data["jobs"]:
+                if "$ref" in job:
+                    job_list.extend(instantiate_template(self.get_template(job["$ref"]), job.get("args", {})))
+                else:
+                    job_list.append(job)
+        return job_list
+
+    def get_jobs(self, yaml_file: Path, yaml_data: Dict) -> List[Dict]:
+        """ Gets the sub-jobs of a test file, from the test plan if set, otherwise by resolving its templates
+
+        Args:
+            yaml_file: The YAML test file
+            yaml_data: The validated YAML test data
+
+        Returns:
+            (List[Dict]): The list of sub-jobs to be run by the Test Runner
+        """
+
+        if self.plan is not None and self.plan.contains(str(yaml_file), TEST):
+            return self.plan.get_jobs(str(yaml_file))
+        return self.resolve_jobs(yaml_data)
+
+    def compile_plan(self, plan_file: str) -> TestPlan:
+        """ Compiles the YAML files of the test path into a test plan. The test files are validated and their
+        templates resolved once, irrespective of the version and tags, which are matched when the plan is run. An
+        invalid test file is compiled with its exception, so that it fails when the plan is run.
+
+        Args:
+            plan_file: The path of the plan file to be written
+
+        Returns:
+            (TestPlan): The compiled test plan
+        """
+
+        plan = TestPlan()
+        for yaml_file in self.get_yaml_files():
+            try:
+                yaml_data = self.load_and_validate_yaml_data(str(yaml_file), TEST)
+            except JobValidationException as err:
+                logger.error(f'{yaml_file} compiled as invalid. {err.message}')
+                plan.add_test(str(yaml_file), err=err)
+                continue
+            try:
+                jobs: List[Dict] = self.resolve_jobs(yaml_data)
+                for job in yaml_data["jobs"] + yaml_data.get("fixtures", []):
                     if "$ref" in job:
-                        template_data = self.load_and_validate_yaml_data(job["$ref"], TEMPLATE)
-                        if "args" in job:
-                            for key, value in job["args"].items():
-                                template_data = replace_string(template_data, f"{{{key}}}", value)
-                        job_list.extend(template_data)
-                    else:
-                        job_list.append(job)
-
-                for index, job in enumerate(job_list, start=1):
-                    logger.info(f'Running tests for sub-job-{index} -> {job["name"]}')
-                    report_job_test = report_phase.add_test()
-                    test_runner.run_tests(job, report_job_test)
-                self.test_status["passed"].append(str(self.test_count))
-                logger.success(f'Compliance Test-{self.test_count} for {yaml_file} successful.')
-            else:
-                self.test_status["skipped"].append(str(self.test_count))
-                logger.skip(f"Version or tag did not match. Skipping Test-{self.test_count} for {yaml_file}")
-        except (JobValidationException, TestFailureException) as err:
-            self.test_status["failed"].append(str(self.test_count))
-            logger.error(f'Compliance Test-{self.test_count} for {yaml_file} failed.')
-            logger.error(err)
-        except TestRunnerException as err:
-            self.test_status["failed"].append(str(self.test_count))
-            logger.error(f'Compliance Test-{self.test_count} for {yaml_file} failed.')
-            logger.error(err)
+                        plan.add_template(job["$ref"], self.get_template(job["$ref"]))
+            except JobValidationException as err:
+                logger.error(f'{yaml_file} compiled with invalid templates. {err.message}')
+                plan.add_test(str(yaml_file), yaml_data, err=err)
+                continue
+            plan.add_test(str(yaml_file), yaml_data, jobs)
+        plan.write(plan_file)
+        return plan
+
+    def is_test_selected(self, yaml_data: Dict) -> bool:
+        """ Checks if the test file is to be run for the given version and tags
+
+        Args:
+            yaml_data: The validated YAML test data
+
+        Returns:
+            (bool): True if the test is to be run, otherwise False
+        """
+
+        return (self.version in yaml_data["versions"]
+                and tag_matcher(self.include_tags, self.exclude_tags, yaml_data["tags"]))
+
+    def is_test_discarded(self, yaml_file: Path) -> bool:
+        """ Checks if the test file is skipped by its indexed header, before it is loaded and validated. A test file
+        whose header cannot be parsed is not discarded, so that its error is reported when it is loaded
+
+        Args:
+            yaml_file: The YAML test file
+
+        Returns:
+            (bool): True if the version or tags of the test file do not match, otherwise False
+        """
+
+        if self.plan is not None:
+            return False
+        header: Optional[Dict[str, Any]] = self.discovery_index.get_header(yaml_file)
+        return header is not None and not self.is_test_selected(header)
+
+    def handle_test_failure(self, test_number: int, yaml_file: Path, err: Any, report_job_test: Test) -> str:
+        """ Logs a failed test and records the runtime exceptions in the report
+
+        Args:
+            test_number: The sequence number of the test
+            yaml_file: The path to the YAML file containing the test data.
+            err: The compliance exception due to which the test failed
+            report_job_test: The report test which was running when the exception was raised
+
+        Returns:
+            (str): The test status key "failed"
+        """
+
+        logger.error(f'Compliance Test-{test_number} for {yaml_file} failed.')
+        logger.error(err)
+        if isinstance(err, TestRunnerException):
             report_custom_case = report_job_test.add_case()
             ReportUtility.set_case(case=report_custom_case,
                                    name="test_runner_exception",
@@ -219,21 +646,651 @@ class JobRunner:
             ReportUtility.case_fail(case=report_custom_case,
                                     message=f'{err.name}. {err.message}',
                                     log_message=str(err.details))
+        return "failed"
+
+    def create_test_runner(self, service: str, storage_vars: Optional[Dict[str, Any]] = None) -> TestRunner:
+        """ Creates a Test Runner sharing the run-scoped session pool, poll scheduler and polling history
+
+        Args:
+            service: The GA4GH service name of the test file (eg. TES)
+            storage_vars: The storage variables available before the first sub-job, eg. of the fixtures
+
+        Returns:
+            (TestRunner): The Test Runner
+        """
+
+        test_runner = TestRunner(service, self.server, self.version)
+        test_runner.set_session_pool(self.session_pool)
+        test_runner.set_poll_scheduler(self.poll_scheduler)
+        test_runner.set_polling_history(self.polling_history)
+        test_runner.set_request_statistics(self.request_statistics)
+        test_runner.set_run_metrics(self.run_metrics)
+        test_runner.set_stream_responses(self.stream_responses)
+        for key, value in (storage_vars or {}).items():
+            test_runner.set_auxiliary_space(key, value)
+        return test_runner
+
+    def declare_fixtures(self, yaml_file: Path, yaml_data: Dict) -> List[Tuple[int, str, Future]]:
+        """ Declares the fixture instances of a test file in the fixture pool. A test file is declared only once, the
+        test files declaring the same fixture instances concurrently share them
+
+        Args:
+            yaml_file: The YAML test file
+            yaml_data: The validated YAML test data
+
+        Returns:
+            (List[Tuple[int, str, Future]]): The instance number, key and creation future of each fixture instance
+        """
+
+        with self.fixture_lock:
+            if str(yaml_file) in self.fixture_instances:
+                return self.fixture_instances[str(yaml_file)]
+            fixture_instances: List[Tuple[int, str, Future]] = []
+            for fixture in yaml_data.get("fixtures", []):
+                reference: Dict = {key: value for key, value in fixture.items() if key in ["$ref", "args"]}
+                jobs: List[Dict] = self.resolve_jobs({"jobs": [reference]})
+                for instance in range(1, fixture.get("count", 1) + 1):
+                    future: Future = self.fixture_pool.add(yaml_data["service"], jobs, instance, str(yaml_file))
+                    fixture_instances.append((instance, FixturePool.get_key(yaml_data["service"], jobs, instance),
+                                              future))
+            self.fixture_instances[str(yaml_file)] = fixture_instances
+            return fixture_instances
+
+    @staticmethod
+    def get_fixture_storage_vars(instance: int, fixture_vars: Dict[str, Any], storage_vars: Dict[str, Any]) -> None:
+        """ Adds the storage variables of a fixture instance. The variables are suffixed with the instance number, and
+        the first instance variables are also available without suffix
+
+        Args:
+            instance: The instance number of the fixture
+            fixture_vars: The storage variables of the fixture instance
+            storage_vars: The storage variables of the test file to be updated
+        """
+
+        for key, value in fixture_vars.items():
+            if instance == 1:
+                storage_vars.setdefault(key, value)
+            storage_vars.setdefault(f"{key}_{instance}", value)
+
+    def add_fixture_report_tests(self, yaml_file: Path, key: str, report_phase: Any, failed: bool) -> None:
+        """ Adds the report tests of the fixture sub-jobs to the report phase of the test file owning the fixture
+        instance. If the fixture instance failed and is owned by another test file, a report test is added for the
+        failure of this test file.
+
+        Args:
+            yaml_file: The YAML test file
+            key: The fixture instance key
+            report_phase: The report phase of the test file
+            failed: If the fixture instance could not be created
+        """
+
+        report_tests: List[Test] = self.fixture_pool.get_report_tests(key, str(yaml_file))
+        report_phase.tests.extend(report_tests)
+        if failed and not report_tests:
+            report_test: Test = report_phase.add_test()
+            report_test.set_test_name("fixture")
+            report_test.set_test_description("Shared fixture created for another test file")
+
+    def get_fixture_vars(self, yaml_file: Path, yaml_data: Dict, report_phase: Any) -> Dict[str, Any]:
+        """ Gets the storage variables of the fixtures of a test file. Waits for the fixture instances in creation.
+        The fixture sub-jobs are reported in the report phase of the test file owning them
+
+        Args:
+            yaml_file: The YAML test file
+            yaml_data: The validated YAML test data
+            report_phase: The report phase of the test file
+
+        Returns:
+            (Dict[str, Any]): The storage variables of the fixtures
+
+        Raises:
+            (JobValidationException, TestFailureException, TestRunnerException): The exception of the failed fixture
+                sub-job. The failure is reported in the last report test of the report phase
+        """
+
+        storage_vars: Dict[str, Any] = {}
+        for instance, key, future in self.declare_fixtures(yaml_file, yaml_data):
+            try:
+                fixture_vars: Dict[str, Any] = future.result()
+            except (JobValidationException, TestFailureException, TestRunnerException):
+                self.add_fixture_report_tests(yaml_file, key, report_phase, True)
+                raise
+            self.add_fixture_report_tests(yaml_file, key, report_phase, False)
+            self.get_fixture_storage_vars(instance, fixture_vars, storage_vars)
+        return storage_vars
+
+    async def async_get_fixture_vars(self, yaml_file: Path, yaml_data: Dict, report_phase: Any) -> Dict[str, Any]:
+        """ Coroutine version of get_fixture_vars. The event loop is not blocked while the fixtures are created
+
+        Args:
+            yaml_file: The YAML test file
+            yaml_data: The validated YAML test data
+            report_phase: The report phase of the test file
+
+        Returns:
+            (Dict[str, Any]): The storage variables of the fixtures
+
+        Raises:
+            (JobValidationException, TestFailureException, TestRunnerException): The exception of the failed fixture
+                sub-job. The failure is reported in the last report test of the report phase
+        """
+
+        storage_vars: Dict[str, Any] = {}
+        for instance, key, future in self.declare_fixtures(yaml_file, yaml_data):
+            try:
+                fixture_vars: Dict[str, Any] = await asyncio.wrap_future(future)
+            except (JobValidationException, TestFailureException, TestRunnerException):
+                self.add_fixture_report_tests(yaml_file, key, report_phase, True)
+                raise
+            self.add_fixture_report_tests(yaml_file, key, report_phase, False)
+            self.get_fixture_storage_vars(instance, fixture_vars, storage_vars)
+        return storage_vars
+
+    def prepare_fixtures(self, yaml_files: List[Path]) -> None:
+        """ Declares the fixtures of the selected test files upfront in file order, so that they are created
+        concurrently before the test files need them and reported by the first test file declaring them. The test
+        files are selected by their indexed header, and only the selected test files declaring fixtures are validated
+        here. Their validated data is kept for their run, a test file failing validation is reported when it is run.
+
+        Args:
+            yaml_files: The ordered list of YAML test files to be run
+        """
+
+        for yaml_file in yaml_files:
+            if self.checkpoint is not None and str(yaml_file) in self.checkpoint.completed:
+                continue
+            if self.plan is None:
+                header: Optional[Dict[str, Any]] = self.discovery_index.get_header(yaml_file)
+                if header is not None and not (header["fixtures"] and self.is_test_selected(header)):
+                    continue
+            try:
+                if self.plan is not None:
+                    yaml_data = self.plan.get_data(str(yaml_file), TEST)
+                else:
+                    yaml_data = self.yaml_loader.load(str(yaml_file))
+                    if not (isinstance(yaml_data, dict) and "fixtures" in yaml_data):
+                        continue
+                    self.schema_validator.validate(yaml_data, TEST)
+                    self.prepared_data[str(yaml_file)] = yaml_data
+                if isinstance(yaml_data, dict) and "fixtures" in yaml_data and self.is_test_selected(yaml_data):
+                    self.declare_fixtures(yaml_file, yaml_data)
+            except (yaml.YAMLError, ValidationError, JobValidationException):
+                continue
+
+    def create_graph_test_runner(self, service: str, graph_run: JobGraphRun, index: int,
+                                 storage_vars: Optional[Dict[str, Any]] = None) -> TestRunner:
+        """ Creates the Test Runner of a sub-job in the job graph. The storage variables consumed by the sub-job are
+        taken from its finished producers, as they would be in a sequential run
+
+        Args:
+            service: The GA4GH service name of the test file (eg. TES)
+            graph_run: The run of the job graph of the test file
+            index: The sub-job index
+            storage_vars: The storage variables available before the first sub-job, eg. of the fixtures
+
+        Returns:
+            (TestRunner): The Test Runner of the sub-job
+        """
+
+        test_runner = self.create_test_runner(service, storage_vars)
+        test_runners: Dict[int, TestRunner] = graph_run.test_runners
+        for storage_var in graph_run.graph.consumed[index]:
+            for producer in graph_run.graph.get_producers(storage_var, index):
+                if storage_var in test_runners[producer].auxiliary_space:
+                    test_runner.set_auxiliary_space(storage_var, test_runners[producer].auxiliary_space[storage_var])
+                    test_runner.task_type = test_runners[producer].task_type or test_runner.task_type
+                    break
+        return test_runner
+
+    def start_graph_jobs(self, service: str, jobs: List[Dict], graph_run: JobGraphRun,
+                         storage_vars: Optional[Dict[str, Any]] = None) -> List[int]:
+        """ Creates the Test Runners and report tests of the sub-jobs of the job graph which can be started
+
+        Args:
+            service: The GA4GH service name of the test file (eg. TES)
+            jobs: The resolved sub-jobs of the test file
+            graph_run: The run of the job graph of the test file
+            storage_vars: The storage variables available before the first sub-job, eg. of the fixtures
+
+        Returns:
+            (List[int]): The indices of the sub-jobs to be started
+        """
+
+        startable: List[int] = graph_run.get_startable()
+        for index in startable:
+            logger.info(f'Running tests for sub-job-{index + 1} -> {jobs[index]["name"]}')
+            graph_run.start(index, self.create_graph_test_runner(service, graph_run, index, storage_vars), Test())
+        return startable
+
+    def run_job_graph(self, service: str, jobs: List[Dict], report_phase: Any,
+                      storage_vars: Optional[Dict[str, Any]] = None) -> Tuple[Test, Optional[Exception]]:
+        """ Runs the independent sub-jobs of a test file concurrently in the order of their job graph. Once a sub-job
+        fails, no further sub-job is started. The report tests are added in the file order of the started sub-jobs.
+
+        Args:
+            service: The GA4GH service name of the test file (eg. TES)
+            jobs: The resolved sub-jobs of the test file
+            report_phase: The report phase of the test file
+            storage_vars: The storage variables available before the first sub-job, eg. of the fixtures
+
+        Returns:
+            (Tuple[Test, Optional[Exception]]): The report test of the failed sub-job (otherwise of the last sub-job)
+                and the exception of the first failed sub-job in file order
+        """
+
+        graph_run = JobGraphRun(JobGraph(jobs), self.job_concurrency)
+        running: Dict[Future, int] = {}
+        with ThreadPoolExecutor(max_workers=self.job_concurrency) as executor:
+            while True:
+                for index in self.start_graph_jobs(service, jobs, graph_run, storage_vars):
+                    running[executor.submit(graph_run.test_runners[index].run_tests, jobs[index],
+                                            graph_run.report_tests[index])] = index
+                if not running:
+                    break
+                done, _ = wait(running.keys(), return_when=FIRST_COMPLETED)
+                for future in done:
+                    graph_run.finish(running.pop(future), future.exception())
+
+        return self.merge_job_graph(report_phase, graph_run)
+
+    async def async_run_job_graph(self, service: str, jobs: List[Dict], report_phase: Any,
+                                  storage_vars: Optional[Dict[str, Any]] = None) -> Tuple[Test, Optional[Exception]]:
+        """ Coroutine version of run_job_graph. The independent sub-jobs are run as concurrent tasks on the event loop.
+
+        Args:
+            service: The GA4GH service name of the test file (eg. TES)
+            jobs: The resolved sub-jobs of the test file
+            report_phase: The report phase of the test file
+            storage_vars: The storage variables available before the first sub-job, eg. of the fixtures
+
+        Returns:
+            (Tuple[Test, Optional[Exception]]): The report test of the failed sub-job (otherwise of the last sub-job)
+                and the exception of the first failed sub-job in file order
+        """
+
+        graph_run = JobGraphRun(JobGraph(jobs), self.job_concurrency)
+        running: Dict[asyncio.Task, int] = {}
+        while True:
+            for index in self.start_graph_jobs(service, jobs, graph_run, storage_vars):
+                running[asyncio.ensure_future(graph_run.test_runners[index].async_run_tests(
+                    jobs[index], graph_run.report_tests[index]))] = index
+            if not running:
+                break
+            done, _ = await asyncio.wait(running.keys(), return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                graph_run.finish(running.pop(task), task.exception())
+
+        return self.merge_job_graph(report_phase, graph_run)
+
+    @staticmethod
+    def merge_job_graph(report_phase: Any, graph_run: JobGraphRun) -> Tuple[Test, Optional[Exception]]:
+        """ Adds the report tests of the started sub-jobs to the report phase in file order
+
+        Args:
+            report_phase: The report phase of the test file
+            graph_run: The finished run of the job graph of the test file
+
+        Returns:
+            (Tuple[Test, Optional[Exception]]): The report test of the first failed sub-job (otherwise of the last
+                sub-job) and its exception
+        """
+
+        report_tests: Dict[int, Test] = graph_run.report_tests
+        for index in sorted(report_tests.keys()):
+            report_phase.tests.append(report_tests[index])
+        if graph_run.errors:
+            failed_index: int = min(graph_run.errors.keys())
+            return report_tests[failed_index], graph_run.errors[failed_index]
+        last_test: Test = report_tests[max(report_tests.keys())] if report_tests else Test()
+        return last_test, None
+
+    def run_sub_jobs(self, service: str, jobs: List[Dict], report_phase: Any,
+                     storage_vars: Dict[str, Any]) -> Tuple[Test, Optional[Exception]]:
+        """ Runs the sub-jobs of a test file, in file order or along the job graph if the job concurrency is above 1.
+        Once a sub-job fails, no further sub-job is started.
+
+        Args:
+            service: The GA4GH service name of the test file (eg. TES)
+            jobs: The resolved sub-jobs of the test file
+            report_phase: The report phase of the test file
+            storage_vars: The storage variables available before the first sub-job, eg. of the fixtures
+
+        Returns:
+            (Tuple[Test, Optional[Exception]]): The report test of the failed sub-job (otherwise of the last sub-job)
+                and the compliance exception of the failed sub-job
+        """
+
+        if self.job_concurrency > 1:
+            return self.run_job_graph(service, jobs, report_phase, storage_vars)
+        test_runner = self.create_test_runner(service, storage_vars)
+        report_job_test = Test()
+        for index, job in enumerate(jobs, start=1):
+            logger.info(f'Running tests for sub-job-{index} -> {job["name"]}')
+            report_job_test = report_phase.add_test()
+            try:
+                test_runner.run_tests(job, report_job_test)
+            except (JobValidationException, TestFailureException, TestRunnerException) as err:
+                return report_job_test, err
+        return report_job_test, None
+
+    async def async_run_sub_jobs(self, service: str, jobs: List[Dict], report_phase: Any,
+                                 storage_vars: Dict[str, Any]) -> Tuple[Test, Optional[Exception]]:
+        """ Coroutine version of run_sub_jobs
+
+        Args:
+            service: The GA4GH service name of the test file (eg. TES)
+            jobs: The resolved sub-jobs of the test file
+            report_phase: The report phase of the test file
+            storage_vars: The storage variables available before the first sub-job, eg. of the fixtures
+
+        Returns:
+            (Tuple[Test, Optional[Exception]]): The report test of the failed sub-job (otherwise of the last sub-job)
+                and the compliance exception of the failed sub-job
+        """
+
+        if self.job_concurrency > 1:
+            return await self.async_run_job_graph(service, jobs, report_phase, storage_vars)
+        test_runner = self.create_test_runner(service, storage_vars)
+        report_job_test = Test()
+        for index, job in enumerate(jobs, start=1):
+            logger.info(f'Running tests for sub-job-{index} -> {job["name"]}')
+            report_job_test = report_phase.add_test()
+            try:
+                await test_runner.async_run_tests(job, report_job_test)
+            except (JobValidationException, TestFailureException, TestRunnerException) as err:
+                return report_job_test, err
+        return report_job_test, None
+
+    def begin_test(self, test_number: int, yaml_file: Path, report: Report) -> Tuple[Optional[str], Dict[str, Any]]:
+        """ Runs the steps of a test file before its sub-jobs: the test file is restored from the checkpoint journal,
+        selected by its indexed header, loaded and validated, selected by its version and tags, its sub-jobs are
+        resolved and its cached passed result restored
+
+        Args:
+            test_number: The sequence number of the test, used to identify it in the logs and summary
+            yaml_file: The path to the YAML file containing the test data.
+            report: The report object in which the test phase is added
+
+        Returns:
+            (Tuple[Optional[str], Dict[str, Any]]): The test status key if the test file finished in these steps.
+                Otherwise None, and the validated YAML test data, the resolved sub-jobs, the report phase and the
+                result cache key of the test file
+        """
+
+        resumed_status: Optional[str] = self.resume_test(test_number, yaml_file, report)
+        if resumed_status is not None:
+            return resumed_status, {}
+        if self.is_test_discarded(yaml_file):
+            logger.skip(f"Version or tag did not match. Skipping Test-{test_number} for {yaml_file}")
+            return "skipped", {}
+
+        logger.summary("\n")
+        logger.summary(f"     Initiating Test-{test_number} for {yaml_file}     ", PATTERN_HASH_CENTERED)
+        try:
+            # The test files declaring fixtures were already loaded and validated while preparing the fixtures
+            yaml_data: Optional[Dict] = self.prepared_data.pop(str(yaml_file), None)
+            if yaml_data is None:
+                yaml_data = self.load_and_validate_yaml_data(str(yaml_file), TEST)
+            report_phase = report.add_phase(str(yaml_file), yaml_data["description"])
+            if not self.is_test_selected(yaml_data):
+                logger.skip(f"Version or tag did not match. Skipping Test-{test_number} for {yaml_file}")
+                return "skipped", {}
+
+            jobs: List[Dict] = self.get_jobs(yaml_file, yaml_data)
+            result_key: Optional[str] = self.get_result_key(yaml_data, jobs)
+            if self.restore_passed_result(result_key, report):
+                logger.success(f'Compliance Test-{test_number} for {yaml_file} unchanged since its last pass. '
+                               f'Reusing the cached result.')
+                return "passed", {}
+        except (JobValidationException, TestFailureException, TestRunnerException) as err:
+            return self.handle_test_failure(test_number, yaml_file, err, Test()), {}
+        return None, {"yaml_data": yaml_data, "jobs": jobs, "report_phase": report_phase, "result_key": result_key}
+
+    def end_test(self, test_number: int, yaml_file: Path, report: Report, result_key: Optional[str],
+                 report_job_test: Test, err: Optional[Exception]) -> str:
+        """ Records the outcome of the sub-jobs of a test file
+
+        Args:
+            test_number: The sequence number of the test, used to identify it in the logs and summary
+            yaml_file: The path to the YAML file containing the test data.
+            report: The report object containing the test phase
+            result_key: The result cache key of the test file
+            report_job_test: The report test of the failed sub-job, otherwise of the last sub-job
+            err: The compliance exception of the failed sub-job, None if all the sub-jobs passed
+
+        Returns:
+            (str): The test status key, "passed" or "failed"
+        """
+
+        if err is not None:
+            return self.handle_test_failure(test_number, yaml_file, err, report_job_test)
+        self.store_passed_result(result_key, report)
+        logger.success(f'Compliance Test-{test_number} for {yaml_file} successful.')
+        return "passed"
+
+    def execute_test(self, test_number: int, yaml_file: Path, report: Report) -> str:
+        """ Runs a single YAML test file and records its result in the provided report. The method does not modify
+        the shared job runner state, so that multiple test files can be executed in parallel.
+
+        Args:
+            test_number: The sequence number of the test, used to identify it in the logs and summary
+            yaml_file: The path to the YAML file containing the test data.
+            report: The report object in which the test phase is added
+
+        Returns:
+            (str): The test status key, one of "passed", "failed" or "skipped"
+        """
+
+        status, test_data = self.begin_test(test_number, yaml_file, report)
+        if status is not None:
+            return status
+        try:
+            fixture_vars: Dict[str, Any] = self.get_fixture_vars(yaml_file, test_data["yaml_data"],
+                                                                 test_data["report_phase"])
+        except (JobValidationException, TestFailureException, TestRunnerException) as err:
+            return self.handle_test_failure(test_number, yaml_file, err, test_data["report_phase"].get_tests()[-1])
+        report_job_test, err = self.run_sub_jobs(test_data["yaml_data"]["service"], test_data["jobs"],
+                                                 test_data["report_phase"], fixture_vars)
+        return self.end_test(test_number, yaml_file, report, test_data["result_key"], report_job_test, err)
+
+    async def async_execute_test(self, test_number: int, yaml_file: Path, report: Report) -> str:
+        """ Coroutine version of execute_test. The sub-jobs are run via the asynchronous Test Runner path, so that
+        the test file does not block a thread while its requests are in flight or being polled.
+
+        Args:
+            test_number: The sequence number of the test, used to identify it in the logs and summary
+            yaml_file: The path to the YAML file containing the test data.
+            report: The report object in which the test phase is added
+
+        Returns:
+            (str): The test status key, one of "passed", "failed" or "skipped"
+        """
+
+        status, test_data = self.begin_test(test_number, yaml_file, report)
+        if status is not None:
+            return status
+        try:
+            fixture_vars: Dict[str, Any] = await self.async_get_fixture_vars(yaml_file, test_data["yaml_data"],
+                                                                             test_data["report_phase"])
+        except (JobValidationException, TestFailureException, TestRunnerException) as err:
+            return self.handle_test_failure(test_number, yaml_file, err, test_data["report_phase"].get_tests()[-1])
+        report_job_test, err = await self.async_run_sub_jobs(test_data["yaml_data"]["service"], test_data["jobs"],
+                                                             test_data["report_phase"], fixture_vars)
+        return self.end_test(test_number, yaml_file, report, test_data["result_key"], report_job_test, err)
+
+    def run_parallel(self, yaml_files: List[Path]) -> None:
+        """ Runs the test files in a worker pool. Each test file is run with its own Test Runner and report buffer.
+        The results are merged in the file order, so that the report and summary are deterministic.
+
+        Args:
+            yaml_files: The ordered list of YAML test files to be run
+        """
+
+        def run_test(test_number: int, yaml_file: Path, report_buffer: Report) -> str:
+            status: str = self.execute_test(test_number, yaml_file, report_buffer)
+            self.run_metrics.add_finished_test(status)
+            return status
+
+        first_test_number: int = self.test_count + 1
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            futures = []
+            for test_number, yaml_file in enumerate(yaml_files, start=first_test_number):
+                report_buffer = Report()
+                futures.append((report_buffer, executor.submit(run_test, test_number, yaml_file, report_buffer)))
+
+            for yaml_file, (report_buffer, future) in zip(yaml_files, futures):
+                self.add_test_result(yaml_file, future.result(), report_buffer)
+
+    async def run_async(self, yaml_files: List[Path]) -> None:
+        """ Runs the test files concurrently on the event loop. The number of test files in flight is bounded by the
+        workers count. The results are merged in the file order, so that the report and summary are deterministic.
+        The requests in flight are bounded by the workers count times the job concurrency.
+
+        Args:
+            yaml_files: The ordered list of YAML test files to be run
+        """
+
+        semaphore = asyncio.Semaphore(self.workers)
+
+        async def run_bounded(test_number: int, yaml_file: Path, report_buffer: Report) -> str:
+            async with semaphore:
+                status: str = await self.async_execute_test(test_number, yaml_file, report_buffer)
+            self.run_metrics.add_finished_test(status)
+            return status
+
+        # The HTTP exchanges run on the executor threads, one per request in flight
+        asyncio.get_running_loop().set_default_executor(
+            ThreadPoolExecutor(max_workers=self.workers * self.job_concurrency))
+        report_buffers: List[Report] = [Report() for _ in yaml_files]
+        statuses: List[str] = await asyncio.gather(*[
+            run_bounded(test_number, yaml_file, report_buffer)
+            for test_number, (yaml_file, report_buffer) in enumerate(zip(yaml_files, report_buffers),
+                                                                     start=self.test_count + 1)
+        ])
+
+        for yaml_file, status, report_buffer in zip(yaml_files, statuses, report_buffers):
+            self.add_test_result(yaml_file, status, report_buffer)
+
+    def get_yaml_files(self) -> List[Path]:
+        """ Lists the YAML test files of the test paths, or of the test plan if set, in the run order
+
+        Returns:
+            (List[Path]): The test files, and the sorted test files of the test directories
+        """
+
+        if self.plan is not None:
+            return [Path(yaml_file) for yaml_file in self.plan.get_files()]
+        yaml_files: List[Path] = []
+        for test_path in self.test_path:
+            search_path = Path(test_path)
+            if search_path.is_file() and search_path.match("*.yml"):
+                yaml_files.append(search_path)
+            elif search_path.is_dir():
+                yaml_files.extend(sorted(search_path.glob("**/*.yml")))
+        return yaml_files
 
     def run_jobs(self) -> None:
         """ Reads the Test files from compliance-suite-tests directory. Validates and parses individual jobs.
-        The individual jobs are then executed via Test Runner"""
+        The individual jobs are then executed via Test Runner
+
+        Raises:
+            (JobValidationException): If the API models of the version cannot be resolved. Raised before any request
+                is sent
+        """
+
+        # Warm up the API models, so that an unsupported version fails before any request is sent
+        model_registry.load(self.version)
+        logger.info(f"API models loaded for version {self.version}")
 
         report = Report()
         self.set_report(report)
         self.report.set_platform_details(self.server)
+        self.session_pool = SessionPool(self.pool_size)
+        self.request_statistics = LoadStatistics()
+        self.run_metrics = RunMetrics()
+        metrics_server = MetricsServer(self)
+        self.fixture_pool = FixturePool(self.create_test_runner, self.pool_size)
+        self.fixture_instances = {}
+        self.prepared_data = {}
+        try:
+            if self.profile:
+                tracemalloc.start()
+                profiler.enable(cprofile=bool(self.profile_output))
+            if self.stream_report:
+                self.report.set_stream(self.stream_report)
+            if self.checkpoint is not None:
+                if self.resume:
+                    self.checkpoint.load()
+                self.checkpoint.open(self.resume)
+            start_time: float = time.perf_counter()
+            if self.metrics_port:
+                metrics_server.start(self.metrics_port)
+            if self.result_cache is not None:
+                self.service_info = self.get_service_info()
+            self.polling_history.load()
+            self.discovery_index.load()
+            if self.batch_polling:
+                self.poll_scheduler = PollScheduler("TES", self.server, self.version,
+                                                    session=self.session_pool.get_session(self.server),
+                                                    name_prefix=self.batch_polling_prefix)
+                self.poll_scheduler.start()
 
-        for test_path in self.test_path:
-            search_path = Path(test_path)
-            if search_path.is_file() and search_path.match("*.yml"):
-                self.initialize_test(search_path)
-            elif search_path.is_dir():
-                for yaml_file in search_path.glob("**/*.yml"):
+            yaml_files: List[Path] = self.get_yaml_files()
+            self.prepare_fixtures(yaml_files)
+            if self.use_async:
+                asyncio.run(self.run_async(yaml_files))
+            elif self.workers > 1:
+                self.run_parallel(yaml_files)
+            else:
+                for yaml_file in yaml_files:
                     self.initialize_test(yaml_file)
 
+            if self.poll_scheduler is not None:
+                self.poll_scheduler.stop()
+                self.report.add_statistics("batched_polling", self.poll_scheduler.get_statistics())
+            self.fixture_pool.close()
+            self.report.add_statistics("fixtures", self.fixture_pool.get_statistics())
+            self.polling_history.save()
+            self.discovery_index.save()
+            self.report.add_statistics("discovery_index", self.discovery_index.get_statistics())
+            self.report.add_statistics("yaml_loading", self.yaml_loader.get_statistics())
+            self.report.add_statistics("template_cache", self.template_cache.get_statistics())
+            if self.result_cache is not None:
+                self.report.add_statistics("result_cache", self.result_cache.get_statistics())
+            self.run_seconds = time.perf_counter() - start_time
+            self.connection_statistics = self.session_pool.get_statistics()
+            self.report.add_statistics("connections", self.connection_statistics)
+            self.report.add_statistics("requests", self.request_statistics.get_summary(self.run_seconds)["endpoints"])
+            if self.profile:
+                profiler.disable()
+                self.profile_statistics["schema_validation"] = self.schema_validator.get_statistics()
+                self.profile_statistics["stages"] = profiler.get_statistics()
+                if self.profile_output:
+                    os.makedirs(self.profile_output, exist_ok=True)
+                    profiler.write_cprofile(os.path.join(self.profile_output, "profile.pstats"))
+                    profiler.write_collapsed(os.path.join(self.profile_output, "profile.collapsed"))
+                self.report.add_statistics("profile", self.profile_statistics)
+        finally:
+            self.close_run(metrics_server)
         self.generate_summary()
+
+    def close_run(self, metrics_server: MetricsServer) -> None:
+        """ Stops the run-scoped threads and servers, closes the pooled connections and the checkpoint journal. Called
+        once the run finished, failed or was interrupted, in which case the fixtures not yet in creation are cancelled
+        and the finished test files stay recorded in the journal
+
+        Args:
+            metrics_server: The live metrics server of the run
+        """
+
+        if self.poll_scheduler is not None:
+            self.poll_scheduler.stop()
+            self.poll_scheduler = None
+        self.fixture_pool.close(wait=False)
+        if self.checkpoint is not None:
+            self.checkpoint.close()
+        self.session_pool.close()
+        metrics_server.stop()
+        if self.profile:
+            profiler.disable()
+            tracemalloc.stop()
@@ -0,0 +1,294 @@
+"""Module compliance_suite.load_runner.py
+
+This module contains class definition for the Load Runner which replays the jobs of the YAML test files against a
+server at a target rate or concurrency, and summarizes the throughput, error rate and latencies per endpoint
+"""
+
+from concurrent.futures import (
+    Future,
+    ThreadPoolExecutor
+)
+import threading
+import time
+from typing import (
+    Any,
+    Dict,
+    List,
+    Tuple
+)
+
+from compliance_suite.constants.constants import (
+    LOAD_PERCENTILES,
+    PATTERN_HASH_CENTERED,
+    PATTERN_HASH_SPACED,
+    TEST
+)
+from compliance_suite.exceptions.compliance_exception import (
+    JobValidationException,
+    TestFailureException,
+    TestRunnerException
+)
+from compliance_suite.functions.fixture_pool import FixturePool
+from compliance_suite.functions.load_statistics import LoadStatistics
+from compliance_suite.functions.log import logger
+from compliance_suite.functions.model_registry import model_registry
+from compliance_suite.functions.session_pool import SessionPool
+from compliance_suite.job_runner import JobRunner
+from compliance_suite.test_runner import TestRunner
+from ga4gh.testbed.report.phase import Phase
+from ga4gh.testbed.report.test import Test
+
+
+class LoadRunner():
+    """Class to replay the YAML test files as load. A test file is a scenario whose sub-jobs are sent in order, with
+    the same request shapes, Test Runner validations and client as the compliance run"""
+
+    def __init__(self, server: str, version: str):
+        """Initialize the Load Runner object
+
+        Args:
+            server (str): The server URL on which the load is generated
+            version (str): The TES version of the server
+        """
+
+        self.job_runner = JobRunner(server, version)    # Loads, selects and resolves the test files
+        self.duration: float = 60.0
+        self.rate: float = 0.0          # Scenario iterations started per second. The workers loop if 0
+        self.concurrency: int = 10
+        self.scenarios: List[Tuple[str, Dict[str, Any], List[Dict]]] = []     # Test file, storage variables, jobs
+        self.next_scenario: int = 0
+        self.lock = threading.Lock()
+        self.statistics = LoadStatistics()
+        self.summary: Dict[str, Any] = {}
+        self.errors: List[Exception] = []      # Unexpected exceptions of the open loop iterations
+
+    def set_tags(self, include_tags: List[str], exclude_tags: List[str]) -> None:
+        """Set the user-provided tags selecting the test files
+
+        Args:
+            include_tags (List[str]): The list of tags for which the test files are replayed
+            exclude_tags (List[str]): The list of tags for which the test files are not replayed
+        """
+
+        self.job_runner.set_tags(include_tags, exclude_tags)
+
+    def set_test_path(self, test_path: List[str]) -> None:
+        """Set the paths of the test files to be replayed
+
+        Args:
+            test_path (List[str]): The list of test file/directory paths
+        """
+
+        self.job_runner.set_test_path(test_path)
+
+    def set_duration(self, duration: float) -> None:
+        """Set the duration of the load run
+
+        Args:
+            duration (float): The seconds during which new scenario iterations are started
+        """
+
+        self.duration = duration
+
+    def set_rate(self, rate: float) -> None:
+        """Set the target rate of the load run
+
+        Args:
+            rate (float): The number of scenario iterations started per second. If 0, each worker starts a new
+                iteration as soon as its previous one finishes
+        """
+
+        self.rate = rate
+
+    def set_concurrency(self, concurrency: int) -> None:
+        """Set the maximum number of scenario iterations in flight
+
+        Args:
+            concurrency (int): The number of workers running the scenario iterations
+        """
+
+        self.concurrency = concurrency
+
+    def load_scenarios(self) -> None:
+        """Load, select and resolve the test files into the scenarios. The fixtures of a scenario are created once
+        before the load run, and their storage variables are shared by all its iterations. A test file which is
+        invalid or whose fixture could not be created is not replayed."""
+
+        self.scenarios = []
+        for yaml_file in self.job_runner.get_yaml_files():
+            try:
+                yaml_data = self.job_runner.load_and_validate_yaml_data(str(yaml_file), TEST)
+                if not self.job_runner.is_test_selected(yaml_data):
+                    logger.skip(f'{yaml_file} is not selected for the provided version and tags')
+                    continue
+                jobs: List[Dict] = self.job_runner.resolve_jobs(yaml_data)
+                # The fixture sub-jobs are validated, but not reported by the load run
+                storage_vars: Dict[str, Any] = self.job_runner.get_fixture_vars(yaml_file, yaml_data, Phase())
+            except (JobValidationException, TestFailureException, TestRunnerException) as err:
+                logger.error(f'{yaml_file} is not replayed. {err.message}')
+                continue
+            self.scenarios.append((yaml_data["service"], storage_vars, jobs))
+            logger.info(f'{yaml_file} replayed with {len(jobs)} sub-jobs')
+
+    def get_scenario(self) -> Tuple[str, Dict[str, Any], List[Dict]]:
+        """Get the scenario of the next iteration. The scenarios are replayed in turn
+
+        Returns:
+            (Tuple[str, Dict[str, Any], List[Dict]]): The service, fixture storage variables and sub-jobs
+        """
+
+        with self.lock:
+            scenario = self.scenarios[self.next_scenario % len(self.scenarios)]
+            self.next_scenario += 1
+            return scenario
+
+    def record_job(self, key: str, test_runner: TestRunner, start_time: float, success: bool) -> None:
+        """Record the HTTP exchanges of a sub-job with the latencies timed by its client, so that the polling waits
+        and the validations are not counted. Only the last exchange of a failed sub-job is an error. A failed sub-job
+        without a timed exchange, eg. due to a connection error, is recorded with its duration.
+
+        Args:
+            key (str): The operation and endpoint of the sub-job
+            test_runner (TestRunner): The Test Runner which ran the sub-job
+            start_time (float): The performance counter time at which the sub-job started
+            success (bool): If the sub-job passed
+        """
+
+        timings: List[Dict[str, Any]] = test_runner.request_timings
+        if not timings:
+            if not success:
+                self.statistics.record(key, time.perf_counter() - start_time, False)
+            return
+        for index, timing in enumerate(timings, start=1):
+            self.statistics.record(key, timing["total"], success or index < len(timings))
+
+    def run_iteration(self) -> None:
+        """Run the sub-jobs of the next scenario in order with a new Test Runner. Each HTTP exchange is recorded under
+        the operation and endpoint of its sub-job. Once a sub-job fails, the remaining sub-jobs of the iteration are
+        not sent."""
+
+        service, storage_vars, jobs = self.get_scenario()
+        test_runner = self.job_runner.create_test_runner(service, storage_vars)
+        self.statistics.add_iteration()
+        for job in jobs:
+            key: str = f'{job["operation"]} {job["endpoint"]}'
+            test_runner.request_timings = []
+            start_time: float = time.perf_counter()
+            try:
+                test_runner.run_tests(job, Test())
+            except (JobValidationException, TestFailureException, TestRunnerException):
+                self.record_job(key, test_runner, start_time, False)
+                return
+            self.record_job(key, test_runner, start_time, True)
+
+    def run_closed_loop(self, deadline: float) -> None:
+        """Run the scenario iterations back to back until the deadline
+
+        Args:
+            deadline (float): The performance counter time after which no new iteration is started
+        """
+
+        while time.perf_counter() < deadline:
+            self.run_iteration()
+
+    def run_open_loop(self, executor: ThreadPoolExecutor, start_time: float, deadline: float) -> None:
+        """Start the scenario iterations at the target rate until the deadline, irrespective of the server latency. An
+        iteration is dropped if all the workers are busy at its scheduled time, so that the requests are not queued
+        on the client side.
+
+        Args:
+            executor (ThreadPoolExecutor): The workers running the iterations
+            start_time (float): The performance counter time of the first iteration
+            deadline (float): The performance counter time after which no new iteration is started
+        """
+
+        in_flight = threading.BoundedSemaphore(self.concurrency)
+
+        def run_iteration() -> None:
+            try:
+                self.run_iteration()
+            except Exception as err:
+                with self.lock:
+                    self.errors.append(err)
+            finally:
+                in_flight.release()
+
+        iteration: int = 0
+        while True:
+            scheduled_time: float = start_time + iteration / self.rate
+            if scheduled_time >= deadline:
+                break
+            time.sleep(max(scheduled_time - time.perf_counter(), 0))
+            if in_flight.acquire(blocking=False):
+                executor.submit(run_iteration)
+            else:
+                self.statistics.add_dropped()
+            iteration += 1
+
+    def run(self) -> Dict[str, Any]:
+        """Replay the selected test files for the duration, and summarize the requests
+
+        Returns:
+            (Dict[str, Any]): The summary of the load run. The "overrun" seconds are the time the iterations in flight
+                at the end of the duration ran past it
+
+        Raises:
+            (JobValidationException): If the API models of the version cannot be resolved or no test file is
+                selected. Raised before any load is generated
+            (Exception): The first unexpected exception of an iteration, once the workers stopped
+        """
+
+        model_registry.load(self.job_runner.version)
+        self.job_runner.session_pool = SessionPool(max(self.concurrency, self.job_runner.pool_size))
+        self.job_runner.fixture_pool = FixturePool(self.job_runner.create_test_runner, self.concurrency)
+        try:
+            self.load_scenarios()
+        finally:
+            self.job_runner.fixture_pool.close()
+        if not self.scenarios:
+            raise JobValidationException(name="No Load Scenario",
+                                         message="No valid test file is selected for the load run",
+                                         details=None)
+
+        logger.info(f"Generating load for {self.duration}s with {self.concurrency} workers at "
+                    f"{self.rate if self.rate else 'maximum'} iterations per second")
+        start_time: float = time.perf_counter()
+        deadline: float = start_time + self.duration
+        self.errors = []
+        futures: List[Future] = []
+        try:
+            with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+                if self.rate:
+                    self.run_open_loop(executor, start_time, deadline)
+                else:
+                    futures = [executor.submit(self.run_closed_loop, deadline) for _ in range(self.concurrency)]
+            end_time: float = time.perf_counter()
+            for future in futures:
+                future.result()
+            if self.errors:
+                raise self.errors[0]
+
+            self.summary = self.statistics.get_summary(end_time - start_time)
+            self.summary["overrun"] = max(end_time - deadline, 0.0)
+            self.summary["connections"] = self.job_runner.session_pool.get_statistics()
+        finally:
+            self.job_runner.session_pool.close()
+        return self.summary
+
+    def generate_summary(self) -> None:
+        """Generate the load summary at the completion"""
+
+        logger.summary("\n\n\n")
+        logger.summary("   Load Testing Summary   ", PATTERN_HASH_CENTERED)
+        logger.summary("", PATTERN_HASH_SPACED)
+        logger.summary(f'Duration - {self.summary["duration"]:.1f}s, {self.summary["iterations"]} iterations, '
+                       f'{self.summary["dropped"]} dropped, {self.summary["overrun"]:.1f}s overrun by the iterations '
+                       f'in flight', PATTERN_HASH_SPACED)
+        for key, statistics in [("Total", self.summary["total"])] + list(self.summary["endpoints"].items()):
+            percentiles: str = ", ".join(f'p{percentile} {statistics["latency"][f"p{percentile}"] * 1000:.0f}ms'
+                                         for percentile in LOAD_PERCENTILES)
+            logger.summary(f'{key} - {statistics["requests"]} requests, {statistics["throughput"]:.1f}/s, '
+                           f'{statistics["error_rate"]:.1%} errors, {percentiles}', PATTERN_HASH_SPACED)
+        logger.summary("", PATTERN_HASH_SPACED)
+        logger.summary("", PATTERN_HASH_CENTERED)
+        logger.summary("\n\n\n")
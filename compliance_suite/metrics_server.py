@@ -0,0 +1,140 @@
+"""Module compliance_suite.metrics_server.py
+
+This module contains class definition for Metrics Server which exposes the live metrics of a run in the Prometheus text
+format, so that they can be scraped while the compliance suite is running
+"""
+
+from http.server import (
+    BaseHTTPRequestHandler,
+    ThreadingHTTPServer
+)
+import threading
+from typing import (
+    Any,
+    Dict,
+    List
+)
+
+from compliance_suite.constants.constants import (
+    METRICS_BUCKETS,
+    METRICS_PREFIX
+)
+from compliance_suite.functions.log import logger
+
+
+def format_labels(labels: Dict[str, str]) -> str:
+    """Format the labels of a sample in the Prometheus text format
+
+    Args:
+        labels (Dict[str, str]): The label names and values
+
+    Returns:
+        (str): The escaped labels enclosed in curly brackets, empty if there is no label
+    """
+
+    if not labels:
+        return ""
+    escaped: List[str] = []
+    for name, value in labels.items():
+        value = str(value).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+        escaped.append(f'{name}="{value}"')
+    return "{" + ",".join(escaped) + "}"
+
+
+class MetricsServer():
+    """Class containing the methods to expose the live metrics of a Job Runner via a local HTTP server. The metrics are
+    read from the Job Runner at each scrape, so no state is duplicated"""
+
+    def __init__(self, job_runner: Any):
+        """Initialize the Metrics Server object
+
+        Args:
+            job_runner (Any): The Job Runner whose run is exposed
+        """
+
+        self.job_runner: Any = job_runner
+        self.local_server: Any = None
+
+    def render(self) -> str:
+        """Render the metrics of the run
+
+        Returns:
+            (str): The metrics in the Prometheus text exposition format
+        """
+
+        server: Dict[str, str] = {"server": self.job_runner.server}
+        run_metrics: Dict[str, Any] = self.job_runner.run_metrics.get_snapshot()
+        lines: List[str] = [
+            f"# HELP {METRICS_PREFIX}_tests_total Finished test files by status",
+            f"# TYPE {METRICS_PREFIX}_tests_total counter"
+        ]
+        for status, count in run_metrics["finished_tests"].items():
+            lines.append(f'{METRICS_PREFIX}_tests_total{format_labels(dict(server, status=status))} {count}')
+
+        lines.extend([
+            f"# HELP {METRICS_PREFIX}_polls_in_flight Polling jobs waiting for a task state",
+            f"# TYPE {METRICS_PREFIX}_polls_in_flight gauge",
+            f'{METRICS_PREFIX}_polls_in_flight{format_labels(server)} {run_metrics["polls_in_flight"]}',
+            f"# HELP {METRICS_PREFIX}_poll_retries_total Polling requests sent after the first one of a polling job",
+            f"# TYPE {METRICS_PREFIX}_poll_retries_total counter",
+            f'{METRICS_PREFIX}_poll_retries_total{format_labels(server)} {run_metrics["poll_retries"]}',
+            f"# HELP {METRICS_PREFIX}_response_bytes_total Response bytes received per endpoint",
+            f"# TYPE {METRICS_PREFIX}_response_bytes_total counter"
+        ])
+        for key, size in sorted(run_metrics["response_bytes"].items()):
+            lines.append(f'{METRICS_PREFIX}_response_bytes_total{format_labels(dict(server, endpoint=key))} {size}')
+
+        lines.extend([
+            f"# HELP {METRICS_PREFIX}_request_duration_seconds Request latency per endpoint",
+            f"# TYPE {METRICS_PREFIX}_request_duration_seconds histogram"
+        ])
+        for key, latencies in sorted(self.job_runner.request_statistics.get_latencies().items()):
+            labels: Dict[str, str] = dict(server, endpoint=key)
+            for bucket in METRICS_BUCKETS:
+                count: int = sum(1 for latency in latencies if latency <= bucket)
+                lines.append(f'{METRICS_PREFIX}_request_duration_seconds_bucket'
+                             f'{format_labels(dict(labels, le=str(bucket)))} {count}')
+            lines.append(f'{METRICS_PREFIX}_request_duration_seconds_bucket'
+                         f'{format_labels(dict(labels, le="+Inf"))} {len(latencies)}')
+            lines.append(f'{METRICS_PREFIX}_request_duration_seconds_sum{format_labels(labels)} {sum(latencies)}')
+            lines.append(f'{METRICS_PREFIX}_request_duration_seconds_count{format_labels(labels)} {len(latencies)}')
+        return "\n".join(lines) + "\n"
+
+    def start(self, port: int) -> None:
+        """Serve the metrics at /metrics on a background thread
+
+        Args:
+            port (int): Port on which the metrics are served
+        """
+
+        metrics_server = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            """Request handler rendering the metrics at each scrape"""
+
+            def do_GET(self) -> None:
+                if self.path.split("?")[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body: bytes = metrics_server.render().encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+        self.local_server = ThreadingHTTPServer(("", port), MetricsHandler)
+        self.local_server.daemon_threads = True
+        threading.Thread(target=self.local_server.serve_forever, daemon=True).start()
+        logger.info(f"Serving the run metrics at http://localhost:{self.local_server.server_address[1]}/metrics")
+
+    def stop(self) -> None:
+        """Stop serving the metrics"""
+
+        if self.local_server is not None:
+            self.local_server.shutdown()
+            self.local_server.server_close()
+            self.local_server = None
@@ -0,0 +1,229 @@
+"""Module compliance_suite.mock_server.py
+
+This module contains class definition for Mock Server which stands in for a TES server, so that the suite, the load
+tests and the benchmarks can be run without a real backend and with reproducible timings
+"""
+
+from http.server import (
+    BaseHTTPRequestHandler,
+    ThreadingHTTPServer
+)
+import json
+import random
+import re
+import threading
+import time
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    Tuple
+)
+from urllib.parse import (
+    parse_qs,
+    urlsplit
+)
+
+from compliance_suite.constants.constants import MOCK_BACKEND_PARAMETERS
+from compliance_suite.functions.log import logger
+from compliance_suite.functions.mock_tasks import MockTaskStore
+
+# The endpoints are served under any base path ending with the major API version, eg. /ga4gh/tes/v1/tasks
+TASK_PATH = re.compile(r"^.*/v1/tasks/(?P<id>[^/:]+)(?P<cancel>:cancel)?$")
+
+
+class MockServer():
+    """Class containing the methods to serve the service-info, create, list, get and cancel task endpoints of a TES
+    version via a local HTTP server, with an optional latency and injected errors"""
+
+    def __init__(self, version: str):
+        """Initialize the Mock Server object
+
+        Args:
+            version (str): The TES version which is served. Example - "1.1.0"
+        """
+
+        self.version: str = version
+        self.task_store = MockTaskStore(version)
+        self.latency: float = 0.0           # Seconds added before each response
+        self.error_rate: float = 0.0        # Fraction of the requests answered with the error status
+        self.error_status: int = 500
+        self.random = random.Random(0)      # Seeded, so that the same requests fail on each run
+        self.lock = threading.Lock()
+        self.local_server: Any = None
+
+    def set_latency(self, latency: float) -> None:
+        """Set the response latency
+
+        Args:
+            latency (float): The seconds added before each response
+        """
+
+        self.latency = latency
+
+    def set_state_timings(self, queued_seconds: float, running_seconds: float) -> None:
+        """Set the durations of the task states
+
+        Args:
+            queued_seconds (float): The seconds after which a created task is RUNNING
+            running_seconds (float): The seconds after which a RUNNING task is COMPLETE
+        """
+
+        self.task_store.set_state_timings(queued_seconds, running_seconds)
+
+    def set_error_injection(self, error_rate: float, error_status: int = 500, seed: int = 0) -> None:
+        """Set the injected errors
+
+        Args:
+            error_rate (float): The fraction of the requests answered with the error status, between 0 and 1
+            error_status (int): The status code of the injected errors. Default - 500
+            seed (int): The seed selecting the failed requests. Default - 0
+        """
+
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.random = random.Random(seed)
+
+    def set_task_count(self, task_count: int) -> None:
+        """Add COMPLETE synthetic tasks, so that the list tasks responses are large
+
+        Args:
+            task_count (int): The number of synthetic tasks
+        """
+
+        self.task_store.add_synthetic_tasks(task_count)
+
+    def get_service_info(self) -> Dict[str, Any]:
+        """Get the service info of the mock server
+
+        Returns:
+            (Dict[str, Any]): The service info
+        """
+
+        service_info: Dict[str, Any] = {
+            "id": "org.ga4gh.mock-tes",
+            "name": "Mock TES",
+            "type": {"group": "org.ga4gh", "artifact": "tes", "version": self.version},
+            "description": "Mock TES server of the openapi-test-runner",
+            "organization": {"name": "ELIXIR Cloud & AAI", "url": "https://elixir-cloud.dcc.sib.swiss"},
+            "version": self.version,
+            "storage": ["file:///tmp"]
+        }
+        if self.version != "1.0.0":
+            service_info["tesResources_backend_parameters"] = MOCK_BACKEND_PARAMETERS
+        return service_info
+
+    def is_injected_error(self) -> bool:
+        """Draw if a request is answered with the error status
+
+        Returns:
+            (bool): True if the request fails
+        """
+
+        with self.lock:
+            return self.random.random() < self.error_rate
+
+    def handle(self, method: str, url: str, body: bytes) -> Tuple[int, Dict[str, Any]]:
+        """Answer a request
+
+        Args:
+            method (str): The HTTP method, GET or POST
+            url (str): The request path with the query string
+            body (bytes): The request body
+
+        Returns:
+            (Tuple[int, Dict[str, Any]]): The status code and the JSON response
+        """
+
+        if self.latency:
+            time.sleep(self.latency)
+        if self.error_rate and self.is_injected_error():
+            return self.error_status, {"message": "Injected error"}
+
+        split_url = urlsplit(url)
+        path: str = split_url.path.rstrip("/")
+        query: Dict[str, List[str]] = parse_qs(split_url.query, keep_blank_values=True)
+        task_match: Optional[re.Match] = TASK_PATH.match(path)
+
+        if method == "GET" and path.endswith("/v1/service-info"):
+            return 200, self.get_service_info()
+        if path.endswith("/v1/tasks"):
+            if method == "GET":
+                return self.task_store.list_tasks(query)
+            try:
+                return self.task_store.create_task(json.loads(body or b"null"))
+            except json.JSONDecodeError:
+                return 400, {"message": "The request body is not valid JSON"}
+        if task_match is not None:
+            if method == "POST" and task_match.group("cancel"):
+                return self.task_store.cancel_task(task_match.group("id"))
+            if method == "GET" and not task_match.group("cancel"):
+                return self.task_store.get_task(task_match.group("id"), query)
+        return 404, {"message": f"No endpoint {method} {path}"}
+
+    def start(self, port: int) -> None:
+        """Serve the endpoints on a background thread
+
+        Args:
+            port (int): Port on which the mock server runs. A free port is used if 0
+        """
+
+        mock_server = self
+
+        class MockHandler(BaseHTTPRequestHandler):
+            """Request handler answering with the mock server"""
+
+            protocol_version = "HTTP/1.1"       # Keep-alive, as most TES servers
+            # The headers and the body are written separately, which Nagle's algorithm would delay on a kept-alive
+            # connection until the client acknowledges the headers
+            disable_nagle_algorithm = True
+
+            def respond(self, method: str) -> None:
+                request_body: bytes = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+                status, response = mock_server.handle(method, self.path, request_body)
+                response_body: bytes = json.dumps(response).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(response_body)))
+                self.end_headers()
+                self.wfile.write(response_body)
+
+            def do_GET(self) -> None:
+                self.respond("GET")
+
+            def do_POST(self) -> None:
+                self.respond("POST")
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+        self.local_server = ThreadingHTTPServer(("", port), MockHandler)
+        self.local_server.daemon_threads = True
+        threading.Thread(target=self.local_server.serve_forever, daemon=True).start()
+        logger.info(f"Serving the mock TES {self.version} server at "
+                    f"http://localhost:{self.local_server.server_address[1]}/ga4gh/tes/")
+
+    def serve(self, port: int) -> None:
+        """Serve the endpoints until the process is interrupted
+
+        Args:
+            port (int): Port on which the mock server runs
+        """
+
+        self.start(port)
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            logger.info("Stopping the mock server via Keyboard Interruption")
+        finally:
+            self.stop()
+
+    def stop(self) -> None:
+        """Stop the mock server"""
+
+        if self.local_server is not None:
+            self.local_server.shutdown()
+            self.local_server.server_close()
+            self.local_server = None
@@ -3,27 +3,56 @@
 This module contains class definition for Test Runner to run the individual jobs, validate them and store their result
 """
 
-import importlib
+import asyncio
+import contextvars
+import functools
+import hashlib
 import json
 import re
+import time
 from typing import (
     Any,
-    Dict
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Set
 )
 
-from dotmap import DotMap
 from ga4gh.testbed.report.test import Test
 from pydantic import ValidationError
+from pydantic.error_wrappers import ErrorWrapper
+from pydantic.errors import DictError
 from requests.models import Response
 
-from compliance_suite.constants.constants import ENDPOINT_TO_MODEL
+from compliance_suite.constants.constants import (
+    STREAM_CHUNK_SIZE,
+    STREAMED_RESPONSES
+)
 from compliance_suite.exceptions.compliance_exception import (
     JobValidationException,
     TestFailureException
 )
 from compliance_suite.functions.client import Client
+from compliance_suite.functions.json_stream import (
+    JsonStreamReader,
+    StreamedArray
+)
 from compliance_suite.functions.log import logger
+from compliance_suite.functions.model_registry import model_registry
+from compliance_suite.functions.polling_strategy import (
+    create_polling_strategy,
+    PollingStrategy
+)
+from compliance_suite.functions.profiler import profiler
 from compliance_suite.functions.report import ReportUtility
+from compliance_suite.functions.run_metrics import RunMetrics
+from compliance_suite.utils.path_utils import (
+    compile_path,
+    get_path_value,
+    PATH_NOT_FOUND
+)
 
 
 class TestRunner():
@@ -45,6 +74,14 @@ class TestRunner():
         self.job_data: Any = None
         self.auxiliary_space: Dict = {}     # Dictionary to store the sub-job results
         self.report_test: Any = None        # Test object to store the result
+        self.session_pool: Any = None       # Run-scoped pool of keep-alive sessions
+        self.poll_scheduler: Any = None     # Run-scoped scheduler for batched polling of task states
+        self.polling_history: Any = None    # Run-scoped completion times for the adaptive polling strategy
+        self.request_statistics: Any = None     # Run-scoped latencies of the HTTP exchanges per endpoint
+        self.request_timings: List[Dict[str, Any]] = []     # Timing of the HTTP exchanges of the current job
+        self.run_metrics = RunMetrics()     # Live counters, replaced by the run-scoped ones shared by the run
+        self.task_type: str = ""            # Digest of the latest create task request body
+        self.stream_responses: bool = False     # Validate the large list responses element by element as read
 
     def set_job_data(self, job_data: Any) -> None:
         """Set the individual sub job data
@@ -74,6 +111,162 @@ class TestRunner():
 
         self.report_test = report_test
 
+    def set_session_pool(self, session_pool: Any) -> None:
+        """Set the session pool shared across the run
+
+        Args:
+            session_pool (Any): The session pool from which the keep-alive session of the server is taken
+        """
+
+        self.session_pool = session_pool
+
+    def set_poll_scheduler(self, poll_scheduler: Any) -> None:
+        """Set the poll scheduler shared across the run
+
+        Args:
+            poll_scheduler (Any): The poll scheduler which resolves the task states in batches
+        """
+
+        self.poll_scheduler = poll_scheduler
+
+    def set_request_statistics(self, request_statistics: Any) -> None:
+        """Set the run-scoped statistics in which the latency of each HTTP exchange is recorded per endpoint
+
+        Args:
+            request_statistics (Any): The request statistics shared by the Test Runners of the run
+        """
+
+        self.request_statistics = request_statistics
+
+    def set_run_metrics(self, run_metrics: RunMetrics) -> None:
+        """Set the run-scoped live counters, eg. of the polling jobs in flight
+
+        Args:
+            run_metrics (RunMetrics): The run metrics shared by the Test Runners of the run
+        """
+
+        self.run_metrics = run_metrics
+
+    def set_stream_responses(self, stream_responses: bool) -> None:
+        """Set if the list responses are streamed and validated element by element
+
+        Args:
+            stream_responses (bool): If True, the responses of STREAMED_RESPONSES are streamed
+        """
+
+        self.stream_responses = stream_responses
+
+    def set_polling_history(self, polling_history: Any) -> None:
+        """Set the polling history shared across the run
+
+        Args:
+            polling_history (Any): The polling history from which the adaptive polling strategy learns
+        """
+
+        self.polling_history = polling_history
+
+    def get_polling_key(self) -> str:
+        """Get the key identifying the polled task type. The task type is derived from the request body of the
+        latest created task and if the cancellation or the completion of the task is polled
+
+        Returns:
+            (str): The polling history key
+        """
+
+        check_cancel: bool = bool(self.job_data.get("env_vars", {}).get("check_cancel", False))
+        return f'{self.task_type}:{"cancel" if check_cancel else "complete"}'
+
+    def get_polling_strategy(self) -> PollingStrategy:
+        """Create the polling strategy of the current polling job
+
+        Returns:
+            (PollingStrategy): The polling strategy defined in the job, fixed by default
+        """
+
+        return create_polling_strategy(self.job_data["polling"], self.polling_history, self.get_polling_key())
+
+    def poll(self, client: Client, request_arguments: Dict[str, Any]) -> Response:
+        """Polls the request via the poll scheduler if possible, otherwise via the polling strategy of the job. The
+        completion time of adaptive polling jobs is recorded in the polling history
+
+        Args:
+            client (Client): The client to send the requests
+            request_arguments (Dict[str, Any]): The keyword arguments for the client poll request
+
+        Returns:
+            (Response): The response from the server
+        """
+
+        if self.is_scheduled_poll(request_arguments):
+            # The scheduler thread sends the batched requests, so the wait contains the server time of the batches
+            with profiler.stage("scheduled_poll_wait"):
+                return client.scheduled_poll_request(self.poll_scheduler, **request_arguments)
+
+        start_time: float = time.monotonic()
+        with profiler.stage("polling_sleep"):
+            response = client.poll_request(**request_arguments, polling_strategy=self.get_polling_strategy())
+        self.record_polling_duration(time.monotonic() - start_time)
+        return response
+
+    async def async_poll(self, client: Client, request_arguments: Dict[str, Any]) -> Response:
+        """Coroutine version of poll
+
+        Args:
+            client (Client): The client to send the requests
+            request_arguments (Dict[str, Any]): The keyword arguments for the client poll request
+
+        Returns:
+            (Response): The response from the server
+        """
+
+        if self.is_scheduled_poll(request_arguments):
+            with profiler.stage("scheduled_poll_wait"):
+                return await client.async_scheduled_poll_request(self.poll_scheduler, **request_arguments)
+
+        start_time: float = time.monotonic()
+        with profiler.stage("polling_sleep"):
+            response = await client.async_poll_request(**request_arguments,
+                                                       polling_strategy=self.get_polling_strategy())
+        self.record_polling_duration(time.monotonic() - start_time)
+        return response
+
+    def record_polling_duration(self, duration: float) -> None:
+        """Record the completion time of an adaptive polling job in the polling history
+
+        Args:
+            duration (float): The polling duration in seconds
+        """
+
+        if self.polling_history is not None and self.job_data["polling"].get("strategy") == "adaptive":
+            self.polling_history.record(self.get_polling_key(), duration)
+
+    def is_scheduled_poll(self, request_arguments: Dict[str, Any]) -> bool:
+        """Checks if the polling job can be handed over to the poll scheduler. Only the get_task polling jobs are
+        scheduled, as the scheduler resolves the task states by their ID
+
+        Args:
+            request_arguments (Dict[str, Any]): The keyword arguments for the client poll request
+
+        Returns:
+            (bool): True if the polling job is to be scheduled, otherwise False
+        """
+
+        return (self.poll_scheduler is not None
+                and request_arguments["operation"] == "GET"
+                and request_arguments["endpoint"] == "/tasks/{id}"
+                and "id" in request_arguments["path_params"])
+
+    def get_client(self) -> Client:
+        """Create the client for a job. The client reuses the pooled sessions of the server if a pool is set
+
+        Returns:
+            (Client): The client to send the job requests
+        """
+
+        if self.session_pool is not None:
+            return Client(self.session_pool.get_session(self.server))
+        return Client()
+
     def validate_logic(
             self,
             endpoint_model: str,
@@ -89,22 +282,38 @@ class TestRunner():
             message (str): Message specifying if it is a request or a response
         """
 
+        def validate() -> None:
+            pydantic_model_class: Any = model_registry.get_model(self.version, endpoint_model)
+            with profiler.stage("pydantic_validation"):
+                pydantic_model_class(**json_data)  # JSON validation against Pydantic Model
+
+        self.validate_schema(validate, message)
+
+    def validate_schema(self, validate: Callable[[], Any], message: str) -> Any:
+        """ Runs a schema validation and records its result in a report case
+
+        Args:
+            validate (Callable[[], Any]): The validation, raising a Pydantic ValidationError if the data is invalid
+            message (str): Message specifying if it is a request or a response
+
+        Returns:
+            (Any): The result of the validation
+        """
+
         report_case_schema = self.report_test.add_case()
         ReportUtility.set_case(case=report_case_schema,
                                name=f"{message.lower()}_schema_validation",
                                description="Check if response matches the model schema")
 
         try:
-            pydantic_module: Any = importlib.import_module(
-                "compliance_suite.models.v" + self.version.replace('.', '_') + "_specs")
-            pydantic_model_class: Any = getattr(pydantic_module, ENDPOINT_TO_MODEL[endpoint_model])
-            pydantic_model_class(**json_data)  # JSON validation against Pydantic Model
+            result: Any = validate()
             logger.info(f'{message} Schema validation successful for '
                         f'{self.job_data["operation"]} {self.job_data["endpoint"]}')
             ReportUtility.case_pass(case=report_case_schema,
                                     message=f'{message} Schema validation successful for {self.job_data["operation"]} '
                                             f'{self.job_data["endpoint"]}',
                                     log_message="No logs for success")
+            return result
         except ValidationError as err:
             ReportUtility.case_fail(case=report_case_schema,
                                     message=f'{message} Schema validation failed for {self.job_data["operation"]}'
@@ -154,61 +363,232 @@ class TestRunner():
         self.validate_logic(endpoint_model, request_body_json, "Request Body")
         self.save_storage_vars(request_body_json)
 
+    def record_request_timings(self, client: Client) -> None:
+        """Keep the timing of the HTTP exchanges of the current job, and record them in the request statistics. The
+        timing of a streamed response is only recorded once its body is read, see validate_response
+
+        Args:
+            client (Client): The client which sent the job requests
+        """
+
+        self.request_timings = list(client.timings)
+        if not self.is_streamed():
+            self.record_request_statistics()
+
+    def record_request_statistics(self) -> None:
+        """Record the latency of the HTTP exchanges of the current job in the run-scoped request statistics and their
+        size in the run metrics under the job operation and endpoint"""
+
+        key: str = f'{self.job_data["operation"]} {self.job_data["endpoint"]}'
+        for timing in self.request_timings:
+            if self.request_statistics is not None:
+                self.request_statistics.record(key, timing["total"])
+            self.run_metrics.add_response_bytes(key, timing["bytes"])
+        if "polling" in self.job_data.keys():
+            self.run_metrics.add_poll_retries(max(len(self.request_timings) - 1, 0))
+
+    def attach_request_timings(self, report_case: Any) -> None:
+        """Attach the timing of the last HTTP exchange of the current job to the report case as metadata. For polling
+        jobs, the number of polling requests is attached as well
+
+        Args:
+            report_case (Any): The report case validating the response
+        """
+
+        if not self.request_timings:
+            return
+        metadata: Dict[str, Any] = {"request": self.request_timings[-1]}
+        if "polling" in self.job_data.keys():
+            metadata["poll_iterations"] = len(self.request_timings)
+        ReportUtility.set_case_metadata(report_case, metadata)
+
     def validate_response(
             self,
             response: Response
     ) -> None:
         """ Validates the response status. Validates the response with respective API Model. Stores the data in the
-        auxiliary space
+        auxiliary space. A streamed response is closed and its timing recorded afterwards, whether it is valid or not
 
         Args:
             response (Response): The JSON response obtained from client.py
         """
 
-        # General status validation
-        response_status: int = int(list(self.job_data["response"].keys())[0])
+        streamed: bool = self.is_streamed()
+        try:
+            # General status validation
+            response_status: int = int(list(self.job_data["response"].keys())[0])
+
+            report_case_status = self.report_test.add_case()
+            ReportUtility.set_case(case=report_case_status,
+                                   name="status_code",
+                                   description="Check if response status code is 200")
+            self.attach_request_timings(report_case_status)
+
+            if response.status_code == response_status:
+                logger.info(f'{self.job_data["operation"]} {self.job_data["endpoint"]} response status code matched')
+                ReportUtility.case_pass(case=report_case_status,
+                                        message=f'{self.job_data["operation"]} {self.job_data["endpoint"]} Successful '
+                                                f'Response status code',
+                                        log_message="No logs for success")
 
-        report_case_status = self.report_test.add_case()
-        ReportUtility.set_case(case=report_case_status,
-                               name="status_code",
-                               description="Check if response status code is 200")
+            else:
+                ReportUtility.case_fail(case=report_case_status,
+                                        message=f'Response status code for {self.job_data["operation"]}'
+                                                f' {self.job_data["endpoint"]} did not match',
+                                        log_message="")
+
+                raise TestFailureException(name="Incorrect HTTP Response Status",
+                                           message=f'Response status code for {self.job_data["operation"]}'
+                                                   f' {self.job_data["endpoint"]} did not match',
+                                           details=None)
+
+            # Logical Schema Validation
+            if response_status == 200:               # Further response checks only if successful response body
+                endpoint_model: str = self.get_endpoint_model()
+                if streamed:
+                    response_json: Any = self.validate_streamed_response(response, endpoint_model)
+                else:
+                    if not response.text:
+                        response_json: Any = {}          # Handle the Cancel Task Endpoint empty response
+                    else:
+                        response_json: Any = response.json()
+                    self.validate_logic(endpoint_model, response_json, "Response")
+                with profiler.stage("filter_evaluation"):
+                    self.validate_filters(response_json)
+                self.save_storage_vars(response_json)
+        finally:
+            if streamed:
+                # The streamed response holds its pooled connection until closed, even if its body is not read
+                response.close()
+                self.record_request_statistics()
+
+    def get_endpoint_model(self) -> str:
+        """ Get the endpoint model of the response of the current job, which depends on the view for the task
+        endpoints
 
-        if response.status_code == response_status:
-            logger.info(f'{self.job_data["operation"]} {self.job_data["endpoint"]} response status code matched')
-            ReportUtility.case_pass(case=report_case_status,
-                                    message=f'{self.job_data["operation"]} {self.job_data["endpoint"]} Successful '
-                                            f'Response status code',
-                                    log_message="No logs for success")
+        Returns:
+            (str): The endpoint name for mapping the Model class, eg. "list_tasks_FULL"
+        """
 
-        else:
-            ReportUtility.case_fail(case=report_case_status,
-                                    message=f'Response status code for {self.job_data["operation"]}'
-                                            f' {self.job_data["endpoint"]} did not match',
-                                    log_message="")
+        if self.job_data["name"] in ["list_tasks", "get_task"]:
+            view_query: str = ""
+            for query_param in self.job_data["query_parameters"]:
+                if "view" in query_param:
+                    view_query = query_param["view"]
+            return self.job_data["name"] + "_" + view_query
+        return self.job_data["name"]
 
-            raise TestFailureException(name="Incorrect HTTP Response Status",
-                                       message=f'Response status code for {self.job_data["operation"]}'
-                                               f' {self.job_data["endpoint"]} did not match',
-                                       details=None)
+    def get_streamed_array(self, array_key: str) -> Optional[StreamedArray]:
+        """ Creates the stand-in of a streamed array member, keeping the elements and values looked up by the filter
+        and storage variable paths of the current job
 
-        # Logical Schema Validation
-        if response_status == 200:               # Further response checks only if successful response body
-            if not response.text:
-                response_json: Any = {}          # Handle the Cancel Task Endpoint empty response
-            else:
-                response_json: Any = response.json()
-
-            if self.job_data["name"] in ["list_tasks", "get_task"]:
-                view_query: str = ""
-                for query_param in self.job_data["query_parameters"]:
-                    if "view" in query_param:
-                        view_query = query_param["view"]
-                endpoint_model: str = self.job_data["name"] + "_" + view_query
-            else:
-                endpoint_model: str = self.job_data["name"]
-            self.validate_logic(endpoint_model, response_json, "Response")
-            self.validate_filters(response_json)
-            self.save_storage_vars(response_json)
+        Args:
+            array_key (str): The name of the streamed array member, eg. "tasks"
+
+        Returns:
+            (Optional[StreamedArray]): The stand-in of the array. None if a storage variable stores the whole array or
+                a path reads the whole response, so that the response cannot be streamed
+        """
+
+        indices: Set[int] = set()
+        tail_size: int = 0
+        values: List[Any] = []
+        paths: List[Any] = [(job_filter["path"], job_filter) for job_filter in self.job_data.get("filter", [])]
+        paths.extend((path, None) for path in self.job_data.get("storage_vars", {}).values())
+        for path, job_filter in paths:
+            segments = compile_path(path)
+            if not segments or (segments == (array_key,) and job_filter is None):
+                return None
+            if segments == (array_key,):
+                if "value" in job_filter:
+                    values.append(job_filter["value"])
+            elif segments[0] == array_key and isinstance(segments[1], int):
+                if segments[1] >= 0:
+                    indices.add(segments[1])
+                else:
+                    tail_size = max(tail_size, -segments[1])
+        return StreamedArray(indices, tail_size, values)
+
+    def is_streamed(self) -> bool:
+        """ Checks if the response of the current job is streamed
+
+        Returns:
+            (bool): True if the streaming mode is set and the response is a list which can be validated element by
+                element, otherwise False
+        """
+
+        if not self.stream_responses or "polling" in self.job_data.keys() or self.job_data["operation"] != "GET":
+            return False
+        endpoint_model: str = self.get_endpoint_model()
+        return (endpoint_model in STREAMED_RESPONSES
+                and self.get_streamed_array(STREAMED_RESPONSES[endpoint_model][0]) is not None)
+
+    def validate_streamed_response(self, response: Response, endpoint_model: str) -> Dict[str, Any]:
+        """ Validates a streamed response while it is read. Each element of the array member is validated against
+        its model as soon as it is parsed, and only kept if a filter or storage variable reads it, so that the memory
+        is bounded by one element rather than by the response. The other members are validated against the response
+        model with an empty array.
+
+        Args:
+            response (Response): The streamed response, whose body is not read yet
+            endpoint_model (str): The endpoint name for mapping the Model class
+
+        Returns:
+            (Dict[str, Any]): The response data, in which the array member is replaced by its StreamedArray stand-in
+        """
+
+        array_key, element_model = STREAMED_RESPONSES[endpoint_model]
+        streamed_array: Any = self.get_streamed_array(array_key)
+        pydantic_model_class: Any = model_registry.get_model(self.version, endpoint_model)
+        element_model_class: Any = model_registry.get_model(self.version, element_model)
+        body_size: List[int] = [0]
+
+        def handle_element(element: Any) -> None:
+            if not isinstance(element, dict):
+                # Reported as the non-streamed validation of the array reports it
+                raise ValidationError([ErrorWrapper(DictError(), loc=(array_key, len(streamed_array)))],
+                                      pydantic_model_class)
+            try:
+                with profiler.stage("pydantic_validation"):
+                    element_model_class(**element)
+            except ValidationError as err:
+                # Located in the array, as the error of the whole response would be
+                raise ValidationError([ErrorWrapper(err, loc=(array_key, len(streamed_array)))], pydantic_model_class)
+            streamed_array.add(element)
+
+        def read_chunks() -> Iterator[bytes]:
+            for chunk in response.iter_content(STREAM_CHUNK_SIZE):
+                body_size[0] += len(chunk)
+                yield chunk
+
+        def validate() -> Dict[str, Any]:
+            start_time: float = time.perf_counter()
+            try:
+                with profiler.stage("http_wait"):
+                    response_json: Dict[str, Any] = JsonStreamReader(read_chunks()).read_object(
+                        array_key, handle_element)
+            finally:
+                self.add_transfer_timing(time.perf_counter() - start_time, body_size[0])
+            with profiler.stage("pydantic_validation"):
+                pydantic_model_class(**response_json)
+            if array_key in response_json:
+                response_json[array_key] = streamed_array
+            return response_json
+
+        return self.validate_schema(validate, "Response")
+
+    def add_transfer_timing(self, seconds: float, size: int) -> None:
+        """Add the reading of a streamed response body to the timing of its HTTP exchange, which only covers the
+        response headers when the response is returned
+
+        Args:
+            seconds (float): The seconds spent in reading the body
+            size (int): The body size in bytes
+        """
+
+        if self.request_timings:
+            self.request_timings[-1]["total"] += seconds
+            self.request_timings[-1]["bytes"] = size
 
     def validate_filters(self, json_data: Any) -> None:
         """Extract the API data key values and compare with the filter value
@@ -226,15 +606,12 @@ class TestRunner():
                                        name=f'Filter-{index}',
                                        description=f'Validate the response against filter-{index}')
 
-                filtered_value: Any = ""   # Retrieve the API data value through DotMap parser
-                dot_dict = DotMap(json_data)
-                if dot_dict is not None:
-                    filtered_value = eval("dot_dict." + job_filter["path"].split('.', maxsplit=1)[1])
+                filtered_value: Any = get_path_value(json_data, job_filter["path"])
 
                 # Check if provided filter type matches with the filtered value class
                 if not ((job_filter["type"] == "string" and isinstance(filtered_value, str)) or
                         (job_filter["type"] == "array" and isinstance(filtered_value, list)) or
-                        (job_filter["type"] == "object" and isinstance(filtered_value, DotMap))):
+                        (job_filter["type"] == "object" and isinstance(filtered_value, dict))):
                     logger.info(f'Filter-{index} failed due to invalid filter type')
                     ReportUtility.case_fail(case=report_case_filter,
                                             message=f'Filter-{index} failed for {self.job_data["operation"]} '
@@ -257,8 +634,7 @@ class TestRunner():
                         report_case_result = job_filter["value"] in filtered_value
 
                     elif job_filter["type"] == "object":
-                        filtered_dict: Dict = filtered_value.toDict()
-                        report_case_result = json.loads(job_filter["value"]).items() <= filtered_dict.items()
+                        report_case_result = json.loads(job_filter["value"]).items() <= filtered_value.items()
 
                 # Check size if specified
                 if "size" in job_filter:
@@ -290,13 +666,12 @@ class TestRunner():
         """
 
         if "storage_vars" in self.job_data.keys():
-            dot_dict = DotMap(json_data)
-            if dot_dict is not None:
-                for key, value in self.job_data["storage_vars"].items():
-                    # Default value of absent key is DotMap()
-                    if key not in self.auxiliary_space.keys() or self.auxiliary_space[key] == "DotMap()":
-                        dot_value = str(eval("dot_dict." + value.split('.', maxsplit=1)[1]))
-                        self.set_auxiliary_space(key, dot_value)
+            for key, value in self.job_data["storage_vars"].items():
+                # An absent path is not stored, so that a later job can still store the key
+                if key not in self.auxiliary_space.keys():
+                    path_value: Any = get_path_value(json_data, value)
+                    if path_value is not PATH_NOT_FOUND:
+                        self.set_auxiliary_space(key, str(path_value))
 
     def transform_parameters(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Transform the parameters by replacing the storage variables with their exact values.
@@ -321,16 +696,20 @@ class TestRunner():
                                                  details=None)
         return params
 
-    def run_tests(
+    def prepare_request(
             self,
             job_data: Any,
             report_test: Test
-    ) -> None:
-        """ Runs the individual jobs
+    ) -> Dict[str, Any]:
+        """ Sets the job state and builds the client request arguments. The request body is validated before the
+        request is sent.
 
         Args:
             job_data (Any): The parsed YAML sub-job data containing information for test
             report_test (Test): The test object to store the result
+
+        Returns:
+            (Dict[str, Any]): The keyword arguments for the client send or poll request
         """
 
         self.set_job_data(job_data)
@@ -356,8 +735,17 @@ class TestRunner():
         if self.job_data["name"] in ["create_task"]:
             request_body: str = self.job_data["request_body"]
             self.validate_request_body(request_body)
-
-        client = Client()
+            self.task_type = hashlib.sha256(request_body.encode()).hexdigest()[:16]
+
+        request_arguments: Dict[str, Any] = {
+            "service": self.service,
+            "server": self.server,
+            "version": self.version,
+            "endpoint": self.job_data["endpoint"],
+            "path_params": path_params,
+            "query_params": query_params,
+            "operation": self.job_data["operation"]
+        }
 
         if "polling" in self.job_data.keys():
 
@@ -365,16 +753,73 @@ class TestRunner():
             if "env_vars" in self.job_data.keys() and "check_cancel" in self.job_data["env_vars"].keys():
                 check_cancel = self.job_data["env_vars"]["check_cancel"]
 
-            response = client.poll_request(service=self.service, server=self.server, version=self.version,
-                                           endpoint=self.job_data["endpoint"], path_params=path_params,
-                                           query_params=query_params, operation=self.job_data["operation"],
-                                           polling_interval=self.job_data["polling"]["interval"],
-                                           polling_timeout=self.job_data["polling"]["timeout"],
-                                           check_cancel_val=check_cancel)
+            request_arguments.update({
+                "polling_interval": self.job_data["polling"]["interval"],
+                "polling_timeout": self.job_data["polling"]["timeout"],
+                "check_cancel_val": check_cancel
+            })
         else:
-            response = client.send_request(service=self.service, server=self.server, version=self.version,
-                                           endpoint=self.job_data["endpoint"], path_params=path_params,
-                                           query_params=query_params, operation=self.job_data["operation"],
-                                           request_body=request_body)
+            request_arguments["request_body"] = request_body
+
+        return request_arguments
 
+    def run_tests(
+            self,
+            job_data: Any,
+            report_test: Test
+    ) -> None:
+        """ Runs the individual jobs
+
+        Args:
+            job_data (Any): The parsed YAML sub-job data containing information for test
+            report_test (Test): The test object to store the result
+        """
+
+        with profiler.stage("request_build"):
+            request_arguments: Dict[str, Any] = self.prepare_request(job_data, report_test)
+        client = self.get_client()
+
+        if "polling" in self.job_data.keys():
+            self.run_metrics.start_poll()
+            try:
+                response = self.poll(client, request_arguments)
+            finally:
+                self.run_metrics.finish_poll()
+        else:
+            response = client.send_request(**request_arguments, stream=self.is_streamed())
+
+        self.record_request_timings(client)
         self.validate_response(response)
+
+    async def async_run_tests(
+            self,
+            job_data: Any,
+            report_test: Test
+    ) -> None:
+        """ Runs the individual jobs via the asynchronous client
+
+        Args:
+            job_data (Any): The parsed YAML sub-job data containing information for test
+            report_test (Test): The test object to store the result
+        """
+
+        with profiler.stage("request_build"):
+            request_arguments: Dict[str, Any] = self.prepare_request(job_data, report_test)
+        client = self.get_client()
+
+        if "polling" in self.job_data.keys():
+            self.run_metrics.start_poll()
+            try:
+                response = await self.async_poll(client, request_arguments)
+            finally:
+                self.run_metrics.finish_poll()
+        else:
+            response = await client.async_send_request(**request_arguments, stream=self.is_streamed())
+
+        self.record_request_timings(client)
+        if self.is_streamed():
+            # The streamed body is read while validated, which must not block the event loop
+            await asyncio.get_running_loop().run_in_executor(None, functools.partial(
+                contextvars.copy_context().run, self.validate_response, response))
+        else:
+            self.validate_response(response)
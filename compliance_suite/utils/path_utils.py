@@ -0,0 +1,82 @@
+"""Module compliance_suite.utils.path_utils.py
+
+This module contains the utility functions to extract values from the request/response data via the dot notation
+paths of the YAML test files (eg. $response.tasks[0].id)
+"""
+
+from functools import lru_cache
+import re
+from typing import (
+    Any,
+    Tuple,
+    Union
+)
+
+from compliance_suite.exceptions.compliance_exception import JobValidationException
+
+PATH_NOT_FOUND: Any = object()      # Returned if the path does not exist in the data
+PATH_SEGMENT_PATTERN = re.compile(r"\.([^.\[\]]+)|\[(-?\d+)\]|\[(['\"])(.*?)\3\]")
+
+
+@lru_cache(maxsize=1024)
+def compile_path(path: str) -> Tuple[Union[str, int], ...]:
+    """Parse a dot notation path into the keys and indices to be looked up. The root (eg. $response) is dropped.
+    The parsed paths are cached, so that each path string is parsed once.
+
+    Args:
+        path: The dot notation path. Example - "$response.tasks[0].id"
+
+    Returns:
+        The dictionary keys and list indices of the path in lookup order.
+
+    Raises:
+        JobValidationException: If the path does not follow the dot notation.
+    """
+
+    root_match = re.match(r"\$?[A-Za-z_][A-Za-z0-9_]*", path)
+    if root_match is None:
+        raise JobValidationException(name="Invalid path",
+                                     message=f"Path {path} does not start with a root such as $response",
+                                     details=None)
+
+    segments = []
+    position: int = root_match.end()
+    while position < len(path):
+        segment_match = PATH_SEGMENT_PATTERN.match(path, position)
+        if segment_match is None:
+            raise JobValidationException(name="Invalid path",
+                                         message=f"Path {path} is not in dot notation at position {position}",
+                                         details=None)
+        key, index, _, quoted_key = segment_match.groups()
+        if key is not None:
+            segments.append(key)
+        elif index is not None:
+            segments.append(int(index))
+        else:
+            segments.append(quoted_key)
+        position = segment_match.end()
+    return tuple(segments)
+
+
+def get_path_value(data: Any, path: str, default: Any = PATH_NOT_FOUND) -> Any:
+    """Extract the value at the dot notation path from the parsed JSON data. The data is read as is, without any
+    conversion.
+
+    Args:
+        data: The parsed JSON data.
+        path: The dot notation path. Example - "$response.tasks[0].id"
+        default: The value returned if the path does not exist in the data.
+
+    Returns:
+        The value at the path, otherwise the default value.
+    """
+
+    value: Any = data
+    for segment in compile_path(path):
+        if isinstance(segment, int) and isinstance(value, list):
+            if not -len(value) <= segment < len(value):
+                return default
+        elif not (isinstance(segment, str) and isinstance(value, dict) and segment in value):
+            return default
+        value = value[segment]
+    return value
@@ -5,6 +5,7 @@ This module contains the utility functions to perform actions on test files
 
 from typing import (
     Any,
+    Dict,
     List,
     Union
 )
@@ -57,3 +58,51 @@ def replace_string(data: Any, search_str: str, replace_str: Union[str, int]) ->
         return data
     elif isinstance(data, str) or isinstance(data, int):
         return replace_str if data == search_str else data
+
+
+def resolve_template_args(args: Dict[str, Union[str, int]]) -> Dict[str, Any]:
+    """Map each placeholder to its final value. As with replace_string applied for each argument in order, an argument
+    value equal to the placeholder of a later argument is replaced with the value of that argument.
+
+    Args:
+        args: The template arguments.
+
+    Returns:
+        The final values keyed by the placeholders `{key}`.
+    """
+
+    items = list(args.items())
+    placeholders: Dict[str, Any] = {}
+    for index, (key, value) in enumerate(items):
+        for later_key, later_value in items[index + 1:]:
+            if isinstance(value, str) and value == f"{{{later_key}}}":
+                value = later_value
+        placeholders[f"{{{key}}}"] = value
+    return placeholders
+
+
+def instantiate_template(data: Any, args: Dict[str, Union[str, int]]) -> Any:
+    """Create a copy of the template data with the placeholders replaced by the arguments. The result is the same as
+    replace_string applied for each argument in order, but the template data is traversed once and not modified, so
+    that it can be shared between the references.
+
+    Args:
+        data: The template data to be instantiated.
+        args: The template arguments. A value equal to `{key}` is replaced with the argument value.
+
+    Returns:
+        The instantiated copy of the template data.
+    """
+
+    placeholders: Dict[str, Any] = resolve_template_args(args)
+
+    def instantiate(item: Any) -> Any:
+        if isinstance(item, list):
+            return [instantiate(value) for value in item]
+        elif isinstance(item, dict):
+            return {key: instantiate(value) for key, value in item.items()}
+        elif isinstance(item, str) and item in placeholders:
+            return placeholders[item]
+        return item
+
+    return instantiate(data)
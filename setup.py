@@ -53,8 +53,10 @@ setup(
     license='Apache License 2.0',
     packages=find_packages(exclude=[
         'unittests',
-        'unittests.*'
+        'unittests.*',
+        'benchmarks',
+        'benchmarks.*'
     ]),
-    package_data={'': ['../tests/*', '../docs/test_config/*', 'web/*/*']},
+    package_data={'': ['../tests/*', '../docs/test_config/*', 'schemas/*.json', 'web/*/*']},
     install_requires=install_requires
 )
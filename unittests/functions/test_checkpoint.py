@@ -0,0 +1,58 @@
+"""Module unittests.functions.test_checkpoint.py
+
+This module tests the checkpoint.py file
+"""
+
+import pytest
+
+from compliance_suite.exceptions.compliance_exception import JobValidationException
+from compliance_suite.functions.checkpoint import CheckpointJournal
+from compliance_suite.functions.report import (
+    Report,
+    ReportUtility
+)
+from unittests.data.constants import TEST_URL
+
+
+class TestCheckpointJournal:
+
+    def test_record_and_resume(self, tmp_path):
+        """Asserts the recorded test files are restored with their report phases"""
+
+        journal_file = str(tmp_path / "journal.ndjson")
+        report_buffer = Report()
+        phase = report_buffer.add_phase("test_01.yml", "description")
+        ReportUtility.case_fail(phase.add_test().add_case(), "message", "log")
+
+        journal = CheckpointJournal(journal_file, TEST_URL, "1.0.0")
+        journal.open(resume=False)
+        journal.record("test_01.yml", "failed", report_buffer.report.get_phases())
+        journal.close()
+        with open(journal_file, "a") as f:
+            f.write('{"file": "test_02.yml", "sta')    # Interrupted write
+
+        resumed_journal = CheckpointJournal(journal_file, TEST_URL, "1.0.0")
+        resumed_journal.load()
+        result = resumed_journal.get_result("test_01.yml")
+
+        assert resumed_journal.get_result("test_02.yml") is None
+        assert result["status"] == "failed"
+        restored_phase = result["phases"][0]
+        assert restored_phase.get_phase_name() == "test_01.yml"
+        assert restored_phase.get_tests()[0].get_cases()[0].get_status() == "FAIL"
+
+        report = Report()
+        report.report.phases.extend(result["phases"])
+        report.report.finalize()
+        assert report.report.get_summary().get_failed() == 1
+
+    def test_load_other_server(self, tmp_path):
+        """Asserts a journal of another server is not resumed"""
+
+        journal_file = str(tmp_path / "journal.ndjson")
+        journal = CheckpointJournal(journal_file, TEST_URL, "1.0.0")
+        journal.open(resume=False)
+        journal.close()
+
+        with pytest.raises(JobValidationException):
+            CheckpointJournal(journal_file, TEST_URL, "1.1.0").load()
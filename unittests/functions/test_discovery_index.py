@@ -0,0 +1,66 @@
+"""Module unittests.functions.test_discovery_index.py
+
+This module tests the discovery_index.py file
+"""
+
+import os
+from unittest.mock import patch
+
+from compliance_suite.functions.discovery_index import DiscoveryIndex
+
+TEST_FILE = """description: List the tasks
+service: TES
+versions:
+- 1.1.0
+tags:
+  - list_tasks
+jobs:
+  - name: list_tasks
+    description: List the tasks
+fixtures:
+  - $ref: "./templates/create_task_template.yml"
+"""
+
+
+class TestDiscoveryIndex:
+
+    def test_scan_header(self, tmp_path):
+        """Asserts only the header keys are parsed, and the fixtures declaration is detected"""
+
+        (tmp_path / "test.yml").write_text(TEST_FILE)
+        assert DiscoveryIndex.scan_header(str(tmp_path / "test.yml")) == {
+            "description": "List the tasks", "service": "TES", "versions": ["1.1.0"], "tags": ["list_tasks"],
+            "fixtures": True
+        }
+
+    def test_scan_header_invalid(self, tmp_path):
+        """Asserts a test file with an unparsable or incomplete header is not indexed"""
+
+        (tmp_path / "invalid.yml").write_text("Invalid YAML\n}")
+        (tmp_path / "incomplete.yml").write_text(TEST_FILE.replace("tags:\n  - list_tasks\n", ""))
+        (tmp_path / "number.yml").write_text(TEST_FILE.replace("- 1.1.0", "- 1.1"))
+        for yaml_file in ["invalid.yml", "incomplete.yml", "number.yml", "missing.yml"]:
+            assert DiscoveryIndex.scan_header(str(tmp_path / yaml_file)) is None
+
+    def test_get_header_cached(self, tmp_path):
+        """Asserts the header is scanned again only if the test file changed, also after a save and load"""
+
+        test_file = tmp_path / "test.yml"
+        test_file.write_text(TEST_FILE)
+        index_file = str(tmp_path / "cache" / "index.json")
+        discovery_index = DiscoveryIndex(index_file)
+        discovery_index.load()
+        assert discovery_index.get_header(test_file)["service"] == "TES"
+        discovery_index.save()
+
+        discovery_index = DiscoveryIndex(index_file)
+        discovery_index.load()
+        with patch.object(DiscoveryIndex, "scan_header", wraps=DiscoveryIndex.scan_header) as mock_scan_header:
+            assert discovery_index.get_header(test_file)["tags"] == ["list_tasks"]
+            mock_scan_header.assert_not_called()
+
+            stat = os.stat(test_file)
+            os.utime(test_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+            assert discovery_index.get_header(test_file)["tags"] == ["list_tasks"]
+            mock_scan_header.assert_called_once()
+        assert discovery_index.get_statistics() == {"hits": 1, "misses": 1}
@@ -0,0 +1,71 @@
+"""Module unittests.functions.test_fixture_pool.py
+
+This module tests the fixture_pool.py file
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from compliance_suite.exceptions.compliance_exception import TestRunnerException
+from compliance_suite.functions.fixture_pool import FixturePool
+
+FIXTURE_JOBS = [{"name": "create_task", "operation": "POST", "storage_vars": {"id": "$response.id"}}]
+
+
+def create_test_runner_factory(task_ids):
+    """Create a Test Runner factory whose Test Runners store the next task ID"""
+
+    def create_test_runner(service):
+        test_runner = MagicMock()
+        test_runner.auxiliary_space = {}
+
+        def run_tests(job_data, report_test):
+            test_runner.auxiliary_space["id"] = next(task_ids)
+
+        test_runner.run_tests.side_effect = run_tests
+        return test_runner
+
+    return create_test_runner
+
+
+class TestFixturePool:
+
+    def test_add(self):
+        """Asserts a fixture instance is created once and shared by its declarations"""
+
+        fixture_pool = FixturePool(create_test_runner_factory(iter(["first", "second"])), 2)
+        first = fixture_pool.add("TES", FIXTURE_JOBS, 1)
+        assert fixture_pool.add("TES", FIXTURE_JOBS, 1) is first
+        second = fixture_pool.add("TES", FIXTURE_JOBS, 2)
+        fixture_pool.close()
+
+        assert {first.result()["id"], second.result()["id"]} == {"first", "second"}
+        assert fixture_pool.get_statistics() == {"created": 2, "failed": 0, "reused": 1}
+
+    def test_get_key(self):
+        """Asserts the key depends on the fixture sub-jobs and instance number"""
+
+        key = FixturePool.get_key("TES", FIXTURE_JOBS, 1)
+        assert key == FixturePool.get_key("TES", FIXTURE_JOBS, 1)
+        assert key != FixturePool.get_key("TES", FIXTURE_JOBS, 2)
+        assert key != FixturePool.get_key("TES", [{"name": "get_task"}], 1)
+
+    def test_create_failure(self):
+        """Asserts a failed fixture sub-job raises its own exception and is reported to the owner only"""
+
+        test_runner = MagicMock()
+        test_runner.run_tests.side_effect = TestRunnerException("test", "test", "test")
+        fixture_pool = FixturePool(MagicMock(return_value=test_runner), 1)
+        future = fixture_pool.add("TES", FIXTURE_JOBS, 1, "first.yml")
+        assert fixture_pool.add("TES", FIXTURE_JOBS, 1, "second.yml") is future
+        fixture_pool.close()
+
+        with pytest.raises(TestRunnerException):
+            future.result()
+        assert fixture_pool.get_statistics()["failed"] == 1
+        key = FixturePool.get_key("TES", FIXTURE_JOBS, 1)
+        report_tests = fixture_pool.get_report_tests(key, "first.yml")
+        assert len(report_tests) == 1
+        assert test_runner.run_tests.call_args.args[1] is report_tests[0]
+        assert fixture_pool.get_report_tests(key, "second.yml") == []
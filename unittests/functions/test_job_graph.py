@@ -0,0 +1,55 @@
+"""Module unittests.functions.test_job_graph.py
+
+This module tests the job_graph.py file
+"""
+
+from compliance_suite.functions.job_graph import (
+    JobGraph,
+    JobGraphRun
+)
+
+CREATE_TASK = {"name": "create_task", "operation": "POST", "storage_vars": {"id": "$response.id"}}
+CANCEL_TASK = {"name": "cancel_task", "operation": "POST", "path_parameters": {"id": "{id}"}}
+GET_TASK = {"name": "get_task", "operation": "GET", "path_parameters": {"id": "{id}"},
+            "query_parameters": [{"view": "MINIMAL"}]}
+LIST_TASKS = {"name": "list_tasks", "operation": "GET", "query_parameters": [{"view": "MINIMAL"}],
+              "storage_vars": {"next_page_token": "$response.next_page_token"}}
+LIST_TASKS_PAGE = {"name": "list_tasks", "operation": "GET", "query_parameters": [{"page_token": "{next_page_token}"}]}
+
+
+class TestJobGraph:
+
+    def test_dependencies_page_token(self):
+        """Asserts the create task sub-jobs are independent and the list tasks wait for them"""
+
+        graph = JobGraph([CREATE_TASK, CREATE_TASK, LIST_TASKS, LIST_TASKS_PAGE])
+
+        assert graph.consumed[3] == {"next_page_token"}
+        assert graph.dependencies == [set(), set(), {0, 1}, {2}]
+        assert graph.get_ready(set(), set()) == [0, 1]
+        assert graph.get_ready({0}, {0, 1}) == []
+        assert graph.get_ready({0, 1}, {0, 1}) == [2]
+
+    def test_dependencies_cancel(self):
+        """Asserts the sub-jobs of a same task are ordered around its cancellation"""
+
+        graph = JobGraph([CREATE_TASK, GET_TASK, CANCEL_TASK, GET_TASK])
+
+        assert graph.dependencies == [set(), {0}, {0, 1}, {0, 2}]
+        assert graph.get_producers("id", 3) == [0]
+
+    def test_run_concurrency_and_failure(self):
+        """Asserts the run starts the ready sub-jobs within the concurrency and no further sub-job after a failure"""
+
+        graph_run = JobGraphRun(JobGraph([CREATE_TASK, CREATE_TASK, CREATE_TASK, LIST_TASKS]), 2)
+        assert graph_run.get_startable() == [0, 1]
+        for index in graph_run.get_startable():
+            graph_run.start(index, None, None)
+        assert graph_run.get_startable() == []
+
+        graph_run.finish(0, None)
+        assert graph_run.get_startable() == [2]
+        graph_run.start(2, None, None)
+        graph_run.finish(1, ValueError("failed"))
+        assert graph_run.get_startable() == []
+        assert list(graph_run.errors.keys()) == [1]
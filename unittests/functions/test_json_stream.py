@@ -0,0 +1,63 @@
+"""Module unittests.functions.test_json_stream.py
+
+This module tests the json_stream.py file
+"""
+
+import json
+
+import pytest
+
+from compliance_suite.functions.json_stream import (
+    JsonStreamReader,
+    StreamedArray
+)
+
+RESPONSE = {
+    "next_page_token": "token \"}]",
+    "tasks": [{"id": "task-1", "tags": {"path": "a\\b[{"}}, {"id": "task-2", "state": "COMPLETE"}, [], "task-4"],
+    "count": 4
+}
+
+
+class TestJsonStream:
+
+    @pytest.mark.parametrize("chunk_size", [1, 3, 7, 4096])
+    def test_read_object(self, chunk_size):
+        """Asserts the array elements are passed one by one and the other members returned, whatever the chunking"""
+
+        document = json.dumps(RESPONSE, indent=1).encode()
+        chunks = [document[index:index + chunk_size] for index in range(0, len(document), chunk_size)]
+        elements = []
+        members = JsonStreamReader(chunks).read_object("tasks", elements.append)
+
+        assert elements == RESPONSE["tasks"]
+        assert members == dict(RESPONSE, tasks=[])
+
+    def test_read_object_not_array(self):
+        """Asserts a member which is not an array is returned as is, so that the model validation reports it"""
+
+        assert JsonStreamReader([b'{"tasks": null}']).read_object("tasks", lambda element: None) == {"tasks": None}
+
+    @pytest.mark.parametrize("document", [b'{"tasks": [1, 2', b'{"tasks": [1 2]}', b'{"tasks": []} []', b'[]',
+                                          b'{"tasks": ["a]}', b'{tasks: []}', b'{"tasks": [tru]}', b''])
+    def test_read_object_invalid(self, document):
+        """Asserts an invalid JSON document raises the decoding error"""
+
+        with pytest.raises(json.JSONDecodeError):
+            JsonStreamReader([document]).read_object("tasks", lambda element: None)
+
+    def test_streamed_array(self):
+        """Asserts the streamed array keeps the count, the looked up elements and the found values only"""
+
+        streamed_array = StreamedArray({1}, 2, ["task-4", "task-5"])
+        for element in RESPONSE["tasks"]:
+            streamed_array.add(element)
+
+        assert isinstance(streamed_array, list)
+        assert len(streamed_array) == 4
+        assert streamed_array[1] == {"id": "task-2", "state": "COMPLETE"}
+        assert streamed_array[-1] == "task-4"
+        assert streamed_array[2] == []
+        assert "task-4" in streamed_array and "task-5" not in streamed_array
+        with pytest.raises(KeyError):
+            streamed_array[0]
@@ -0,0 +1,37 @@
+"""Module unittests.functions.test_load_statistics.py
+
+This module tests the load_statistics.py file
+"""
+
+from compliance_suite.functions.load_statistics import LoadStatistics
+
+
+class TestLoadStatistics:
+
+    def test_get_percentile(self):
+        """Asserts the nearest-rank percentile of the sorted values"""
+
+        values = [float(value) for value in range(1, 101)]
+        assert LoadStatistics.get_percentile(values, 50) == 50.0
+        assert LoadStatistics.get_percentile(values, 99) == 99.0
+        assert LoadStatistics.get_percentile(values, 0) == 1.0
+        assert LoadStatistics.get_percentile([], 50) == 0.0
+
+    def test_get_summary(self):
+        """Asserts the requests are summarized per key and in total"""
+
+        load_statistics = LoadStatistics()
+        load_statistics.record("POST /tasks", 0.2, True)
+        load_statistics.record("POST /tasks", 0.4, False)
+        load_statistics.record("GET /tasks/{id}", 0.1, True)
+        load_statistics.add_iteration()
+        load_statistics.add_dropped()
+
+        summary = load_statistics.get_summary(2.0)
+        assert summary["iterations"] == 1
+        assert summary["dropped"] == 1
+        assert list(summary["endpoints"]) == ["GET /tasks/{id}", "POST /tasks"]
+        assert summary["endpoints"]["POST /tasks"]["error_rate"] == 0.5
+        assert summary["endpoints"]["POST /tasks"]["latency"]["p99"] == 0.4
+        assert summary["total"]["requests"] == 3
+        assert summary["total"]["throughput"] == 1.5
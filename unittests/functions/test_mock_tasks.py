@@ -0,0 +1,118 @@
+"""Module unittests.functions.test_mock_tasks.py
+
+This module is to test the Mock Task Store class and its methods
+"""
+
+import time
+
+from compliance_suite.functions.mock_tasks import MockTaskStore
+
+TASK = {"name": "CompTest", "executors": [{"image": "alpine", "command": ["echo", "hello"]}],
+        "inputs": [{"path": "/data/file", "content": "hello"}], "tags": {"foo": "bar", "task": "create"}}
+
+
+class TestMockTaskStore:
+
+    def test_state_transitions(self):
+        """Asserts a task is QUEUED, RUNNING and COMPLETE after the configured durations"""
+
+        task_store = MockTaskStore("1.1.0")
+        task_store.set_state_timings(1.0, 2.0)
+        record = task_store.tasks[task_store.add_task(TASK)]
+        assert task_store.get_state(record, record["created"] + 0.5) == "QUEUED"
+        assert task_store.get_state(record, record["created"] + 1.5) == "RUNNING"
+        assert task_store.get_state(record, record["created"] + 3.0) == "COMPLETE"
+
+    def test_cancel_task(self):
+        """Asserts a task canceled before its completion is CANCELED and an unknown task is not found"""
+
+        task_store = MockTaskStore("1.1.0")
+        task_store.set_state_timings(60.0, 60.0)
+        task_id = task_store.add_task(TASK)
+        assert task_store.cancel_task(task_id) == (200, {})
+        assert task_store.get_task(task_id, {})[1]["state"] == "CANCELED"
+        assert task_store.cancel_task("unknown")[0] == 404
+
+    def test_create_task(self):
+        """Asserts a valid task is created, and an invalid task or unsupported strict backend parameter is refused"""
+
+        task_store = MockTaskStore("1.1.0")
+        status, response = task_store.create_task(TASK)
+        assert status == 200 and response["id"] in task_store.tasks
+        assert task_store.create_task({"name": "No executors"})[0] == 400
+        assert task_store.create_task([])[0] == 400
+        resources = {"backend_parameters": {"INVALID": "PARAMETER"}, "backend_parameters_strict": True}
+        assert task_store.create_task(dict(TASK, resources=resources))[0] == 400
+        assert task_store.create_task(dict(TASK, resources=dict(resources, backend_parameters_strict=False)))[0] == 200
+
+    def test_get_task_views(self):
+        """Asserts the MINIMAL, BASIC and FULL views of a COMPLETE task"""
+
+        task_store = MockTaskStore("1.1.0")
+        task_id = task_store.add_task(TASK, age=10)
+        assert task_store.get_task(task_id, {"view": ["MINIMAL"]}) == (200, {"id": task_id, "state": "COMPLETE"})
+
+        basic = task_store.get_task(task_id, {"view": ["BASIC"]})[1]
+        assert "content" not in basic["inputs"][0]
+        assert "system_logs" not in basic["logs"][0] and "stdout" not in basic["logs"][0]["logs"][0]
+
+        full = task_store.get_task(task_id, {"view": ["FULL"]})[1]
+        assert full["inputs"][0]["content"] == "hello" and full["logs"][0]["logs"][0]["exit_code"] == 0
+        assert task_store.get_task(task_id, {"view": ["WRONG"]})[0] == 400
+        assert task_store.get_task("unknown", {})[0] == 404
+
+    def test_list_tasks_filters(self):
+        """Asserts the tasks are listed newest first and filtered by name prefix, state and tags"""
+
+        task_store = MockTaskStore("1.1.0")
+        task_store.set_state_timings(60.0, 60.0)
+        first_id = task_store.add_task(dict(TASK, name="First"), age=200)
+        second_id = task_store.add_task(dict(TASK, name="Second", tags={"abc": ""}))
+
+        assert [task["id"] for task in task_store.list_tasks({})[1]["tasks"]] == [second_id, first_id]
+        assert task_store.list_tasks({"name_prefix": ["Fir"]})[1]["tasks"] == [{"id": first_id, "state": "COMPLETE"}]
+        assert task_store.list_tasks({"state": ["QUEUED"]})[1]["tasks"] == [{"id": second_id, "state": "QUEUED"}]
+        assert len(task_store.list_tasks({"tag_key": ["task", "foo"], "tag_value": ["create", "bar"]})[1]["tasks"]) == 1
+        assert len(task_store.list_tasks({"tag_key": ["abc"]})[1]["tasks"]) == 1
+        assert task_store.list_tasks({"tag_key": ["foo"], "tag_value": ["wrong"]})[1]["tasks"] == []
+
+        task_store.version = "1.0.0"
+        assert len(task_store.list_tasks({"state": ["QUEUED"]})[1]["tasks"]) == 2
+
+    def test_list_tasks_pages(self):
+        """Asserts the synthetic tasks are paginated with the page token"""
+
+        task_store = MockTaskStore("1.1.0")
+        task_store.add_synthetic_tasks(5)
+        status, response = task_store.list_tasks({"view": ["FULL"], "page_size": ["2"]})
+        assert status == 200 and len(response["tasks"]) == 2 and response["next_page_token"] == "2"
+        assert response["tasks"][0]["name"] == "MockTask-4" and response["tasks"][0]["state"] == "COMPLETE"
+
+        response = task_store.list_tasks({"page_size": ["2"], "page_token": ["4"]})[1]
+        assert len(response["tasks"]) == 1 and "next_page_token" not in response
+        assert task_store.list_tasks({"page_token": ["invalid"]})[0] == 400
+        assert task_store.list_tasks({"page_size": ["0"]})[0] == 400
+
+    def test_state_follows_clock(self):
+        """Asserts the state of a stored task changes with the elapsed time"""
+
+        task_store = MockTaskStore("1.1.0")
+        task_store.set_state_timings(0.0, 0.05)
+        task_id = task_store.add_task(TASK)
+        assert task_store.get_task(task_id, {})[1]["state"] == "RUNNING"
+        time.sleep(0.06)
+        assert task_store.get_task(task_id, {})[1]["state"] == "COMPLETE"
+
+    def test_executor_error(self):
+        """Asserts a failing executor stops the task unless its error is ignored"""
+
+        task_store = MockTaskStore("1.1.0")
+        executors = [{"image": "alpine", "command": ["ERROR"]}, {"image": "alpine", "command": ["echo", "hello"]}]
+        failed_id = task_store.add_task(dict(TASK, executors=executors), age=10)
+        ignored_id = task_store.add_task(dict(TASK, executors=[dict(executors[0], ignore_error=True), executors[1]]),
+                                         age=10)
+
+        failed = task_store.get_task(failed_id, {"view": ["FULL"]})[1]
+        assert failed["state"] == "EXECUTOR_ERROR" and [log["exit_code"] for log in failed["logs"][0]["logs"]] == [1]
+        ignored = task_store.get_task(ignored_id, {"view": ["FULL"]})[1]
+        assert ignored["state"] == "COMPLETE" and [log["exit_code"] for log in ignored["logs"][0]["logs"]] == [1, 0]
@@ -0,0 +1,47 @@
+"""Module unittests.functions.test_model_registry.py
+
+This module tests the model_registry.py file
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from compliance_suite.constants.constants import ENDPOINT_TO_MODEL
+from compliance_suite.exceptions.compliance_exception import JobValidationException
+from compliance_suite.functions.model_registry import ModelRegistry
+from compliance_suite.models import v1_0_0_specs
+
+
+class TestModelRegistry:
+
+    def test_load(self):
+        """Asserts all the models of a version are resolved once"""
+
+        registry = ModelRegistry()
+        with patch("importlib.import_module", return_value=v1_0_0_specs) as mock_import_module:
+            models = registry.load("1.0.0")
+            assert registry.get_model("1.0.0", "service_info") is v1_0_0_specs.TesServiceInfo
+            assert registry.load("1.0.0") is models
+
+        mock_import_module.assert_called_once_with("compliance_suite.models.v1_0_0_specs")
+        assert set(models.keys()) == set(ENDPOINT_TO_MODEL.keys())
+
+    def test_load_unsupported_version(self):
+        """Asserts a missing version raises a job validation exception"""
+
+        with pytest.raises(JobValidationException):
+            ModelRegistry().load("x.y.z")
+
+    def test_load_missing_model(self):
+        """Asserts a model missing in the version module raises a job validation exception"""
+
+        with patch.dict(ENDPOINT_TO_MODEL, {"unknown": "TesUnknown"}):
+            with pytest.raises(JobValidationException):
+                ModelRegistry().load("1.0.0")
+
+    def test_get_model_unknown_endpoint(self):
+        """Asserts an unmapped endpoint model raises a job validation exception"""
+
+        with pytest.raises(JobValidationException):
+            ModelRegistry().get_model("1.0.0", "unknown")
@@ -0,0 +1,196 @@
+"""Module unittests.functions.test_poll_scheduler.py
+
+This module tests the poll_scheduler.py file
+"""
+
+from unittest.mock import (
+    MagicMock,
+    patch
+)
+
+import pytest
+
+from compliance_suite.exceptions.compliance_exception import (
+    TestFailureException,
+    TestRunnerException
+)
+from compliance_suite.functions.client import Client
+from compliance_suite.functions.poll_scheduler import PollScheduler
+from unittests.data.constants import TEST_URL
+
+
+def json_response(status_code, data):
+    """Create a mock response with the given status code and JSON data"""
+
+    response = MagicMock(status_code=status_code)
+    response.json.return_value = data
+    return response
+
+
+class TestPollScheduler:
+
+    @pytest.fixture
+    def poll_scheduler(self):
+        """Pytest fixture for a poll scheduler with a mock client"""
+
+        poll_scheduler = PollScheduler("TES", TEST_URL, "1.1.0", name_prefix="CompTest", page_size=2)
+        poll_scheduler.client = MagicMock()
+        return poll_scheduler
+
+    def test_tick_list_tasks(self, poll_scheduler):
+        """Asserts the task states are resolved via paged list tasks requests filtered by the expected states"""
+
+        empty_response = json_response(200, {"tasks": []})
+        poll_scheduler.client.send_request.side_effect = [
+            json_response(200, {"tasks": [{"id": "1", "state": "COMPLETE"}, {"id": "x", "state": "COMPLETE"}],
+                                "next_page_token": "token"}),
+            empty_response,
+            empty_response,
+            empty_response,
+            empty_response,
+            json_response(200, {"tasks": [{"id": "3", "state": "CANCELED"}]}),
+            empty_response
+        ]
+        complete = poll_scheduler.register("1", False, 10)
+        running = poll_scheduler.register("2", False, 10)
+        canceled = poll_scheduler.register("3", True, 10)
+        poll_scheduler.tick()
+
+        assert complete.future.result(timeout=0) == "COMPLETE"
+        assert canceled.future.result(timeout=0) == "CANCELED"
+        assert not running.future.done()
+        assert list(poll_scheduler.registrations.keys()) == ["2"]
+        query_params = [call.kwargs["query_params"] for call in poll_scheduler.client.send_request.call_args_list]
+        assert query_params[0] == {"view": "MINIMAL", "page_size": 2, "name_prefix": "CompTest", "state": "COMPLETE"}
+        assert query_params[1]["page_token"] == "token"
+        assert [params["state"] for params in query_params[2:]] == ["EXECUTOR_ERROR", "SYSTEM_ERROR", "PREEMPTED",
+                                                                    "CANCELED", "CANCELING"]
+        assert poll_scheduler.get_statistics() == {"ticks": 1, "list_requests": 7, "get_requests": 0, "resolved": 2}
+
+    def test_tick_state_filter_ignored(self, poll_scheduler):
+        """Asserts a single listing by name prefix is used if the server ignores the state filter"""
+
+        poll_scheduler.client.send_request.side_effect = [
+            json_response(200, {"tasks": [{"id": "1", "state": "COMPLETE"}, {"id": "2", "state": "RUNNING"}]}),
+            json_response(200, {"tasks": [{"id": "2", "state": "COMPLETE"}]})
+        ]
+        poll_scheduler.register("1", False, 10)
+        running = poll_scheduler.register("2", False, 10)
+        poll_scheduler.tick()
+
+        assert poll_scheduler.state_filter is False
+        assert not running.future.done()
+        assert poll_scheduler.get_statistics()["list_requests"] == 1
+        assert poll_scheduler.get_statistics()["get_requests"] == 0
+
+        poll_scheduler.tick()
+        assert running.future.result(timeout=0) == "COMPLETE"
+        assert "state" not in poll_scheduler.client.send_request.call_args.kwargs["query_params"]
+
+    def test_tick_without_prefix(self, poll_scheduler):
+        """Asserts the tasks are polled individually without task name prefix"""
+
+        poll_scheduler.name_prefix = ""
+        poll_scheduler.client.send_request.return_value = json_response(200, {"id": "1", "state": "COMPLETE"})
+        registration = poll_scheduler.register("1", False, 10)
+        poll_scheduler.tick()
+
+        assert registration.future.result(timeout=0) == "COMPLETE"
+        assert poll_scheduler.get_statistics()["list_requests"] == 0
+        assert poll_scheduler.client.send_request.call_args.kwargs["endpoint"] == "/tasks/{id}"
+
+    def test_tick_list_resolves_nothing(self):
+        """Asserts the listing is disabled after a tick whose listing found none of the outstanding tasks"""
+
+        poll_scheduler = PollScheduler("TES", TEST_URL, "1.0.0", name_prefix="CompTest")
+        poll_scheduler.client = MagicMock()
+        poll_scheduler.client.send_request.side_effect = [
+            json_response(200, {"tasks": [{"id": "x", "state": "COMPLETE"}]}),
+            json_response(200, {"id": "1", "state": "RUNNING"}),
+            json_response(200, {"id": "1", "state": "COMPLETE"})
+        ]
+        registration = poll_scheduler.register("1", False, 10)
+        poll_scheduler.tick()
+
+        assert poll_scheduler.list_supported is False
+        assert "state" not in poll_scheduler.client.send_request.call_args_list[0].kwargs["query_params"]
+        poll_scheduler.tick()
+        assert registration.future.result(timeout=0) == "COMPLETE"
+        assert poll_scheduler.get_statistics() == {"ticks": 2, "list_requests": 1, "get_requests": 2, "resolved": 1}
+
+    def test_tick_get_task_fallback(self, poll_scheduler):
+        """Asserts the tasks are polled individually if list tasks is not supported"""
+
+        poll_scheduler.client.send_request.side_effect = [
+            json_response(501, {}),
+            json_response(200, {"id": "1", "state": "EXECUTOR_ERROR"})
+        ]
+        registration = poll_scheduler.register("1", False, 10)
+        poll_scheduler.tick()
+
+        assert registration.future.result(timeout=0) == "EXECUTOR_ERROR"
+        assert poll_scheduler.list_supported is False
+        assert poll_scheduler.client.send_request.call_args.kwargs["path_params"] == {"id": "1"}
+
+    def test_unregister(self, poll_scheduler):
+        """Asserts a registration is removed from the outstanding set"""
+
+        registration = poll_scheduler.register("1", False, 10)
+        poll_scheduler.unregister("1", registration)
+        assert poll_scheduler.registrations == {}
+        assert poll_scheduler.get_interval() == 0
+
+    def test_start_stop(self, poll_scheduler):
+        """Asserts the scheduler thread resolves the registered tasks"""
+
+        list_response = json_response(200, {"tasks": [{"id": "1", "state": "COMPLETE"}]})
+        poll_scheduler.client.send_request.return_value = list_response
+        poll_scheduler.start()
+        registration = poll_scheduler.register("1", False, 0.01)
+        assert registration.future.result(timeout=5) == "COMPLETE"
+        poll_scheduler.stop()
+        assert poll_scheduler.thread is None
+
+    def test_unexpected_error(self, poll_scheduler):
+        """Asserts an unexpected tick error fails the waiting jobs and the scheduler keeps ticking"""
+
+        list_response = json_response(200, {"tasks": [{"id": "2", "state": "COMPLETE"}]})
+        poll_scheduler.client.send_request.side_effect = [KeyError("tasks"), list_response]
+        poll_scheduler.client.timings = [{"total": 0.1}]
+        poll_scheduler.start()
+        registration = poll_scheduler.register("1", False, 0.01)
+        with pytest.raises(TestRunnerException):
+            registration.future.result(timeout=5)
+        assert "1" not in poll_scheduler.registrations
+
+        registration = poll_scheduler.register("2", False, 0.01)
+        assert registration.future.result(timeout=5) == "COMPLETE"
+        poll_scheduler.stop()
+        assert poll_scheduler.client.timings == []
+
+    @patch("requests.get")
+    def test_scheduled_poll_request(self, mock_get):
+        """Asserts the client sends the request once the scheduler resolves the task state"""
+
+        mock_get.return_value = MagicMock(status_code=200, content=b"")
+        poll_scheduler = MagicMock()
+        poll_scheduler.register.return_value.future.result.return_value = "COMPLETE"
+
+        response = Client().scheduled_poll_request(poll_scheduler, service="TES", server=TEST_URL, version="1.0.0",
+                                                   endpoint="/tasks/{id}", path_params={"id": "1"},
+                                                   query_params={"view": "FULL"}, operation="GET",
+                                                   polling_interval=10, polling_timeout=100, check_cancel_val=False)
+        assert response.status_code == 200
+        poll_scheduler.register.assert_called_once_with("1", False, 10.0)
+        assert mock_get.call_args.kwargs["params"] == {"view": "FULL"}
+
+    def test_scheduled_poll_request_timeout(self):
+        """Asserts the scheduled polling request to throw Timeout Exception"""
+
+        poll_scheduler = PollScheduler("TES", TEST_URL, "1.0.0")
+        with pytest.raises(TestFailureException):
+            Client().scheduled_poll_request(poll_scheduler, service="TES", server=TEST_URL, version="1.0.0",
+                                            endpoint="/tasks/{id}", path_params={"id": "1"}, query_params={},
+                                            operation="GET", polling_interval=10, polling_timeout=0.01,
+                                            check_cancel_val=False)
+        assert poll_scheduler.registrations == {}
@@ -0,0 +1,92 @@
+"""Module unittests.functions.test_polling_strategy.py
+
+This module tests the polling_strategy.py file
+"""
+
+import pytest
+
+from compliance_suite.exceptions.compliance_exception import JobValidationException
+from compliance_suite.functions.polling_strategy import (
+    AdaptivePollingStrategy,
+    create_polling_strategy,
+    ExponentialPollingStrategy,
+    PollingHistory,
+    PollingStrategy
+)
+
+
+class TestPollingStrategy:
+
+    def test_fixed_strategy(self):
+        """Asserts the fixed strategy waits the polling interval by default"""
+
+        strategy = create_polling_strategy({"interval": "10", "timeout": 3600})
+        assert type(strategy) is PollingStrategy
+        assert [strategy.next_interval() for _ in range(3)] == [10, 10, 10]
+
+    def test_exponential_strategy(self):
+        """Asserts the exponential strategy backs off with jitter up to the cap"""
+
+        strategy = create_polling_strategy({"interval": 1, "timeout": 3600, "strategy": "exponential",
+                                            "max_interval": 4})
+        assert isinstance(strategy, ExponentialPollingStrategy)
+        for step in [0.5, 1, 2, 4, 4]:
+            assert step / 2 <= strategy.next_interval() <= step
+
+    def test_adaptive_strategy(self, tmp_path):
+        """Asserts the adaptive strategy first waits for the expected completion time and then backs off"""
+
+        history = PollingHistory(str(tmp_path / "history.json"))
+        for duration in [20, 30, 100]:
+            history.record("task:complete", duration)
+
+        strategy = create_polling_strategy({"interval": 2, "timeout": 3600, "strategy": "adaptive"},
+                                           history, "task:complete")
+        assert isinstance(strategy, AdaptivePollingStrategy)
+        assert strategy.next_interval() == 27
+        assert 0.25 <= strategy.next_interval() <= 0.5
+
+        unknown_strategy = create_polling_strategy({"interval": 2, "timeout": 3600, "strategy": "adaptive"},
+                                                   history, "other:complete")
+        assert 0.25 <= unknown_strategy.next_interval() <= 0.5
+
+    def test_adaptive_strategy_short_task(self, tmp_path):
+        """Asserts the adaptive strategy waits less than the polling interval for a task type completing quickly"""
+
+        history = PollingHistory(str(tmp_path / "history.json"))
+        for duration in [2, 2, 3]:
+            history.record("task:complete", duration)
+
+        strategy = create_polling_strategy({"interval": 10, "timeout": 3600, "strategy": "adaptive"},
+                                           history, "task:complete")
+        assert strategy.next_interval() == pytest.approx(1.8)
+        assert 0.25 <= strategy.next_interval() <= 0.5
+
+        history.record("instant:complete", 0.1)
+        instant_strategy = create_polling_strategy({"interval": 10, "timeout": 3600, "strategy": "adaptive"},
+                                                   history, "instant:complete")
+        assert instant_strategy.next_interval() == 0.5
+
+    def test_invalid_strategy(self):
+        """Asserts an unsupported strategy raises a job validation exception"""
+
+        with pytest.raises(JobValidationException):
+            create_polling_strategy({"interval": 2, "timeout": 3600, "strategy": "linear"})
+
+    def test_polling_history_save_load(self, tmp_path):
+        """Asserts the recorded completion times are persisted across runs"""
+
+        history_file = str(tmp_path / "cache" / "history.json")
+        history = PollingHistory(history_file)
+        history.load()
+        history.save()
+        assert not (tmp_path / "cache").exists()
+
+        for duration in range(30):
+            history.record("task:complete", duration)
+        history.save()
+
+        loaded_history = PollingHistory(history_file)
+        loaded_history.load()
+        assert loaded_history.durations["task:complete"] == [float(duration) for duration in range(10, 30)]
+        assert loaded_history.get_expected_duration("task:complete") == 19.5
@@ -0,0 +1,75 @@
+"""Module unittests.functions.test_profiler.py
+
+This module tests the profiler.py file
+"""
+
+import asyncio
+import os
+import pstats
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from compliance_suite.functions.profiler import Profiler
+
+
+class TestProfiler:
+
+    def test_stage_disabled(self):
+        """Asserts no stage is recorded while the profiler is disabled"""
+
+        profiler = Profiler()
+        with profiler.stage("yaml_load"):
+            pass
+        assert profiler.get_statistics() == {}
+
+    def test_stage_nested(self):
+        """Asserts the time of a nested stage is excluded from the exclusive time of its parent"""
+
+        profiler = Profiler()
+        profiler.enable()
+        with profiler.stage("polling_sleep"):
+            with profiler.stage("http_wait"):
+                time.sleep(0.02)
+        profiler.disable()
+
+        statistics = profiler.get_statistics()
+        assert statistics["polling_sleep"]["seconds"] >= 0.02
+        assert statistics["polling_sleep"]["exclusive_seconds"] < 0.02
+        assert statistics["http_wait"]["exclusive_seconds"] >= 0.02
+        assert list(profiler.stacks) == ["polling_sleep;http_wait", "polling_sleep"]
+
+    def test_stage_async(self):
+        """Asserts the stages of concurrent coroutines are not nested in each other"""
+
+        profiler = Profiler()
+
+        async def run_stage():
+            with profiler.stage("polling_sleep"):
+                await asyncio.sleep(0.01)
+
+        async def run_stages():
+            await asyncio.gather(run_stage(), run_stage())
+
+        profiler.enable()
+        asyncio.run(run_stages())
+        profiler.disable()
+
+        assert profiler.get_statistics()["polling_sleep"]["calls"] == 2
+        assert list(profiler.stacks) == ["polling_sleep"]
+
+    def test_cprofile_threads(self, tmpdir):
+        """Asserts the cProfile statistics contain the functions run by the worker threads"""
+
+        def run_worker():
+            return sum(range(100))
+
+        profiler = Profiler()
+        profiler.enable(cprofile=True)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            for future in [executor.submit(run_worker) for _ in range(4)]:
+                future.result()
+        profiler.disable()
+
+        output_file = os.path.join(tmpdir, "profile.pstats")
+        profiler.write_cprofile(output_file)
+        assert "run_worker" in [function for _, _, function in pstats.Stats(output_file).stats]
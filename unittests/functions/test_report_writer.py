@@ -0,0 +1,89 @@
+"""Module unittests.functions.test_report_writer.py
+
+This module tests the report_writer.py file
+"""
+
+import copy
+import io
+import json
+
+from compliance_suite.functions.report import (
+    Report,
+    ReportUtility
+)
+from compliance_suite.functions.report_writer import finalize_phase
+
+
+def create_report_buffer(name: str, passed: bool) -> Report:
+    """Create a report buffer with a single phase, test and case"""
+
+    report_buffer = Report()
+    phase = report_buffer.add_phase(name, "description")
+    case = phase.add_test().add_case()
+    if passed:
+        ReportUtility.case_pass(case, "message", "log")
+    else:
+        ReportUtility.case_fail(case, "message", "log")
+    return report_buffer
+
+
+class TestReportWriter:
+
+    def test_write_report(self, tmp_path):
+        """Asserts the report assembled from the stream file is identical to the in-memory report"""
+
+        report_buffers = [create_report_buffer("test_01.yml", True), create_report_buffer("test_02.yml", False)]
+
+        memory_report = Report()
+        stream_report = Report()
+        stream_report.report = copy.deepcopy(memory_report.report)
+        stream_report.set_stream(str(tmp_path / "report.ndjson"))
+        for test_number, report_buffer in enumerate(report_buffers, start=1):
+            stream_report.add_test_result(test_number, f"test_0{test_number}.yml", "passed",
+                                          copy.deepcopy(report_buffer))
+            memory_report.add_test_result(test_number, f"test_0{test_number}.yml", "passed", report_buffer)
+        memory_report.add_statistics("connections", {})
+        stream_report.add_statistics("connections", {})
+
+        assert stream_report.report.get_phases() == []
+        assert stream_report.generate() == memory_report.generate()
+        assert json.loads(stream_report.generate())["status"] == "FAIL"
+
+    def test_write_result(self, tmp_path):
+        """Asserts each finished test file is appended to the stream file as it completes"""
+
+        report = Report()
+        report.set_stream(str(tmp_path / "report.ndjson"))
+        report.add_test_result(1, "test_01.yml", "passed", create_report_buffer("test_01.yml", True))
+        report.add_test_result(2, "test_02.yml", "skipped", Report())
+
+        lines = (tmp_path / "report.ndjson").read_text().splitlines()
+        assert [json.loads(line)["file"] for line in lines] == ["test_01.yml", "test_02.yml"]
+        assert json.loads(lines[0])["phases"][0]["status"] == "PASS"
+        assert json.loads(lines[1])["phases"] == []
+
+    def test_write_empty_report(self, tmp_path):
+        """Asserts a stream without phases produces an empty phases list"""
+
+        report = Report()
+        report.set_stream(str(tmp_path / "report.ndjson"))
+        output = io.StringIO()
+        report.write_output(output)
+        assert json.loads(output.getvalue())["phases"] == []
+
+    def test_finalize_phase(self):
+        """Asserts the phase statuses and summaries are those of the ga4gh-testbed-lib report finalization"""
+
+        report_buffer = Report()
+        phase = report_buffer.add_phase("test_01.yml", "description")
+        for statuses in [["set_status_pass", "set_status_skip"], ["set_status_skip"], ["set_status_warn"], []]:
+            test = phase.add_test()
+            for status in statuses:
+                getattr(test.add_case(), status)()
+        library_report = copy.deepcopy(report_buffer.report)
+        library_report.finalize()
+
+        finalize_phase(phase)
+        assert json.dumps(phase, default=lambda component: component.__dict__) == \
+            json.dumps(library_report.get_phases()[0], default=lambda component: component.__dict__)
+        assert phase.get_status() == "WARN"
@@ -0,0 +1,55 @@
+"""Module unittests.functions.test_request_timing.py
+
+This module tests the request_timing.py file
+"""
+
+from http.server import (
+    BaseHTTPRequestHandler,
+    ThreadingHTTPServer
+)
+import threading
+
+from compliance_suite.functions.request_timing import time_request
+from compliance_suite.functions.session_pool import SessionPool
+
+
+class Handler(BaseHTTPRequestHandler):
+    """Request handler answering a fixed JSON body on a keep-alive connection"""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = b'{"id": "test"}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestRequestTiming:
+
+    def test_time_request(self):
+        """Asserts the connection time is only measured for the request opening the connection"""
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        url = f"http://127.0.0.1:{server.server_address[1]}/"
+        session_pool = SessionPool(1)
+        session = session_pool.get_session(url)
+        try:
+            response, first_timing = time_request(session.get, url)
+            _, second_timing = time_request(session.get, url)
+        finally:
+            session_pool.close()
+            server.shutdown()
+            server.server_close()
+
+        assert response.status_code == 200
+        assert first_timing["connect"] > 0
+        assert second_timing["connect"] == 0
+        assert first_timing["bytes"] == 14
+        assert first_timing["total"] >= first_timing["ttfb"]
@@ -0,0 +1,83 @@
+"""Module unittests.functions.test_result_cache.py
+
+This module tests the result_cache.py file
+"""
+
+import os
+import time
+
+from compliance_suite.functions.report import (
+    Report,
+    ReportUtility
+)
+from compliance_suite.functions.result_cache import ResultCache
+from unittests.data.constants import TEST_URL
+
+
+def create_phases():
+    """Create the report phases of a passed test file"""
+
+    report = Report()
+    phase = report.add_phase("test_01.yml", "description")
+    ReportUtility.case_pass(phase.add_test().add_case(), "message", "log")
+    return report.report.get_phases()
+
+
+class TestResultCache:
+
+    def test_get_key(self):
+        """Asserts any change to the server, version, test data or service info changes the key"""
+
+        key = ResultCache.get_key(TEST_URL, "1.0.0", {"jobs": [{"name": "a"}]}, {"id": "tes"})
+        assert key == ResultCache.get_key(TEST_URL, "1.0.0", {"jobs": [{"name": "a"}]}, {"id": "tes"})
+        assert key != ResultCache.get_key(TEST_URL, "1.1.0", {"jobs": [{"name": "a"}]}, {"id": "tes"})
+        assert key != ResultCache.get_key(TEST_URL, "1.0.0", {"jobs": [{"name": "b"}]}, {"id": "tes"})
+        assert key != ResultCache.get_key(TEST_URL, "1.0.0", {"jobs": [{"name": "a"}]}, {"id": "other"})
+
+    def test_put_and_get(self, tmp_path):
+        """Asserts a stored result is restored with its report phases"""
+
+        result_cache = ResultCache(str(tmp_path))
+        assert result_cache.get("key") is None
+        result_cache.put("key", create_phases())
+
+        phases = result_cache.get("key")
+        assert phases[0].get_phase_name() == "test_01.yml"
+        assert phases[0].get_tests()[0].get_cases()[0].get_status() == "PASS"
+        assert result_cache.get_statistics() == {"hits": 1, "misses": 1, "stored": 1, "evicted": 0}
+
+    def test_get_expired(self, tmp_path):
+        """Asserts an expired result is removed and not reused"""
+
+        result_cache = ResultCache(str(tmp_path), ttl=0)
+        result_cache.put("key", create_phases())
+        time.sleep(0.01)
+
+        assert result_cache.get("key") is None
+        assert not (tmp_path / "key.json").exists()
+
+    def test_evict(self, tmp_path):
+        """Asserts the oldest results are evicted above the cache size"""
+
+        result_cache = ResultCache(str(tmp_path), max_entries=2)
+        for index, key in enumerate(["first", "second", "third"]):
+            result_cache.put(key, create_phases())
+            os.utime(tmp_path / f"{key}.json", (index, index))
+
+        result_cache.put("fourth", create_phases())
+        assert sorted(entry.stem for entry in tmp_path.glob("*.json")) == ["fourth", "third"]
+
+    def test_evict_bytes(self, tmp_path):
+        """Asserts the oldest results are evicted above the total size of the cache"""
+
+        result_cache = ResultCache(str(tmp_path))
+        result_cache.put("first", create_phases())
+        entry_size = (tmp_path / "first.json").stat().st_size
+        os.utime(tmp_path / "first.json", (0, 0))
+
+        result_cache.max_bytes = 2 * entry_size + entry_size // 2
+        for index, key in enumerate(["second", "third"], start=1):
+            result_cache.put(key, create_phases())
+            os.utime(tmp_path / f"{key}.json", (index, index))
+        assert sorted(entry.stem for entry in tmp_path.glob("*.json")) == ["second", "third"]
+        assert result_cache.get_statistics()["evicted"] == 1
@@ -0,0 +1,75 @@
+"""Module unittests.functions.test_schema_validator.py
+
+This module tests the schema_validator.py file
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+from jsonschema import ValidationError
+from jsonschema.exceptions import best_match
+import pytest
+import yaml
+
+from compliance_suite.constants.constants import (
+    TEMPLATE,
+    TEST
+)
+from compliance_suite.functions.schema_validator import SchemaValidatorRegistry
+
+
+class TestSchemaValidatorRegistry:
+
+    def test_validate_test_and_template(self):
+        """Asserts the test and template files are validated with the schemas loaded once"""
+
+        registry = SchemaValidatorRegistry()
+        with open("unittests/data/run_job_tests/success_01.yml", "r") as f:
+            test_data = yaml.safe_load(f)
+        with open("unittests/data/templates/success_template.yml", "r") as f:
+            template_data = yaml.safe_load(f)
+
+        with patch.object(registry, "read_schema", wraps=registry.read_schema) as mock_read_schema:
+            registry.validate(test_data, TEST)
+            registry.validate(template_data, TEMPLATE)
+            registry.validate(template_data, TEMPLATE)
+
+        assert mock_read_schema.call_count == 3
+        assert registry.get_statistics()["validations"] == 3
+
+    def test_validate_invalid_data(self):
+        """Asserts a validation error is raised for the data not matching the schema"""
+
+        registry = SchemaValidatorRegistry()
+        with pytest.raises(ValidationError):
+            registry.validate({"description": "Missing mandatory fields"}, TEST)
+        assert registry.get_statistics()["validations"] == 1
+
+    def test_validate_best_match(self):
+        """Asserts the best matching validation error is raised"""
+
+        registry = SchemaValidatorRegistry()
+        yaml_data = {"description": 1, "service": "TES", "versions": "1.0.0"}
+        expected_error = best_match(registry.get_validator(TEST).iter_errors(yaml_data))
+        with pytest.raises(ValidationError) as err:
+            registry.validate(yaml_data, TEST)
+        assert err.value.message == expected_error.message
+        assert list(err.value.path) == list(expected_error.path)
+
+    def test_validator_per_thread(self):
+        """Asserts the schemas are loaded once and each thread validates with its own validator"""
+
+        registry = SchemaValidatorRegistry()
+        with open("unittests/data/templates/success_template.yml", "r") as f:
+            template_data = yaml.safe_load(f)
+
+        with patch.object(registry, "read_schema", wraps=registry.read_schema) as mock_read_schema:
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                list(executor.map(lambda _: registry.validate(template_data, TEMPLATE), range(8)))
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                thread_validator = executor.submit(registry.get_validator, TEMPLATE).result()
+
+        assert mock_read_schema.call_count == 3
+        assert registry.get_statistics()["validations"] == 8
+        assert registry.get_validator(TEMPLATE) is registry.get_validator(TEMPLATE)
+        assert thread_validator is not registry.get_validator(TEMPLATE)
@@ -0,0 +1,88 @@
+"""Module unittests.functions.test_session_pool.py
+
+This module tests the session_pool.py file
+"""
+
+import asyncio
+import http.server
+import threading
+
+import pytest
+
+from compliance_suite.functions.client import Client
+from compliance_suite.functions.session_pool import SessionPool
+
+
+class KeepAliveHandler(http.server.BaseHTTPRequestHandler):
+    """Request handler which keeps the connection open between the requests"""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = b'{"id": "test"}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestSessionPool:
+
+    @pytest.fixture
+    def server_url(self):
+        """Pytest fixture to run a local keep-alive server"""
+
+        server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        yield f"http://127.0.0.1:{server.server_address[1]}/ga4gh/tes/"
+        server.shutdown()
+        server.server_close()
+
+    def test_get_session_per_server(self):
+        """Asserts the same session is returned for the same server and a new one for another server"""
+
+        session_pool = SessionPool()
+        session = session_pool.get_session("https://test.com/ga4gh/tes/")
+        assert session_pool.get_session("https://test.com/other/") is session
+        assert session_pool.get_session("https://example.com/") is not session
+        session_pool.close()
+        assert session_pool.sessions == {}
+
+    def test_connection_reuse(self, server_url):
+        """Asserts the requests sent via the pooled session reuse the keep-alive connection"""
+
+        session_pool = SessionPool(pool_size=2)
+        client = Client(session_pool.get_session(server_url))
+        for _ in range(3):
+            response = client.send_request(service="TES", server=server_url, version="1.0.0",
+                                           endpoint="/service-info", path_params={}, query_params={},
+                                           operation="GET", request_body="")
+            assert response.status_code == 200
+
+        statistics = session_pool.get_statistics()[SessionPool.get_server_key(server_url)]
+        assert statistics == {"requests": 3, "connections": 1, "reused": 2}
+        session_pool.close()
+
+    def test_async_connection_reuse(self, server_url):
+        """Asserts the asynchronous requests are sent via the pooled session and reuse its keep-alive connection"""
+
+        session_pool = SessionPool(pool_size=2)
+        client = Client(session_pool.get_session(server_url))
+
+        async def send_requests():
+            for _ in range(3):
+                response = await client.async_send_request(service="TES", server=server_url, version="1.0.0",
+                                                           endpoint="/service-info", path_params={}, query_params={},
+                                                           operation="GET", request_body="")
+                assert response.status_code == 200
+
+        asyncio.run(send_requests())
+        statistics = session_pool.get_statistics()[SessionPool.get_server_key(server_url)]
+        assert statistics == {"requests": 3, "connections": 1, "reused": 2}
+        assert len(client.timings) == 3
+        session_pool.close()
@@ -0,0 +1,51 @@
+"""Module unittests.functions.test_template_cache.py
+
+This module tests the template_cache.py file
+"""
+
+import os
+from unittest.mock import MagicMock
+
+import pytest
+
+from compliance_suite.exceptions.compliance_exception import JobValidationException
+from compliance_suite.functions.template_cache import TemplateCache
+
+
+class TestTemplateCache:
+
+    def test_get_cached(self, tmp_path):
+        """Asserts the template is loaded once and served from the cache afterwards"""
+
+        template_file = tmp_path / "template.yml"
+        template_file.write_text("- name: list_tasks")
+        loader = MagicMock(return_value=[{"name": "list_tasks"}])
+
+        template_cache = TemplateCache()
+        for _ in range(3):
+            assert template_cache.get(str(template_file), loader) == [{"name": "list_tasks"}]
+
+        loader.assert_called_once_with(str(template_file))
+        assert template_cache.get_statistics() == {"hits": 2, "misses": 1}
+
+    def test_get_modified(self, tmp_path):
+        """Asserts a modified template is loaded again"""
+
+        template_file = tmp_path / "template.yml"
+        template_file.write_text("- name: list_tasks")
+        loader = MagicMock(side_effect=[["old"], ["new"]])
+
+        template_cache = TemplateCache()
+        assert template_cache.get(str(template_file), loader) == ["old"]
+        stat = os.stat(template_file)
+        os.utime(template_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert template_cache.get(str(template_file), loader) == ["new"]
+        assert template_cache.get_statistics() == {"hits": 0, "misses": 2}
+
+    def test_get_missing_template(self, tmp_path):
+        """Asserts a reference to a missing template raises a job validation exception"""
+
+        loader = MagicMock()
+        with pytest.raises(JobValidationException):
+            TemplateCache().get(str(tmp_path / "missing.yml"), loader)
+        loader.assert_not_called()
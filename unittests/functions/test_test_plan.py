@@ -0,0 +1,63 @@
+"""Module unittests.functions.test_test_plan.py
+
+This module tests the test_plan.py file
+"""
+
+import zlib
+
+import pytest
+
+from compliance_suite.exceptions.compliance_exception import JobValidationException
+from compliance_suite.functions.test_plan import TestPlan
+
+
+class TestTestPlan:
+
+    def test_write_load(self, tmp_path):
+        """Asserts a written plan is loaded with its test files, jobs and templates in the run order"""
+
+        plan = TestPlan()
+        plan.add_test("tests/b.yml", {"jobs": []}, [{"name": "list_tasks", "response": {200: ""}}])
+        plan.add_test("tests/a.yml", {"jobs": []}, [])
+        plan.add_template("./templates/template.yml", [{"name": "list_tasks"}])
+        plan.write(str(tmp_path / "plan.bin"))
+
+        loaded_plan = TestPlan()
+        loaded_plan.load(str(tmp_path / "plan.bin"))
+        assert loaded_plan.get_files() == ["tests/b.yml", "tests/a.yml"]
+        assert loaded_plan.get_jobs("tests/b.yml") == [{"name": "list_tasks", "response": {"200": ""}}]
+        assert loaded_plan.contains("./templates/template.yml", "Template")
+        assert not loaded_plan.contains("tests/c.yml", "Test")
+
+    def test_get_jobs_copy(self):
+        """Asserts the jobs are copied, so that a run does not modify the plan"""
+
+        plan = TestPlan()
+        plan.add_test("tests/a.yml", {"jobs": []}, [{"name": "get_task", "path_parameters": {"id": "{id}"}}])
+        plan.get_jobs("tests/a.yml")[0]["path_parameters"]["id"] = "task-1"
+        assert plan.get_jobs("tests/a.yml")[0]["path_parameters"]["id"] == "{id}"
+
+    def test_invalid_test(self):
+        """Asserts the exception of an invalid test file is raised again when its data or jobs are read"""
+
+        plan = TestPlan()
+        plan.add_test("tests/a.yml", err=JobValidationException(name="YAML Schema Validation Error",
+                                                                message="Invalid YAML", details="jobs"))
+        plan.add_test("tests/b.yml", {"jobs": []},
+                      err=JobValidationException(name="YAML Error", message="Invalid template", details=None))
+        with pytest.raises(JobValidationException, match="Invalid YAML"):
+            plan.get_data("tests/a.yml", "Test")
+        assert plan.get_data("tests/b.yml", "Test") == {"jobs": []}
+        with pytest.raises(JobValidationException, match="Invalid template"):
+            plan.get_jobs("tests/b.yml")
+
+    def test_load_invalid(self, tmp_path):
+        """Asserts a file which is not a plan, or a plan of another format, is rejected"""
+
+        (tmp_path / "plan.bin").write_text("jobs: []")
+        with pytest.raises(JobValidationException, match="cannot be read"):
+            TestPlan().load(str(tmp_path / "plan.bin"))
+
+        (tmp_path / "plan.bin").write_bytes(zlib.compress(b'{"format": 0, "tests": [], "templates": {}}'))
+        with pytest.raises(JobValidationException, match="another format"):
+            TestPlan().load(str(tmp_path / "plan.bin"))
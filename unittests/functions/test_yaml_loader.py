@@ -0,0 +1,48 @@
+"""Module unittests.functions.test_yaml_loader.py
+
+This module tests the yaml_loader.py file
+"""
+
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from compliance_suite.functions.yaml_loader import (
+    load_yaml_string,
+    YAML_PARSER,
+    YamlLoader
+)
+
+
+class TestYamlLoader:
+
+    def test_load(self, tmp_path):
+        """Asserts a file is parsed and the loading statistics are recorded"""
+
+        (tmp_path / "test.yml").write_text("service: TES\nresponse:\n  200: ''\n")
+        yaml_loader = YamlLoader()
+        assert yaml_loader.load(str(tmp_path / "test.yml")) == {"service": "TES", "response": {200: ""}}
+
+        statistics = yaml_loader.get_statistics()
+        assert statistics["parser"] == YAML_PARSER
+        assert statistics["files"] == 1
+        assert statistics["bytes"] == len("service: TES\nresponse:\n  200: ''\n")
+
+    def test_load_streamed(self, tmp_path):
+        """Asserts a file larger than the bulk read size is streamed to the parser"""
+
+        (tmp_path / "test.yml").write_text("- name: list_tasks\n" * 10)
+        with patch("compliance_suite.functions.yaml_loader.YAML_BULK_READ_SIZE", 16):
+            assert YamlLoader().load(str(tmp_path / "test.yml")) == [{"name": "list_tasks"}] * 10
+
+    def test_load_invalid(self, tmp_path):
+        """Asserts an invalid file raises the YAML error, is closed and counted"""
+
+        (tmp_path / "invalid.yml").write_text("jobs: [\n")
+        yaml_loader = YamlLoader()
+        with pytest.raises(yaml.YAMLError):
+            yaml_loader.load(str(tmp_path / "invalid.yml"))
+        assert yaml_loader.get_statistics()["files"] == 1
+        with pytest.raises(yaml.YAMLError):
+            load_yaml_string("jobs: [\n")
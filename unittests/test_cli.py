@@ -3,6 +3,8 @@
 This module is to test the entry point CLI functionality
 """
 
+import subprocess
+import sys
 from unittest.mock import (
     MagicMock,
     mock_open,
@@ -11,8 +13,10 @@ from unittest.mock import (
 
 from click.testing import CliRunner
 
-from compliance_suite.cli import main, report
+from compliance_suite.cli import compile_plan, load, main, mock_server, report
 from compliance_suite.job_runner import JobRunner
+from compliance_suite.load_runner import LoadRunner
+from compliance_suite.mock_server import MockServer
 from compliance_suite.report_server import ReportServer
 from unittests.data.constants import TEST_URL
 
@@ -26,33 +30,43 @@ class TestJobRunner:
         result = runner.invoke(main)
         assert result.exit_code == 0
 
-    @patch.object(JobRunner, "generate_report")
+    def test_lazy_imports(self):
+        """asserts the CLI module does not import the runners and their libraries before a command is run"""
+
+        modules = subprocess.run(
+            [sys.executable, "-c", "import sys, compliance_suite.cli; print(' '.join(sys.modules))"],
+            capture_output=True, text=True, check=True).stdout.split()
+        for module in ["compliance_suite.job_runner", "compliance_suite.report_server", "jinja2", "jsonschema",
+                       "pydantic", "requests", "yaml"]:
+            assert module not in modules
+
+    @patch.object(JobRunner, "write_report")
     @patch.object(JobRunner, "run_jobs")
-    def test_report_no_tag(self, mock_run_jobs, mock_generate_reports):
+    def test_report_no_tag(self, mock_run_jobs, mock_write_report):
         """ asserts if the application is invoked if no tags provided"""
 
         with patch('builtins.open', mock_open()):
             mock_run_jobs.return_value = {}
-            mock_generate_reports.return_value = '{"test": "test"}'
             runner = CliRunner()
             result = runner.invoke(report, ['--server', TEST_URL, '--version', '1.0.0'])
             assert result.exit_code == 0
+            assert len(mock_write_report.call_args.args[0]) == 1
 
     @patch.object(ReportServer, 'serve_thread')
-    @patch.object(JobRunner, "generate_report")
+    @patch.object(JobRunner, "write_report")
     @patch.object(JobRunner, "run_jobs")
-    def test_report(self, mock_run_jobs, mock_generate_reports, mock_report_server):
+    def test_report(self, mock_run_jobs, mock_write_report, mock_report_server):
         """ asserts if the application is invoked if the report output path is provided"""
 
         with patch('builtins.open', mock_open()):
             mock_run_jobs.return_value = {}
-            mock_generate_reports.return_value = '{"test": "test"}'
             mock_report_server.return_value = MagicMock()
             runner = CliRunner()
             result = runner.invoke(report, ['--server', TEST_URL, '--version', '1.0.0', '--include-tags', 'test',
                                             '--output_path', "path/to/output", '--serve', '--port', 9090,
                                             '--uptime', 1000])
             assert result.exit_code == 0
+            assert mock_write_report.call_args.args[0][0] == "path/to/output/report.json"
 
     def test_validate_regex_failure(self):
         """Asserts if the application raises CLI error if invalid regex is provided for tags"""
@@ -71,3 +85,41 @@ class TestJobRunner:
         assert result.exit_code == 1
         assert result.exception.__class__ == FileNotFoundError
         assert "Test path: invalid/path not found" in result.exception.__str__()
+
+    @patch.object(LoadRunner, "generate_summary")
+    @patch.object(LoadRunner, "run")
+    def test_load(self, mock_run, mock_generate_summary):
+        """ asserts the load command replays the test files and writes the load summary in the output path"""
+
+        with patch('builtins.open', mock_open()) as mock_file:
+            mock_run.return_value = {"iterations": 1}
+            runner = CliRunner()
+            result = runner.invoke(load, ['--server', TEST_URL, '--version', '1.0.0', '--duration', 1,
+                                          '--rate', 5, '--concurrency', 2, '--output_path', "path/to/output"])
+            assert result.exit_code == 0
+            mock_file.assert_called_once_with("path/to/output/load_report.json", "w")
+
+    @patch.object(MockServer, "serve")
+    def test_mock_server(self, mock_serve):
+        """ asserts the mock-server command configures and serves the mock TES server"""
+
+        runner = CliRunner()
+        result = runner.invoke(mock_server, ['--version', '1.0.0', '--port', 9000, '--latency', 0.1,
+                                             '--error-rate', 0.2, '--task-count', 2])
+        assert result.exit_code == 0
+        mock_serve.assert_called_once_with(9000)
+
+    def test_compile_plan(self, tmp_path):
+        """ asserts the compile command writes the test plan, which is run by the report command"""
+
+        runner = CliRunner()
+        result = runner.invoke(compile_plan, ['--test-path', 'unittests/data/run_job_tests',
+                                              '--output', str(tmp_path / "plan.bin")])
+        assert result.exit_code == 0
+        assert (tmp_path / "plan.bin").exists()
+
+        with patch.object(JobRunner, "run_jobs") as mock_run_jobs, patch.object(JobRunner, "write_report"):
+            result = runner.invoke(report, ['--server', TEST_URL, '--version', '1.0.0', '--test-path', 'invalid/path',
+                                            '--plan', str(tmp_path / "plan.bin")])
+        assert result.exit_code == 0
+        mock_run_jobs.assert_called_once()
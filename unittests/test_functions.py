@@ -3,20 +3,26 @@
 This module is to test the project functions
 """
 
+import asyncio
+import concurrent.futures
+import os
+import tempfile
 import unittest
 from unittest.mock import (
     MagicMock,
     patch
 )
 
-import polling2
 from requests.models import Response
 
 from compliance_suite.exceptions.compliance_exception import (
     TestFailureException,
     TestRunnerException
 )
-from compliance_suite.functions.client import Client
+from compliance_suite.functions.client import (
+    Client,
+    run_blocking
+)
 from compliance_suite.functions.report import Report
 
 
@@ -42,6 +48,20 @@ class TestFunctions(unittest.TestCase):
                                            query_params={"test": "test"}, operation="GET", request_body="")
         assert get_response.status_code == 200
 
+    @patch('requests.get')
+    def test_send_request_timing(self, mock_get):
+        """ Asserts the HTTP exchange of a request is timed"""
+
+        mock_get.return_value = MagicMock(status_code=200, content=b'{"id": "test"}')
+        client = Client()
+        client.send_request(service="TES", server="test-server", version="1.0.0", endpoint="/tasks/{id}",
+                            path_params={"id": "test"}, query_params={}, operation="GET", request_body="")
+
+        assert len(client.timings) == 1
+        assert client.timings[0]["url"] == "test-serverv1/tasks/test"
+        assert client.timings[0]["bytes"] == 14
+        assert client.timings[0]["total"] >= 0
+
     def test_send_request_get_failure(self):
         """ Asserts the Get endpoint to throw Connection error due to invalid server URL"""
 
@@ -63,25 +83,33 @@ class TestFunctions(unittest.TestCase):
                                        operation="POST", request_body="{}")
         assert response.status_code == 200
 
-    @patch('polling2.poll')
+    @patch('requests.get')
     def test_polling_request_success(self, mock_get):
         """ Asserts the polling response status to be 200"""
 
-        mock_get.return_value = MagicMock(status_code=200)
+        running_response = MagicMock(status_code=200)
+        running_response.json.return_value = {"state": "RUNNING"}
+        complete_response = MagicMock(status_code=200)
+        complete_response.json.return_value = {"state": "COMPLETE"}
+        mock_get.side_effect = [running_response, complete_response]
 
         client = Client()
         get_response = client.poll_request(service="TES", server="test-server", version="test-version",
                                            endpoint="test-endpoint", path_params={"test": "test"},
                                            query_params={"test": "test"}, operation="test",
-                                           polling_interval=10, polling_timeout=3600,
+                                           polling_interval=0, polling_timeout=3600,
                                            check_cancel_val=False)
         assert get_response.status_code == 200
+        assert mock_get.call_count == 2
+        assert len(client.timings) == 2
 
-    @patch('polling2.poll')
+    @patch('requests.get')
     def test_polling_request_timeout(self, mock_get):
         """ Asserts the polling request to throw Timeout Exception"""
 
-        mock_get.side_effect = polling2.TimeoutException(MagicMock())
+        running_response = MagicMock(status_code=200)
+        running_response.json.return_value = {"state": "RUNNING"}
+        mock_get.return_value = running_response
 
         client = Client()
         with self.assertRaises(TestFailureException):
@@ -98,6 +126,76 @@ class TestFunctions(unittest.TestCase):
                                 endpoint="test-endpoint", path_params={"test": "test"}, query_params={"test": "test"},
                                 operation="test", polling_interval=10, polling_timeout=3600, check_cancel_val=False)
 
+    @patch('requests.post')
+    def test_async_send_request_post(self, mock_post):
+        """ Asserts the asynchronous Post endpoint response status to be 200"""
+
+        mock_post.return_value = MagicMock(status_code=200)
+
+        client = Client()
+        response = asyncio.run(client.async_send_request(service="TES", server="test-server", version="1.0.0",
+                                                         endpoint="test-endpoint", path_params={}, query_params={},
+                                                         operation="POST", request_body="{}"))
+        assert response.status_code == 200
+
+    @patch('requests.get')
+    def test_async_polling_request_success(self, mock_get):
+        """ Asserts the asynchronous polling request to retry until the expected state is received"""
+
+        running_response = MagicMock(status_code=200)
+        running_response.json.return_value = {"state": "RUNNING"}
+        complete_response = MagicMock(status_code=200)
+        complete_response.json.return_value = {"state": "COMPLETE"}
+        mock_get.side_effect = [running_response, complete_response]
+
+        client = Client()
+        response = asyncio.run(client.async_poll_request(service="TES", server="test-server", version="1.0.0",
+                                                         endpoint="/tasks/{id}", path_params={"id": "1234"},
+                                                         query_params={}, operation="GET", polling_interval=0,
+                                                         polling_timeout=10, check_cancel_val=False))
+        assert response is complete_response
+        assert mock_get.call_count == 2
+        assert mock_get.call_args[0][0] == "test-serverv1/tasks/1234"
+
+    @patch('requests.get')
+    def test_async_polling_request_timeout(self, mock_get):
+        """ Asserts the asynchronous polling request to throw Timeout Exception"""
+
+        running_response = MagicMock(status_code=200)
+        running_response.json.return_value = {"state": "RUNNING"}
+        mock_get.return_value = running_response
+
+        client = Client()
+        with self.assertRaises(TestFailureException):
+            asyncio.run(client.async_poll_request(service="TES", server="test-server", version="1.0.0",
+                                                  endpoint="test-endpoint", path_params={}, query_params={},
+                                                  operation="GET", polling_interval=10, polling_timeout=5,
+                                                  check_cancel_val=False))
+
+    def test_async_scheduled_poll_request_timeout(self):
+        """ Asserts the asynchronous scheduled polling request to throw Timeout Exception without cancelling the
+        scheduler future, as the sync version"""
+
+        poll_scheduler = MagicMock()
+        future = concurrent.futures.Future()
+        poll_scheduler.register.return_value.future = future
+
+        client = Client()
+        with self.assertRaises(TestFailureException):
+            asyncio.run(client.async_scheduled_poll_request(poll_scheduler, service="TES", server="test-server",
+                                                            version="1.0.0", endpoint="/tasks/{id}",
+                                                            path_params={"id": "1"}, query_params={},
+                                                            operation="GET", polling_interval=10,
+                                                            polling_timeout=0.01, check_cancel_val=False))
+        assert not future.cancelled()
+        poll_scheduler.unregister.assert_called_once()
+
+    def test_run_blocking_suspended(self):
+        """ Asserts a coroutine awaiting the event loop cannot be run by the blocking engine"""
+
+        with self.assertRaises(RuntimeError):
+            run_blocking(asyncio.sleep(0))
+
     def test_check_poll_create(self):
         """ Asserts the check poll function to be True for status code 200 and COMPLETE state"""
 
@@ -144,3 +242,33 @@ class TestFunctions(unittest.TestCase):
         resp.json.return_value = {"state": "RANDOM"}
 
         assert client.check_poll(resp) is False
+
+    def test_report_extend_phases(self):
+        """Asserts the phases of a report buffer are appended in order"""
+
+        report = Report()
+        report_buffer = Report()
+        report_buffer.add_phase("first", "first phase")
+        report_buffer.add_phase("second", "second phase")
+        report.extend_phases(report_buffer)
+
+        assert [phase.get_phase_name() for phase in report.report.get_phases()] == ["first", "second"]
+
+    def test_report_add_statistics(self):
+        """Asserts the run statistics are included in the generated report"""
+
+        report = Report()
+        report.add_statistics("connections", {"https://test.com": {"requests": 2, "connections": 1, "reused": 1}})
+
+        assert '"reused": 1' in report.generate()
+
+    def test_report_write(self):
+        """Asserts the report is written to all the output files"""
+
+        report = Report()
+        with tempfile.TemporaryDirectory() as output_dir:
+            output_files = [os.path.join(output_dir, "report.json"), os.path.join(output_dir, "web_report.json")]
+            report.write(output_files)
+
+            with open(output_files[0]) as report_file, open(output_files[1]) as web_report_file:
+                assert report_file.read() == web_report_file.read()
@@ -3,6 +3,10 @@
 This module is to test the Job Runner class and its methods
 """
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import json
+import tracemalloc
 from pathlib import Path
 from unittest.mock import (
     MagicMock,
@@ -13,9 +17,14 @@ import pytest
 
 from compliance_suite.exceptions.compliance_exception import (
     JobValidationException,
+    TestFailureException,
     TestRunnerException
 )
+from compliance_suite.functions.discovery_index import DiscoveryIndex
+from compliance_suite.functions.poll_scheduler import PollScheduler
 from compliance_suite.functions.report import Report
+from compliance_suite.functions.result_cache import ResultCache
+from compliance_suite.functions.yaml_loader import YamlLoader
 from compliance_suite.job_runner import JobRunner
 from compliance_suite.test_runner import TestRunner
 from unittests.data.constants import TEST_URL
@@ -27,6 +36,7 @@ YAML_TEST_PATH_INVALID = Path("unittests/data/run_job_tests/invalid_yaml.yml")
 YAML_TEST_PATH_SKIP = Path("unittests/data/run_job_tests/skip_01.yml")
 YAML_TEST_PATH_FAIL = Path("unittests/data/run_job_tests/fail_service_info.yml")
 YAML_WRONG_SCHEMA = Path("unittests/data/tests/wrong_schema_yaml.yml")
+YAML_TEST_PATH_FIXTURE = Path("unittests/data/fixture_tests/fixture_01.yml")
 
 
 class TestJobRunner:
@@ -101,3 +111,305 @@ class TestJobRunner:
         job_runner_object.set_report(MagicMock())
         job_runner_object.initialize_test(YAML_TEST_PATH_INVALID)
         assert len(job_runner_object.test_status["failed"]) == 1
+
+    @patch.object(JobRunner, 'initialize_test')
+    def test_run_jobs_unsupported_version(self, mock_initialize_test):
+        """ Asserts an unsupported version fails before any test is run"""
+
+        job_runner_object = JobRunner(TEST_URL, "x.y.z")
+        job_runner_object.set_test_path(["unittests/data/run_job_tests"])
+        with pytest.raises(JobValidationException):
+            job_runner_object.run_jobs()
+        mock_initialize_test.assert_not_called()
+
+    @patch.object(JobRunner, 'initialize_test', side_effect=KeyboardInterrupt)
+    def test_run_jobs_interrupted(self, mock_initialize_test, tmp_path):
+        """ Asserts the run-scoped threads, servers and the checkpoint journal are closed if the run is interrupted"""
+
+        job_runner_object = JobRunner(TEST_URL, "1.0.0")
+        job_runner_object.set_test_path([str(YAML_TEST_PATH_SUCCESS)])
+        job_runner_object.set_checkpoint(str(tmp_path / "journal.ndjson"))
+        job_runner_object.set_batch_polling(True)
+        job_runner_object.set_profile(True)
+        with patch.object(PollScheduler, 'stop', autospec=True, side_effect=PollScheduler.stop) as mock_stop:
+            with pytest.raises(KeyboardInterrupt):
+                job_runner_object.run_jobs()
+
+        scheduler = mock_stop.call_args[0][0]
+        assert scheduler.thread is None and scheduler.stopped
+        assert job_runner_object.poll_scheduler is None
+        assert job_runner_object.fixture_pool.executor._shutdown
+        assert job_runner_object.checkpoint.journal is None
+        assert job_runner_object.session_pool.sessions == {}
+        assert not tracemalloc.is_tracing()
+
+    @patch.object(TestRunner, 'run_tests')
+    def test_run_jobs_profile(self, mock_run_tests):
+        """ Asserts the schema validation statistics are collected while profiling"""
+
+        job_runner_object = JobRunner(TEST_URL, "1.0.0")
+        job_runner_object.set_test_path([str(YAML_TEST_PATH_SUCCESS)])
+        job_runner_object.set_profile(True)
+        job_runner_object.run_jobs()
+
+        statistics = job_runner_object.profile_statistics["schema_validation"]
+        assert statistics["validations"] == 2
+        assert statistics["load_bytes"] > 0
+
+    @patch.object(TestRunner, 'run_tests')
+    def test_run_jobs_profile_output(self, mock_run_tests, tmp_path):
+        """ Asserts the stages are timed and the cProfile and collapsed stack files are written"""
+
+        job_runner_object = JobRunner(TEST_URL, "1.0.0")
+        job_runner_object.set_test_path([str(YAML_TEST_PATH_SUCCESS)])
+        job_runner_object.set_profile(False, str(tmp_path))
+        job_runner_object.run_jobs()
+
+        stages = job_runner_object.profile_statistics["stages"]
+        assert stages["yaml_load"]["calls"] == 2
+        assert stages["schema_validation"]["calls"] == 2
+        assert stages["template_expansion"]["calls"] == 1
+        assert (tmp_path / "profile.pstats").exists()
+        assert "template_expansion;yaml_load " in (tmp_path / "profile.collapsed").read_text()
+
+    @patch.object(TestRunner, 'run_tests')
+    def test_run_jobs_resume(self, mock_run_tests, tmp_path):
+        """ Asserts the test files finished in the checkpoint journal are not run again on resume"""
+
+        journal_file = str(tmp_path / "journal.ndjson")
+        job_runner_object = JobRunner(TEST_URL, "1.0.0")
+        job_runner_object.set_test_path([str(YAML_TEST_PATH_SUCCESS), str(YAML_TEST_PATH_SKIP)])
+        job_runner_object.set_checkpoint(journal_file)
+        job_runner_object.run_jobs()
+        run_count = mock_run_tests.call_count
+
+        resumed_job_runner = JobRunner(TEST_URL, "1.0.0")
+        resumed_job_runner.set_test_path([str(YAML_TEST_PATH_SUCCESS), str(YAML_TEST_PATH_SKIP)])
+        resumed_job_runner.set_checkpoint(journal_file, resume=True)
+        resumed_job_runner.run_jobs()
+
+        assert mock_run_tests.call_count == run_count
+        assert resumed_job_runner.test_status == job_runner_object.test_status
+        resumed_phases = json.loads(resumed_job_runner.generate_report())["phases"]
+        assert resumed_phases == json.loads(job_runner_object.generate_report())["phases"]
+
+    @patch.object(TestRunner, 'run_tests')
+    def test_run_jobs_discarded(self, mock_run_tests, tmp_path):
+        """ Asserts the test files not matching the version or tags are skipped by their indexed header, without
+        being loaded or opening a report phase"""
+
+        job_runner_object = JobRunner(TEST_URL, "1.0.0")
+        job_runner_object.discovery_index = DiscoveryIndex(str(tmp_path / "index.json"))
+        job_runner_object.set_test_path([str(YAML_TEST_PATH_SKIP), str(YAML_TEST_PATH_FIXTURE)])
+        job_runner_object.set_tags(["schema_validation_only"], [])
+        with patch.object(JobRunner, 'load_and_validate_yaml_data') as mock_load:
+            job_runner_object.run_jobs()
+        mock_load.assert_not_called()
+        mock_run_tests.assert_not_called()
+        assert job_runner_object.test_status["skipped"] == ["1", "2"]
+        assert job_runner_object.report.report.get_phases() == []
+        assert job_runner_object.discovery_index.get_statistics() == {"hits": 2, "misses": 2}
+
+    @patch.object(TestRunner, 'run_tests')
+    def test_run_jobs_plan(self, mock_run_tests, tmp_path):
+        """ Asserts a compiled test plan is run like its YAML files, without loading them again"""
+
+        test_path = [str(YAML_TEST_PATH_SUCCESS), str(YAML_TEST_PATH_INVALID), str(YAML_TEST_PATH_SKIP)]
+        job_runner_object = JobRunner(TEST_URL, "1.0.0")
+        job_runner_object.set_test_path(test_path)
+        plan = job_runner_object.compile_plan(str(tmp_path / "plan.bin"))
+        assert plan.get_files() == test_path
+        assert list(plan.templates) == ["unittests/data/templates/success_template.yml"]
+        job_runner_object.run_jobs()
+        run_count = mock_run_tests.call_count
+
+        plan_job_runner = JobRunner(TEST_URL, "1.0.0")
+        plan_job_runner.set_plan(str(tmp_path / "plan.bin"))
+        with patch.object(YamlLoader, "load") as mock_load:
+            plan_job_runner.run_jobs()
+        mock_load.assert_not_called()
+        assert mock_run_tests.call_count == 2 * run_count
+        assert plan_job_runner.test_status == job_runner_object.test_status
+
+    @patch.object(JobRunner, 'get_service_info', return_value={"id": "tes"})
+    @patch.object(TestRunner, 'run_tests')
+    def test_run_jobs_reuse_passed(self, mock_run_tests, mock_get_service_info, tmp_path):
+        """ Asserts an unchanged passed test file is restored from the result cache"""
+
+        job_runner_object = JobRunner(TEST_URL, "1.0.0")
+        job_runner_object.set_test_path([str(YAML_TEST_PATH_SUCCESS)])
+        job_runner_object.result_cache = ResultCache(str(tmp_path))
+        job_runner_object.run_jobs()
+        run_count = mock_run_tests.call_count
+
+        job_runner_object.run_jobs()
+        assert mock_run_tests.call_count == run_count
+        assert job_runner_object.result_cache.get_statistics()["hits"] == 1
+        assert job_runner_object.test_status["passed"] == ["1", "2"]
+
+        mock_get_service_info.return_value = {"id": "other"}
+        job_runner_object.run_jobs()
+        assert mock_run_tests.call_count == 2 * run_count
+
+    def test_run_job_graph(self):
+        """ Asserts the sub-jobs run concurrently along the job graph and the report tests keep the file order"""
+
+        jobs = [
+            {"name": "create_task", "operation": "POST", "storage_vars": {"id": "$response.id"}},
+            {"name": "create_task", "operation": "POST", "storage_vars": {"id": "$response.id"}},
+            {"name": "get_task", "operation": "GET", "path_parameters": {"id": "{id}"}}
+        ]
+        task_ids = iter(["first", "second"])
+
+        def run_tests(test_runner, job_data, report_test):
+            report_test.set_test_name(job_data["name"])
+            if job_data["name"] == "create_task":
+                test_runner.set_auxiliary_space("id", next(task_ids))
+            else:
+                assert test_runner.auxiliary_space == {"id": "first"}
+
+        job_runner_object = JobRunner(TEST_URL, "1.0.0")
+        job_runner_object.set_job_concurrency(2)
+        report_phase = Report().add_phase("test.yml", "description")
+        with patch.object(TestRunner, 'run_tests', autospec=True, side_effect=run_tests):
+            _, err = job_runner_object.run_job_graph("TES", jobs, report_phase)
+
+        assert err is None
+        assert [test.get_test_name() for test in report_phase.get_tests()] == ["create_task", "create_task",
+                                                                               "get_task"]
+
+    def test_run_job_graph_failure(self):
+        """ Asserts no further sub-job is started once a sub-job fails"""
+
+        jobs = [
+            {"name": "create_task", "operation": "POST", "storage_vars": {"id": "$response.id"}},
+            {"name": "get_task", "operation": "GET", "path_parameters": {"id": "{id}"}}
+        ]
+        job_runner_object = JobRunner(TEST_URL, "1.0.0")
+        job_runner_object.set_job_concurrency(2)
+        report_phase = Report().add_phase("test.yml", "description")
+        with patch.object(TestRunner, 'async_run_tests', side_effect=TestRunnerException("test", "test", "test")):
+            _, err = asyncio.run(job_runner_object.async_run_job_graph("TES", jobs, report_phase))
+
+        assert isinstance(err, TestRunnerException)
+        assert len(report_phase.get_tests()) == 1
+
+    def test_run_jobs_fixtures(self):
+        """ Asserts the fixtures are created once per run and their storage variables are handed to the test files"""
+
+        task_ids = iter(["first", "second"])
+
+        def run_tests(test_runner, job_data, report_test):
+            if job_data["name"] == "create_task":
+                test_runner.set_auxiliary_space("id", next(task_ids))
+            else:
+                assert test_runner.auxiliary_space["id"] == test_runner.auxiliary_space["id_1"]
+                assert test_runner.auxiliary_space["id"] in ["first", "second"]
+
+        job_runner_object = JobRunner(TEST_URL, "1.0.0")
+        job_runner_object.set_test_path(["unittests/data/fixture_tests"])
+        with patch.object(TestRunner, 'run_tests', autospec=True, side_effect=run_tests) as mock_run_tests:
+            job_runner_object.run_jobs()
+
+        assert mock_run_tests.call_count == 4
+        assert job_runner_object.test_status["passed"] == ["1", "2"]
+        assert job_runner_object.report.statistics["fixtures"] == {"created": 2, "failed": 0, "reused": 1}
+        phases = job_runner_object.report.report.get_phases()
+        assert [len(phase.get_tests()) for phase in phases] == [3, 1]
+        assert job_runner_object.prepared_data == {}
+
+    def test_run_jobs_fixtures_failure(self):
+        """ Asserts a failed fixture is reported by its first test file and fails all the test files declaring it"""
+
+        def run_tests(test_runner, job_data, report_test):
+            if job_data["name"] == "create_task":
+                raise TestFailureException("Fixture failure", "create_task failed", None)
+
+        job_runner_object = JobRunner(TEST_URL, "1.0.0")
+        job_runner_object.set_test_path(["unittests/data/fixture_tests"])
+        with patch.object(TestRunner, 'run_tests', autospec=True, side_effect=run_tests), \
+                patch.object(JobRunner, 'handle_test_failure', autospec=True,
+                             side_effect=JobRunner.handle_test_failure) as mock_handle_test_failure:
+            job_runner_object.run_jobs()
+
+        assert job_runner_object.test_status["failed"] == ["1", "2"]
+        assert all(isinstance(call.args[3], TestFailureException) for call in mock_handle_test_failure.call_args_list)
+        phases = job_runner_object.report.report.get_phases()
+        assert [len(phase.get_tests()) for phase in phases] == [1, 1]
+        assert [call.args[4] for call in mock_handle_test_failure.call_args_list] == \
+            [phases[0].get_tests()[0], phases[1].get_tests()[0]]
+        assert phases[1].get_tests()[0].get_test_name() == "fixture"
+
+    def test_declare_fixtures_concurrently(self):
+        """ Asserts the test files declaring the same fixture concurrently share its instances"""
+
+        job_runner_object = JobRunner(TEST_URL, "1.0.0")
+        job_runner_object.fixture_pool = MagicMock()
+        yaml_data = job_runner_object.load_and_validate_yaml_data(str(YAML_TEST_PATH_FIXTURE), "Test")
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            declared = list(executor.map(
+                lambda _: job_runner_object.declare_fixtures(YAML_TEST_PATH_FIXTURE, yaml_data), range(8)))
+
+        assert all(fixture_instances is declared[0] for fixture_instances in declared)
+        assert job_runner_object.fixture_pool.add.call_count == 2
+
+    def test_get_fixture_storage_vars(self):
+        """ Asserts the fixture storage variables are suffixed with the instance number and do not override"""
+
+        storage_vars = {"id": "test"}
+        JobRunner.get_fixture_storage_vars(1, {"id": "first"}, storage_vars)
+        JobRunner.get_fixture_storage_vars(2, {"id": "second"}, storage_vars)
+        assert storage_vars == {"id": "test", "id_1": "first", "id_2": "second"}
+
+    @patch.object(TestRunner, 'run_tests')
+    def test_run_jobs_parallel(self, mock_run_tests):
+        """ Asserts the parallel run keeps the report phases and test statuses in file order"""
+
+        job_runner_object = JobRunner(TEST_URL, "1.0.0")
+        job_runner_object.set_test_path(["unittests/data/run_job_tests"])
+        job_runner_object.set_workers(4)
+        job_runner_object.run_jobs()
+
+        yaml_files = sorted(Path("unittests/data/run_job_tests").glob("**/*.yml"))
+        phase_names = [phase.get_phase_name() for phase in job_runner_object.report.report.get_phases()]
+        assert job_runner_object.test_count == len(yaml_files)
+        assert phase_names == [str(yaml_file) for yaml_file in yaml_files
+                               if yaml_file not in [YAML_TEST_PATH_INVALID, YAML_TEST_PATH_SKIP]]
+        assert job_runner_object.test_status["failed"] == [str(yaml_files.index(YAML_TEST_PATH_INVALID) + 1)]
+        assert job_runner_object.test_status["skipped"] == [str(yaml_files.index(YAML_TEST_PATH_SKIP) + 1)]
+
+    @patch.object(TestRunner, 'async_run_tests')
+    def test_run_jobs_async(self, mock_async_run_tests):
+        """ Asserts the asynchronous run keeps the report phases and test statuses in file order"""
+
+        job_runner_object = JobRunner(TEST_URL, "1.0.0")
+        job_runner_object.set_test_path(["unittests/data/run_job_tests"])
+        job_runner_object.set_workers(2)
+        job_runner_object.set_async(True)
+        job_runner_object.run_jobs()
+
+        yaml_files = sorted(Path("unittests/data/run_job_tests").glob("**/*.yml"))
+        assert job_runner_object.test_count == len(yaml_files)
+        assert job_runner_object.test_status["skipped"] == [str(yaml_files.index(YAML_TEST_PATH_SKIP) + 1)]
+        assert mock_async_run_tests.call_count == 3
+
+    def test_run_async_live_status(self):
+        """ Asserts the finished test files are counted in the run metrics before all the test files finished"""
+
+        job_runner_object = JobRunner(TEST_URL, "1.0.0")
+        job_runner_object.set_workers(2)
+
+        async def async_execute_test(test_number, yaml_file, report_buffer):
+            if test_number == 1:
+                while job_runner_object.run_metrics.get_snapshot()["finished_tests"]["skipped"] == 0:
+                    await asyncio.sleep(0.01)
+                return "passed"
+            return "skipped"
+
+        with patch.object(job_runner_object, "async_execute_test", side_effect=async_execute_test):
+            asyncio.run(asyncio.wait_for(job_runner_object.run_async([YAML_TEST_PATH_SUCCESS, YAML_TEST_PATH_SKIP]),
+                                         timeout=5))
+
+        assert job_runner_object.run_metrics.get_snapshot()["finished_tests"] == {"passed": 1, "failed": 0,
+                                                                                  "skipped": 1}
+        assert job_runner_object.test_status == {"passed": ["1"], "failed": [], "skipped": ["2"]}
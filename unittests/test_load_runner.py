@@ -0,0 +1,94 @@
+"""Module unittests.test_load_runner.py
+
+This module is to test the Load Runner class and its methods
+"""
+
+import time
+from unittest.mock import patch
+
+import pytest
+
+from compliance_suite.exceptions.compliance_exception import (
+    JobValidationException,
+    TestFailureException
+)
+from compliance_suite.load_runner import LoadRunner
+from compliance_suite.test_runner import TestRunner
+from unittests.data.constants import TEST_URL
+
+
+class TestLoadRunner:
+
+    def test_run_closed_loop(self):
+        """ Asserts the scenario sub-jobs are replayed with the fixture storage variables and recorded per endpoint"""
+
+        def run_tests(test_runner, job_data, report_test):
+            if job_data["name"] == "create_task":
+                test_runner.set_auxiliary_space("id", "fixture")
+            else:
+                assert test_runner.auxiliary_space["id"] == "fixture"
+                test_runner.request_timings = [{"total": 0.5}, {"total": 0.25}]
+                time.sleep(0.01)
+
+        load_runner = LoadRunner(TEST_URL, "1.0.0")
+        load_runner.set_test_path(["unittests/data/fixture_tests/fixture_02.yml"])
+        load_runner.set_duration(0.05)
+        load_runner.set_concurrency(2)
+        with patch.object(TestRunner, 'run_tests', autospec=True, side_effect=run_tests):
+            summary = load_runner.run()
+        load_runner.generate_summary()
+
+        assert summary["iterations"] > 0
+        assert list(summary["endpoints"]) == ["GET /tasks/{id}"]
+        assert summary["endpoints"]["GET /tasks/{id}"]["requests"] == 2 * summary["iterations"]
+        assert summary["endpoints"]["GET /tasks/{id}"]["latency"]["p99"] == 0.5
+        assert summary["total"]["errors"] == 0
+        assert summary["overrun"] >= 0
+        assert summary["connections"] == {}
+
+    def test_run_closed_loop_error(self):
+        """ Asserts an unexpected exception of an iteration is raised once the workers stopped"""
+
+        load_runner = LoadRunner(TEST_URL, "1.0.0")
+        load_runner.set_test_path(["unittests/data/run_job_tests/success_01.yml"])
+        load_runner.set_duration(0.05)
+        with patch.object(TestRunner, 'run_tests', side_effect=KeyError("id")), pytest.raises(KeyError):
+            load_runner.run()
+        assert load_runner.job_runner.session_pool.sessions == {}
+
+    def test_record_job(self):
+        """ Asserts only the last HTTP exchange of a failed sub-job is an error"""
+
+        load_runner = LoadRunner(TEST_URL, "1.0.0")
+        test_runner = TestRunner("TES", TEST_URL, "1.0.0")
+        test_runner.request_timings = [{"total": 0.1}, {"total": 0.2}, {"total": 0.3}]
+        load_runner.record_job("GET /tasks/{id}", test_runner, time.perf_counter(), False)
+        test_runner.request_timings = []
+        load_runner.record_job("GET /tasks/{id}", test_runner, time.perf_counter(), True)
+
+        summary = load_runner.statistics.get_summary(1.0)
+        assert summary["endpoints"]["GET /tasks/{id}"]["requests"] == 3
+        assert summary["endpoints"]["GET /tasks/{id}"]["errors"] == 1
+        assert summary["endpoints"]["GET /tasks/{id}"]["latency"]["p50"] == 0.2
+
+    @patch.object(TestRunner, 'run_tests', side_effect=TestFailureException("test", "test", "test"))
+    def test_run_open_loop(self, mock_run_tests):
+        """ Asserts the iterations are started at the target rate and the failed sub-jobs are counted as errors"""
+
+        load_runner = LoadRunner(TEST_URL, "1.0.0")
+        load_runner.set_test_path(["unittests/data/run_job_tests/success_01.yml"])
+        load_runner.set_duration(0.2)
+        load_runner.set_rate(50)
+        summary = load_runner.run()
+
+        assert summary["iterations"] + summary["dropped"] == 10
+        assert summary["endpoints"]["GET /service-info"]["error_rate"] == 1.0
+        assert "GET /tasks" not in summary["endpoints"]
+
+    def test_run_no_scenario(self):
+        """ Asserts the load run fails before generating load if no test file is selected"""
+
+        load_runner = LoadRunner(TEST_URL, "1.0.0")
+        load_runner.set_test_path(["unittests/data/run_job_tests/skip_01.yml"])
+        with pytest.raises(JobValidationException):
+            load_runner.run()
@@ -0,0 +1,60 @@
+"""Module unittests.test_metrics_server.py
+
+This module is to test the Metrics Server class and its methods
+"""
+
+from urllib.request import urlopen
+
+from compliance_suite.job_runner import JobRunner
+from compliance_suite.metrics_server import (
+    format_labels,
+    MetricsServer
+)
+from unittests.data.constants import TEST_URL
+
+
+class TestMetricsServer:
+
+    def test_format_labels(self):
+        """Asserts the label values are escaped"""
+
+        assert format_labels({}) == ""
+        assert format_labels({"endpoint": 'a"b\\c', "le": "1"}) == '{endpoint="a\\"b\\\\c",le="1"}'
+
+    def test_render(self):
+        """Asserts the test statuses, run metrics and request latency histograms are rendered"""
+
+        job_runner = JobRunner(TEST_URL, "1.0.0")
+        job_runner.run_metrics.add_finished_test("passed")
+        job_runner.run_metrics.add_finished_test("passed")
+        job_runner.run_metrics.start_poll()
+        job_runner.run_metrics.add_poll_retries(3)
+        job_runner.run_metrics.add_response_bytes("GET /tasks/{id}", 512)
+        job_runner.request_statistics.record("GET /tasks/{id}", 0.02)
+        job_runner.request_statistics.record("GET /tasks/{id}", 0.2)
+
+        metrics = MetricsServer(job_runner).render()
+        server = f'server="{TEST_URL}"'
+        assert f'openapi_test_runner_tests_total{{{server},status="passed"}} 2' in metrics
+        assert f'openapi_test_runner_tests_total{{{server},status="failed"}} 0' in metrics
+        assert f'openapi_test_runner_polls_in_flight{{{server}}} 1' in metrics
+        assert f'openapi_test_runner_poll_retries_total{{{server}}} 3' in metrics
+        assert f'openapi_test_runner_response_bytes_total{{{server},endpoint="GET /tasks/{{id}}"}} 512' in metrics
+        endpoint = f'{server},endpoint="GET /tasks/{{id}}"'
+        assert f'openapi_test_runner_request_duration_seconds_bucket{{{endpoint},le="0.025"}} 1' in metrics
+        assert f'openapi_test_runner_request_duration_seconds_bucket{{{endpoint},le="+Inf"}} 2' in metrics
+        assert f'openapi_test_runner_request_duration_seconds_count{{{endpoint}}} 2' in metrics
+
+    def test_start(self):
+        """Asserts the metrics are served at /metrics until the server is stopped"""
+
+        metrics_server = MetricsServer(JobRunner(TEST_URL, "1.0.0"))
+        metrics_server.start(0)
+        try:
+            port = metrics_server.local_server.server_address[1]
+            with urlopen(f"http://localhost:{port}/metrics") as response:
+                assert response.status == 200
+                assert b"openapi_test_runner_tests_total" in response.read()
+        finally:
+            metrics_server.stop()
+        assert metrics_server.local_server is None
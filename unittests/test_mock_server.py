@@ -0,0 +1,95 @@
+"""Module unittests.test_mock_server.py
+
+This module is to test the Mock Server class and its methods
+"""
+
+import http.client
+import json
+import statistics
+import time
+from urllib.error import HTTPError
+from urllib.request import (
+    Request,
+    urlopen
+)
+
+from compliance_suite.mock_server import MockServer
+
+TASK = {"name": "CompTest", "executors": [{"image": "alpine", "command": ["echo", "hello"]}]}
+
+
+class TestMockServer:
+
+    def test_handle_endpoints(self):
+        """Asserts the TES endpoints are answered under any base path"""
+
+        mock_server = MockServer("1.1.0")
+        status, service_info = mock_server.handle("GET", "/ga4gh/tes/v1/service-info", b"")
+        assert status == 200 and service_info["type"]["version"] == "1.1.0"
+        assert service_info["tesResources_backend_parameters"] == ["VmSize"]
+
+        status, response = mock_server.handle("POST", "/v1/tasks", json.dumps(TASK).encode())
+        assert status == 200
+        task_id = response["id"]
+        assert mock_server.handle("GET", f"/ga4gh/tes/v1/tasks/{task_id}?view=MINIMAL", b"")[1]["id"] == task_id
+        assert mock_server.handle("GET", "/ga4gh/tes/v1/tasks?view=BASIC&page_size=1", b"")[1]["tasks"][0]["id"] \
+            == task_id
+        assert mock_server.handle("POST", f"/ga4gh/tes/v1/tasks/{task_id}:cancel", b"") == (200, {})
+        assert mock_server.handle("POST", "/ga4gh/tes/v1/tasks", b"{invalid")[0] == 400
+        assert mock_server.handle("GET", "/ga4gh/tes/v1/unknown", b"")[0] == 404
+        assert "tesResources_backend_parameters" not in MockServer("1.0.0").get_service_info()
+
+    def test_error_injection(self):
+        """Asserts the injected errors are reproducible for a seed"""
+
+        mock_server = MockServer("1.1.0")
+        mock_server.set_error_injection(0.5, 503, seed=1)
+        first_run = [mock_server.handle("GET", "/v1/service-info", b"")[0] for _ in range(20)]
+        mock_server.set_error_injection(0.5, 503, seed=1)
+        assert [mock_server.handle("GET", "/v1/service-info", b"")[0] for _ in range(20)] == first_run
+        assert set(first_run) == {200, 503}
+
+    def test_serve_http(self):
+        """Asserts the endpoints are served over HTTP with the configured latency"""
+
+        mock_server = MockServer("1.0.0")
+        mock_server.set_latency(0.01)
+        mock_server.set_task_count(3)
+        mock_server.start(0)
+        url = f"http://localhost:{mock_server.local_server.server_address[1]}/ga4gh/tes/v1"
+        try:
+            with urlopen(f"{url}/tasks?view=FULL") as response:
+                assert len(json.loads(response.read())["tasks"]) == 3
+            request = Request(f"{url}/tasks", data=json.dumps(TASK).encode(), method="POST",
+                              headers={"Content-Type": "application/json"})
+            with urlopen(request) as response:
+                assert "id" in json.loads(response.read())
+            try:
+                urlopen(f"{url}/tasks/unknown")
+                assert False
+            except HTTPError as err:
+                assert err.code == 404
+        finally:
+            mock_server.stop()
+        assert mock_server.local_server is None
+
+    def test_keep_alive_latency(self):
+        """Asserts the requests on a kept-alive connection are not delayed without a configured latency"""
+
+        mock_server = MockServer("1.1.0")
+        mock_server.start(0)
+        connection = http.client.HTTPConnection("127.0.0.1", mock_server.local_server.server_address[1])
+        timings = []
+        try:
+            for _ in range(10):
+                start_time = time.perf_counter()
+                connection.request("GET", "/ga4gh/tes/v1/service-info")
+                response = connection.getresponse()
+                response.read()
+                timings.append(time.perf_counter() - start_time)
+                assert response.status == 200
+        finally:
+            connection.close()
+            mock_server.stop()
+        # Nagle's algorithm with the delayed acknowledgement of the client would add about 40ms per request
+        assert statistics.median(timings[1:]) < 0.02
@@ -3,11 +3,14 @@
 This module is to test the Test Runner class and its methods
 """
 
+import asyncio
+import json
 from unittest.mock import (
     MagicMock,
     patch
 )
 
+from ga4gh.testbed.report.test import Test
 import pytest
 
 from compliance_suite.exceptions.compliance_exception import (
@@ -15,6 +18,7 @@ from compliance_suite.exceptions.compliance_exception import (
     TestFailureException
 )
 from compliance_suite.functions.client import Client
+from compliance_suite.functions.load_statistics import LoadStatistics
 from compliance_suite.test_runner import TestRunner
 from unittests.data.constants import (
     TEST_SERVICE,
@@ -169,6 +173,125 @@ class TestTestRunner:
         with pytest.raises(TestFailureException):
             test_runner.validate_response(resp)
 
+    def test_validate_streamed_response(self):
+        """ Asserts a streamed list response is validated task by task, and the filters and storage variables read the
+        looked up tasks"""
+
+        test_runner = TestRunner(TEST_SERVICE, TEST_URL, "1.1.0")
+        test_runner.set_stream_responses(True)
+        test_runner.report_test = MagicMock()
+        test_runner.set_job_data({
+            "name": "list_tasks",
+            "operation": "GET",
+            "endpoint": "/tasks",
+            "query_parameters": [{"view": "MINIMAL"}],
+            "filter": [{"path": "$response.tasks", "type": "array", "size": 3},
+                       {"path": "$response.tasks[-1].id", "type": "string", "value": "task-3"}],
+            "storage_vars": {"id": "$response.tasks[0].id", "next_page_token": "$response.next_page_token"},
+            "response": {"200": ""}
+        })
+        tasks = [{"id": f"task-{index}", "state": "COMPLETE"} for index in range(1, 4)]
+        response = MagicMock(status_code=200)
+        response.iter_content.return_value = iter([b'{"tasks": ', json.dumps(tasks).encode(),
+                                                   b', "next_page_token": "2"}'])
+
+        assert test_runner.is_streamed()
+        test_runner.validate_response(response)
+        response.close.assert_called_once()
+        assert test_runner.auxiliary_space == {"id": "task-1", "next_page_token": "2"}
+
+        tasks[1]["state"] = "INVALID"
+        response.iter_content.return_value = iter([json.dumps({"tasks": tasks}).encode()])
+        with pytest.raises(TestFailureException) as err:
+            test_runner.validate_response(response)
+        assert "tasks -> 1 -> state" in str(err.value.details)
+
+        response.iter_content.return_value = iter([json.dumps({"tasks": [tasks[0], 1]}).encode()])
+        with pytest.raises(TestFailureException) as err:
+            test_runner.validate_response(response)
+        assert "tasks -> 1\n  value is not a valid dict" in str(err.value.details)
+
+    def test_validate_streamed_response_timing(self):
+        """ Asserts a streamed response is closed even if its status code does not match, and its timing is recorded
+        after its body is read"""
+
+        test_runner = TestRunner(TEST_SERVICE, TEST_URL, "1.1.0")
+        test_runner.set_stream_responses(True)
+        test_runner.report_test = MagicMock()
+        request_statistics = LoadStatistics()
+        test_runner.set_request_statistics(request_statistics)
+        test_runner.set_job_data({
+            "name": "list_tasks",
+            "operation": "GET",
+            "endpoint": "/tasks",
+            "query_parameters": [{"view": "MINIMAL"}],
+            "response": {"200": ""}
+        })
+        body = json.dumps({"tasks": [{"id": "task-1", "state": "COMPLETE"}]}).encode()
+        client = MagicMock(timings=[{"url": TEST_URL, "connect": 0.0, "ttfb": 0.1, "total": 0.1, "bytes": 0}])
+
+        response = MagicMock(status_code=500)
+        test_runner.record_request_timings(client)
+        assert request_statistics.get_summary(1)["endpoints"] == {}
+        with pytest.raises(TestFailureException):
+            test_runner.validate_response(response)
+        response.close.assert_called_once()
+        response.iter_content.assert_not_called()
+
+        response = MagicMock(status_code=200)
+        response.iter_content.return_value = iter([body[:10], body[10:]])
+        client.timings = [{"url": TEST_URL, "connect": 0.0, "ttfb": 0.1, "total": 0.1, "bytes": 0}]
+        test_runner.record_request_timings(client)
+        test_runner.validate_response(response)
+        response.close.assert_called_once()
+        assert test_runner.request_timings[-1]["total"] > 0.1
+        assert test_runner.request_timings[-1]["bytes"] == len(body)
+        assert request_statistics.get_summary(1)["endpoints"]["GET /tasks"]["requests"] == 2
+        assert test_runner.run_metrics.get_snapshot()["response_bytes"] == {"GET /tasks": len(body)}
+
+    def test_is_streamed_whole_array(self, default_test_runner):
+        """ Asserts a response is not streamed if a storage variable stores the whole array"""
+
+        default_test_runner.set_stream_responses(True)
+        default_test_runner.job_data.update({"name": "list_tasks", "operation": "GET",
+                                             "query_parameters": [{"view": "FULL"}]})
+        assert default_test_runner.is_streamed()
+        default_test_runner.job_data["storage_vars"] = {"tasks": "$response.tasks"}
+        assert not default_test_runner.is_streamed()
+
+    def test_attach_request_timings(self):
+        """ Asserts the timing of the job requests is recorded per endpoint and attached to the status code case"""
+
+        test_runner = TestRunner(TEST_SERVICE, TEST_URL, "1.0.0")
+        test_runner.set_job_data(
+            {
+                "name": "test",
+                "operation": "GET",
+                "endpoint": "/tasks/{id}",
+                "polling": {"interval": 10, "timeout": 10},
+                "response": {"400": ""}
+            }
+        )
+        test_runner.report_test = Test()
+        request_statistics = LoadStatistics()
+        test_runner.set_request_statistics(request_statistics)
+        client = Client()
+        client.timings = [{"url": "test", "connect": 0.1, "ttfb": 0.2, "total": 0.4, "bytes": 10},
+                          {"url": "test", "connect": 0.0, "ttfb": 0.1, "total": 0.2, "bytes": 10}]
+
+        test_runner.record_request_timings(client)
+        test_runner.validate_response(MagicMock(status_code=400))
+
+        case = test_runner.report_test.get_cases()[0]
+        assert case.metadata == {"request": client.timings[-1], "poll_iterations": 2}
+        assert request_statistics.get_summary(1)["endpoints"]["GET /tasks/{id}"]["requests"] == 2
+        assert test_runner.run_metrics.get_snapshot() == {
+            "finished_tests": {"passed": 0, "failed": 0, "skipped": 0},
+            "polls_in_flight": 0,
+            "poll_retries": 1,
+            "response_bytes": {"GET /tasks/{id}": 20}
+        }
+
     @patch.object(Client, "poll_request")
     @patch.object(TestRunner, "validate_response")
     def test_run_jobs_get_task(self, mock_validate_response, mock_client):
@@ -217,6 +340,65 @@ class TestTestRunner:
         }
         assert test_runner.run_tests(job_data, MagicMock()) is None
 
+    @patch.object(Client, "async_poll_request")
+    @patch.object(TestRunner, "validate_response")
+    def test_async_run_jobs_get_task(self, mock_validate_response, mock_client):
+        """Assert the asynchronous run job method for get task to poll with the transformed parameters"""
+
+        mock_validate_response.return_value = {}
+        mock_client.return_value = MagicMock()
+
+        test_runner = TestRunner(TEST_SERVICE, TEST_URL, "1.0.0")
+        job_data = {
+            "name": "get_task",
+            "description": "test",
+            "operation": "GET",
+            "endpoint": "/tasks/{id}",
+            "path_parameters": {"id": "{id}"},
+            "query_parameters": [{"view": "BASIC"}],
+            "polling": {"interval": 10, "timeout": 10}
+        }
+        test_runner.set_auxiliary_space("id", "1234")
+        assert asyncio.run(test_runner.async_run_tests(job_data, MagicMock())) is None
+        assert mock_client.call_args.kwargs["path_params"] == {"id": "1234"}
+        assert mock_client.call_args.kwargs["check_cancel_val"] is False
+
+    @patch.object(Client, "poll_request")
+    @patch.object(TestRunner, "validate_response")
+    def test_run_jobs_adaptive_polling(self, mock_validate_response, mock_client):
+        """Assert the completion time of an adaptive polling job is recorded for the created task type"""
+
+        mock_validate_response.return_value = {}
+        polling_history = MagicMock()
+        polling_history.get_expected_duration.return_value = None
+
+        test_runner = TestRunner(TEST_SERVICE, TEST_URL, "1.0.0")
+        test_runner.set_polling_history(polling_history)
+        test_runner.task_type = "digest"
+        job_data = {
+            "name": "get_task",
+            "description": "test",
+            "operation": "GET",
+            "endpoint": "/tasks/{id}",
+            "polling": {"interval": 10, "timeout": 10, "strategy": "adaptive"}
+        }
+        test_runner.run_tests(job_data, MagicMock())
+
+        assert mock_client.call_args.kwargs["polling_strategy"].next_interval() <= 10
+        polling_history.get_expected_duration.assert_called_once_with("digest:complete")
+        assert polling_history.record.call_args[0][0] == "digest:complete"
+
+    def test_get_client_session_pool(self):
+        """Assert the client reuses the pooled session of the server"""
+
+        session_pool = MagicMock()
+        test_runner = TestRunner(TEST_SERVICE, TEST_URL, "1.0.0")
+        assert test_runner.get_client().session is not session_pool.get_session.return_value
+
+        test_runner.set_session_pool(session_pool)
+        assert test_runner.get_client().session is session_pool.get_session.return_value
+        session_pool.get_session.assert_called_with(TEST_URL)
+
     def test_validate_filters_string_success(self, default_test_runner):
         """Assert validate filters to be successful for string type"""
 
@@ -336,6 +518,19 @@ class TestTestRunner:
         with pytest.raises(JobValidationException):
             default_test_runner.validate_filters(json_data)
 
+    def test_save_storage_vars(self, default_test_runner):
+        """Assert the storage vars are saved from the response paths and absent paths are not saved"""
+
+        default_test_runner.job_data["storage_vars"] = {
+            "id": "$response.tasks[0].id",
+            "next_page_token": "$response.next_page_token"
+        }
+        default_test_runner.save_storage_vars({"tasks": [{"id": "123"}]})
+        assert default_test_runner.auxiliary_space == {"id": "123"}
+
+        default_test_runner.save_storage_vars({"tasks": [{"id": "456"}], "next_page_token": "token"})
+        assert default_test_runner.auxiliary_space == {"id": "123", "next_page_token": "token"}
+
     def test_transform_path_parameters_success(self, default_test_runner):
         """Assert transform_path_parameters to be successful"""
 
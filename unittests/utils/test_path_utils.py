@@ -0,0 +1,44 @@
+"""Module unittests.utils.test_path_utils.py
+
+This module is to test the path utility functions
+"""
+
+import pytest
+
+from compliance_suite.exceptions.compliance_exception import JobValidationException
+from compliance_suite.utils.path_utils import (
+    compile_path,
+    get_path_value,
+    PATH_NOT_FOUND
+)
+
+
+class TestPathUtils:
+
+    def test_compile_path(self):
+        """Test the compile_path function parses the keys and indices once"""
+
+        compile_path.cache_clear()
+        assert compile_path("$response.tasks[0].logs[-1]['end-time']") == ("tasks", 0, "logs", -1, "end-time")
+        compile_path("$response.tasks[0].logs[-1]['end-time']")
+        assert compile_path.cache_info().hits == 1
+        assert compile_path("$response") == ()
+
+    @pytest.mark.parametrize("path", ["response..id", "$response.tasks[x]", ".id"])
+    def test_compile_path_invalid(self, path):
+        """Test the compile_path function for paths not in dot notation"""
+
+        with pytest.raises(JobValidationException):
+            compile_path(path)
+
+    def test_get_path_value(self):
+        """Test the get_path_value function for present and absent paths"""
+
+        data = {"tasks": [{"id": "123", "tags": {"key": "value"}}], "next_page_token": None}
+
+        assert get_path_value(data, "$response.tasks[0].id") == "123"
+        assert get_path_value(data, "$response.tasks[-1].tags") == {"key": "value"}
+        assert get_path_value(data, "$response.next_page_token") is None
+        assert get_path_value(data, "$response.tasks[1].id") is PATH_NOT_FOUND
+        assert get_path_value(data, "$response.tasks.id") is PATH_NOT_FOUND
+        assert get_path_value(data, "$response.id", default="") == ""
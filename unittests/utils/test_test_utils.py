@@ -4,6 +4,7 @@ This module is to test the TestUtils class and its methods
 """
 
 from compliance_suite.utils.test_utils import (
+    instantiate_template,
     replace_string,
     tag_matcher
 )
@@ -35,3 +36,31 @@ class TestTestUtils:
 
         data = replace_string(data, "item2", "item5")
         assert data[1][1] == "item5"
+
+    def test_instantiate_template(self):
+        """Tests the instantiate_template function replaces the placeholders in a copy of the template data"""
+
+        template = [
+            {
+                "name": "{name}",
+                "query_parameters": [{"view": "{view}"}],
+                "response": {"200": {}}
+            }
+        ]
+
+        data = instantiate_template(template, {"name": "get_task", "view": 1})
+        assert data == [{"name": "get_task", "query_parameters": [{"view": 1}], "response": {"200": {}}}]
+        assert template[0]["name"] == "{name}"
+        assert data[0]["response"] is not template[0]["response"]
+
+    def test_instantiate_template_sequential_args(self):
+        """Tests an argument value equal to the placeholder of a later argument is replaced, as with replace_string"""
+
+        template = ["{name}", "{view}", {"state": "{state}"}]
+        args = {"name": "{view}", "view": "MINIMAL", "state": "{name}"}
+
+        expected = template.copy()
+        expected[2] = dict(template[2])
+        for key, value in args.items():
+            expected = replace_string(expected, f"{{{key}}}", value)
+        assert instantiate_template(template, args) == expected == ["MINIMAL", "MINIMAL", {"state": "{name}"}]